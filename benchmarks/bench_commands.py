@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Command resolution benchmark
+
+Compares the trie-based command resolver with the previous path, which
+rebuilt the typo table and scanned every command name on each input,
+and times edit-distance suggestions for misspelled commands.
+"""
+
+import argparse
+
+try:
+    from benchmarks.common import headless_game, print_header, print_rate, timed
+except ImportError:
+    from common import headless_game, print_header, print_rate, timed  # type: ignore
+
+from computerquest.commands import TYPO_CORRECTIONS
+from computerquest.utils.helpers import prefix_match
+
+# Exact names, aliases, typos, unique and ambiguous prefixes, unknown words
+WORDS = ['look', 'n', 'inv', 'quar', 'lok', 'mo', 'advsc', 'xyzzy', 'southwest', 'ach']
+
+def legacy_resolve(processor, word):
+    """Resolve a word the way CommandProcessor.process used to"""
+    typo_corrections = dict(TYPO_CORRECTIONS)
+    word = typo_corrections.get(word, word)
+    if len(word) < 2:
+        return word
+    return prefix_match(word, list(processor.commands.keys()))
+
+def run(lookups):
+    """Run the command resolution benchmark"""
+    processor = headless_game().command_processor
+    state = {'step': 0}
+
+    def legacy():
+        legacy_resolve(processor, WORDS[state['step'] % len(WORDS)])
+        state['step'] += 1
+
+    def trie():
+        processor.resolve_command(WORDS[state['step'] % len(WORDS)])
+        state['step'] += 1
+
+    print_header(f"Command resolution ({lookups} lookups)")
+    old = print_rate("typo table + linear prefix scan", lookups, timed(legacy, lookups))
+    new = print_rate("command trie", lookups, timed(trie, lookups))
+    print(f"\n  Trie speedup: {new / old:.1f}x")
+
+    misspelled = ['lokk', 'quarantne', 'inventry', 'achievments', 'motherbord']
+    fuzzy_lookups = max(1, lookups // 10)
+
+    def fuzzy():
+        processor.suggest_commands(misspelled[state['step'] % len(misspelled)])
+        state['step'] += 1
+
+    print_header(f"Did-you-mean suggestions ({fuzzy_lookups} lookups)")
+    rate = print_rate("BK-tree suggestion", fuzzy_lookups, timed(fuzzy, fuzzy_lookups))
+    print(f"\n  Mean latency: {1000000 / rate:.0f} us")
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="KodeKloud Computer Quest command benchmark")
+    parser.add_argument("--lookups", type=int, default=100000, help="Number of words to resolve")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    run(parse_args().lookups)
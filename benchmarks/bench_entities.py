@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Entity engine benchmark
+
+Spawns agents of every kind across a generated world and times ticks of
+the entity engine against ENTITY_TICK_BUDGET_MS.
+"""
+
+import argparse
+import random
+import time
+
+try:
+    from benchmarks.common import print_header, print_rate, timed
+except ImportError:
+    from common import print_header, print_rate, timed  # type: ignore
+
+from computerquest.config import ENTITY_KINDS, ENTITY_TICK_BUDGET_MS
+from computerquest.mechanics import entities
+from computerquest.mechanics.entities import EntityEngine
+from computerquest.world.generator import GeneratedArchitecture, spec_for_size
+
+def run(components, agents, ticks, seed):
+    """Run the entity engine benchmark"""
+    world = GeneratedArchitecture(spec_for_size(components, seed=seed))
+    world.setup()
+    engine = EntityEngine(world, seed=seed)
+
+    backend = "NumPy" if entities.np is not None else "pure Python"
+    print_header(f"Entity engine: {agents:,} agents, {len(world.rooms):,} components ({backend})")
+    rng = random.Random(seed)
+    keys = list(world.rooms)
+    start = time.perf_counter()
+    per_spawn = max(1, agents // 1000)
+    for i in range(0, agents, per_spawn):
+        engine.spawn(rng.choice(list(ENTITY_KINDS)), rng.choice(keys), min(per_spawn, agents - i))
+    print(f"  {'spawn':<40} {(time.perf_counter() - start) * 1000:>12,.1f} ms")
+
+    elapsed = timed(engine.tick, ticks)
+    print_rate("tick", ticks, elapsed)
+    per_tick = elapsed / ticks * 1000
+    print(f"  {'per tick':<40} {per_tick:>12,.2f} ms")
+    print_rate("agent moves considered", agents * ticks, elapsed)
+    print("\n  " + (f"Within the {ENTITY_TICK_BUDGET_MS} ms budget" if per_tick < ENTITY_TICK_BUDGET_MS
+                    else f"OVER the {ENTITY_TICK_BUDGET_MS} ms budget"))
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="KodeKloud Computer Quest entity engine benchmark")
+    parser.add_argument("--components", type=int, default=10000, help="Approximate world size")
+    parser.add_argument("--agents", type=int, default=100000, help="Number of agents")
+    parser.add_argument("--ticks", type=int, default=20, help="Number of ticks to time")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for placement and movement")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    args = parse_args()
+    run(args.components, args.agents, args.ticks, args.seed)
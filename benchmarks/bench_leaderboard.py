@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Leaderboard benchmark
+
+Fills a temporary leaderboard through the background writer and times the
+top-k queries overall, per world and per cohort against
+LEADERBOARD_QUERY_BUDGET_MS.
+"""
+
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+
+try:
+    from benchmarks.common import print_header, print_rate, timed
+except ImportError:
+    from common import print_header, print_rate, timed  # type: ignore
+
+from computerquest.config import LEADERBOARD_QUERY_BUDGET_MS, LEADERBOARD_SIZE
+from computerquest.mechanics.leaderboard import Leaderboard, Run
+
+WORLDS = ("default", "numa_server", "laptop_soc", "pi_board", "generated")
+
+def random_runs(count, seed=0):
+    """Finished runs spread over the world packs and a year of weekly cohorts"""
+    rng = random.Random(seed)
+    for _ in range(count):
+        world = rng.choice(WORLDS)
+        yield Run("bench", rng.randint(0, 3000), rng.randint(20, 400), rng.randint(0, 14), world,
+                  rng.randint(0, 1000) if world == "generated" else None, rng.uniform(60, 3600),
+                  f"2026-W{rng.randint(1, 52):02d}", 1767225600.0 + rng.uniform(0, 31536000))
+
+def run(rows, k, repeat):
+    """Run the leaderboard benchmark"""
+    print_header(f"Leaderboard ({rows:,} runs, top {k})")
+    root = tempfile.mkdtemp()
+    try:
+        board = Leaderboard(os.path.join(root, "leaderboard.db"))
+
+        # Recording only queues the run; the writer thread does the inserts
+        start = time.perf_counter()
+        for finished in random_runs(rows):
+            board.record(finished)
+        print_rate("runs queued", rows, time.perf_counter() - start)
+        board.flush()
+        print_rate("runs written", rows, time.perf_counter() - start)
+
+        queries = [
+            ("top-k overall", {}),
+            ("top-k per world", {"world": "pi_board"}),
+            ("top-k per cohort", {"cohort": "2026-W42"}),
+        ]
+        for label, filters in queries:
+            board.top(k, **filters)  # Warm the page cache
+            elapsed = timed(lambda: board.top(k, **filters), repeat)
+            print_rate(label, repeat, elapsed)
+            per_query = elapsed / repeat * 1000
+            status = "OK" if per_query <= LEADERBOARD_QUERY_BUDGET_MS else "OVER BUDGET"
+            print(f"  {'  per query':<40} {per_query:>12.3f} ms  ({status}, budget {LEADERBOARD_QUERY_BUDGET_MS} ms)")
+        board.close()
+    finally:
+        shutil.rmtree(root)
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="KodeKloud Computer Quest leaderboard benchmark")
+    parser.add_argument("--rows", type=int, default=1000000, help="Number of finished runs to store")
+    parser.add_argument("--k", type=int, default=LEADERBOARD_SIZE, help="Runs per query")
+    parser.add_argument("--repeat", type=int, default=1000, help="Queries of each kind to time")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    args = parse_args()
+    run(args.rows, args.k, args.repeat)
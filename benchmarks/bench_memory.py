@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark
+
+Uses tracemalloc to measure the bytes held per component, per generated
+world component and per game, for sizing in-process hosting of many
+games and stress-scale worlds.
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+try:
+    from benchmarks.common import headless_game, print_header
+except ImportError:
+    from common import headless_game, print_header  # type: ignore
+
+from computerquest.models.component import Component
+from computerquest.world.generator import GeneratedArchitecture, component_count, spec_for_size
+
+def traced(build):
+    """
+    Call build() under tracemalloc
+
+    Returns:
+        tuple: (result, bytes still allocated by the call)
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return result, allocated
+
+def print_bytes(label, total, count):
+    """Print a bytes-per-object line"""
+    print(f"  {label:<40} {total / count:>12,.0f} bytes  ({count:,} measured)")
+
+def bare_components(count):
+    """A ring of components with specs set, as the world builders make them"""
+    rooms = [Component(f"Component {i}", "", True, f"C{i}") for i in range(count)]
+    for i, room in enumerate(rooms):
+        room.set_specs(1, ["binary"], 5, 5, 5)
+        room.connect_to(rooms[i - 1], 'w')
+        room.connect_to(rooms[(i + 1) % count], 'e')
+    return rooms
+
+def run(components, world_size, games):
+    """Run the memory benchmark"""
+    print_header("Memory per object")
+    _, total = traced(lambda: bare_components(components))
+    print_bytes("component, two doors", total, components)
+
+    spec = spec_for_size(world_size)
+
+    def build_world():
+        world = GeneratedArchitecture(spec)
+        world.setup()
+        return world
+
+    # Build once first so loaded data and text stores are not counted
+    build_world()
+    world, total = traced(build_world)
+    print_bytes("generated world, per component", total, component_count(spec))
+
+    headless_game()
+    _, total = traced(lambda: [headless_game() for _ in range(games)])
+    print_bytes("game, built-in world", total, games)
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="KodeKloud Computer Quest memory benchmark")
+    parser.add_argument("--components", type=int, default=20000, help="Number of bare components")
+    parser.add_argument("--world-size", type=int, default=20000, help="Approximate generated world size")
+    parser.add_argument("--games", type=int, default=200, help="Number of games to host at once")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    args = parse_args()
+    run(args.components, args.world_size, args.games)
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Headless move throughput benchmark
+
+Compares moving back and forth when results are discarded (as bots,
+replays and graders do) against moving and rendering every result.
+"""
+
+import argparse
+
+try:
+    from benchmarks.common import headless_game, print_header, print_rate, timed
+except ImportError:
+    from common import headless_game, print_header, print_rate, timed  # type: ignore
+
+def run(moves):
+    """Run the move benchmark"""
+    game = headless_game()
+    route = ['n', 's']  # cpu_package <-> core1
+
+    state = {'step': 0}
+
+    def move_discard():
+        game.move(route[state['step'] % 2])
+        state['step'] += 1
+
+    def move_render():
+        str(game.move(route[state['step'] % 2]))
+        state['step'] += 1
+
+    print_header(f"Move throughput ({moves} moves)")
+    lazy = print_rate("move, result discarded", moves, timed(move_discard, moves))
+    eager = print_rate("move, result rendered", moves, timed(move_render, moves))
+    print(f"\n  Headless speedup: {lazy / eager:.1f}x")
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="KodeKloud Computer Quest move benchmark")
+    parser.add_argument("--moves", type=int, default=20000, help="Number of moves to time")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    run(parse_args().moves)
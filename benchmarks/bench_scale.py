@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Stress-scale world benchmark
+
+Generates a large machine with the procedural world generator and times
+building it, starting a game in it, moving and rendering, updating
+progress, graph distance queries, and saving and loading it through the
+snapshot cache.
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+try:
+    from benchmarks.common import headless_game, print_header, print_rate, timed
+except ImportError:
+    from common import headless_game, print_header, print_rate, timed  # type: ignore
+
+from computerquest.config import CACHE_DIR_ENV
+from computerquest.world.generator import GeneratedArchitecture, component_count, generate_world_data, spec_for_size
+
+def print_time(label, elapsed):
+    """Print a one-off duration line"""
+    print(f"  {label:<40} {elapsed * 1000:>12,.1f} ms")
+
+def run(components, moves, updates, seed):
+    """Run the stress-scale benchmark"""
+    spec = spec_for_size(components, seed=seed)
+    print_header(f"Generated world: {component_count(spec):,} components ({spec.sockets} sockets)")
+
+    start = time.perf_counter()
+    generate_world_data(spec)
+    print_time("generate world data", time.perf_counter() - start)
+
+    start = time.perf_counter()
+    world = GeneratedArchitecture(spec)
+    world.setup()
+    print_time("build world", time.perf_counter() - start)
+
+    store = next(iter(world.rooms.values())).text_store
+    if store is not None:
+        text_bytes = sum(sys.getsizeof(room.desc1) for room in world.rooms.values())
+        store.clear_cache()
+        print(f"  {'descriptions as str objects':<40} {text_bytes / 1e6:>12,.1f} MB")
+        print(f"  {'text store file (memory-mapped)':<40} {os.path.getsize(store.path) / 1e6:>12,.1f} MB")
+
+    start = time.perf_counter()
+    game = headless_game(world)
+    print_time("start game", time.perf_counter() - start)
+
+    # Random walk; every move succeeds because it follows an existing door
+    rng = random.Random(seed)
+
+    def walk():
+        str(game.move(rng.choice(list(game.player.location.doors))))
+
+    print_header("Gameplay")
+    print_rate("move and render", moves, timed(walk, moves))
+    print_rate("progress update", updates, timed(game.progress.update, updates))
+
+    print_header("Graph analytics")
+    graph = world.graph
+    keys = list(world.rooms)
+    start = time.perf_counter()
+    graph.distance(keys[0], keys[-1])
+    print_time("index + first BFS row", time.perf_counter() - start)
+    print_rate("distance query, cached row", moves,
+               timed(lambda: graph.distance(keys[0], rng.choice(keys)), moves))
+
+    dense_world = GeneratedArchitecture(spec_for_size(graph.dense_limit - 64, seed=seed))
+    dense_world.setup()
+    dense_keys = list(dense_world.rooms)
+    start = time.perf_counter()
+    dense_world.graph.distance(dense_keys[0], dense_keys[-1])
+    print_time(f"all-pairs tables ({len(dense_keys)} components)", time.perf_counter() - start)
+    print_rate("distance query, all-pairs", moves,
+               timed(lambda: dense_world.graph.distance(rng.choice(dense_keys), rng.choice(dense_keys)), moves))
+
+    with tempfile.TemporaryDirectory() as cache:
+        os.environ[CACHE_DIR_ENV] = cache
+        print_header("Save/load")
+        start = time.perf_counter()
+        world.save_snapshot()
+        print_time("save snapshot", time.perf_counter() - start)
+        print(f"  {'snapshot size':<40} {os.path.getsize(os.path.join(cache, world.snapshot_name + '.snapshot')) / 1e6:>12,.1f} MB")
+
+        start = time.perf_counter()
+        loaded = GeneratedArchitecture(spec)
+        loaded.load_snapshot()
+        print_time("load snapshot", time.perf_counter() - start)
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="KodeKloud Computer Quest stress-scale benchmark")
+    parser.add_argument("--components", type=int, default=100000, help="Approximate world size")
+    parser.add_argument("--moves", type=int, default=20000, help="Number of moves to time")
+    parser.add_argument("--updates", type=int, default=50, help="Number of progress updates to time")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for virus placement and the walk")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    args = parse_args()
+    run(args.components, args.moves, args.updates, args.seed)
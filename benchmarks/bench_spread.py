@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Virus spread benchmark
+
+Times forecasting the virus spread simulation many turns ahead, on the
+built-in world and on a generated machine, as used for difficulty tuning.
+"""
+
+import argparse
+import time
+
+try:
+    from benchmarks.common import print_header, print_rate, timed
+except ImportError:
+    from common import print_header, print_rate, timed  # type: ignore
+
+from computerquest.mechanics import spread
+from computerquest.mechanics.spread import SpreadModel
+from computerquest.world.architecture import ComputerArchitecture
+from computerquest.world.generator import GeneratedArchitecture, spec_for_size
+
+def forecast(label, world, turns):
+    """Time building a model for a world and forecasting it"""
+    start = time.perf_counter()
+    model = SpreadModel(world)
+    print(f"  {'build model (' + label + ')':<40} {(time.perf_counter() - start) * 1000:>12,.1f} ms")
+    elapsed = timed(lambda: model.forecast(turns), 1)
+    print_rate(f"turns forecast ({label})", turns, elapsed)
+    levels = model.forecast(turns)
+    infected = sum(1 for level in levels.values() if level >= model.threshold)
+    print(f"  {'infected after ' + str(turns) + ' turns':<40} {infected:>12,} of {len(levels):,}")
+
+def run(turns, components, large_turns):
+    """Run the virus spread benchmark"""
+    backend = "SciPy" if spread.sparse is not None else "NumPy" if spread.np is not None else "pure Python"
+    print_header(f"Virus spread ({backend})")
+
+    world = ComputerArchitecture()
+    world.setup()
+    forecast("built-in world", world, turns)
+
+    world = GeneratedArchitecture(spec_for_size(components))
+    world.setup()
+    forecast(f"{len(world.rooms):,} components", world, large_turns)
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="KodeKloud Computer Quest virus spread benchmark")
+    parser.add_argument("--turns", type=int, default=5000, help="Turns to forecast on the built-in world")
+    parser.add_argument("--components", type=int, default=10000, help="Approximate generated world size")
+    parser.add_argument("--large-turns", type=int, default=100, help="Turns to forecast on the generated world")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    args = parse_args()
+    run(args.turns, args.components, args.large_turns)
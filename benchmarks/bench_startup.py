@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark
+
+Measures import cost with ``python -X importtime`` and the wall-clock time
+from process start to the first game prompt, and checks both against the
+budgets in computerquest.config. Exits non-zero when a budget is exceeded.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+try:
+    from benchmarks.common import print_header
+except ImportError:
+    from common import print_header  # type: ignore
+
+from computerquest.config import STARTUP_BUDGET_MS, STARTUP_IMPORT_BUDGET_MS
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Modules that must only load on first use, never at startup
+DEFERRED_MODULES = [
+    'computerquest.utils.visualizer',
+    'computerquest.utils.map_renderer',
+    'computerquest.utils.help_text',
+    'computerquest.mechanics.minigames.cpu_pipeline',
+    'computerquest.mechanics.minigames.memory_hierarchy',
+]
+
+def measure_imports(module='computerquest.game'):
+    """
+    Import a module in a fresh interpreter with -X importtime
+
+    Returns:
+        dict: Module name -> cumulative import time in microseconds
+    """
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    timings = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _self_us, cumulative_us, name = line.split(':', 1)[1].split('|')
+        timings[name.strip()] = int(cumulative_us)
+    return timings
+
+def measure_first_prompt():
+    """
+    Start main.py and wait for the first prompt
+
+    Returns:
+        float: Milliseconds from process start to the prompt
+    """
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, '-u', os.path.join(ROOT, 'main.py')],
+        cwd=ROOT, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+    )
+    try:
+        seen = b""
+        while b"\n> " not in seen:
+            chunk = proc.stdout.read1(4096)
+            if not chunk:
+                raise RuntimeError("Game exited before showing a prompt")
+            seen += chunk
+        return (time.perf_counter() - start) * 1000
+    finally:
+        proc.kill()
+        proc.wait()
+
+def run(samples):
+    """Run the startup benchmark"""
+    ok = True
+
+    print_header("Import cost (python -X importtime)")
+    timings = measure_imports()
+    total_ms = timings['computerquest.game'] / 1000
+    print(f"  computerquest.game cumulative: {total_ms:.1f} ms (budget {STARTUP_IMPORT_BUDGET_MS} ms)")
+    slowest = sorted(timings.items(), key=lambda kv: kv[1], reverse=True)[1:6]
+    for name, micros in slowest:
+        print(f"    {name:<45} {micros / 1000:>7.1f} ms")
+    loaded = [name for name in DEFERRED_MODULES if name in timings]
+    if loaded:
+        print(f"  Deferred modules loaded at startup: {', '.join(loaded)}")
+        ok = False
+    ok = ok and total_ms <= STARTUP_IMPORT_BUDGET_MS
+
+    print_header(f"Time to first prompt ({samples} runs)")
+    results = sorted(measure_first_prompt() for _ in range(samples))
+    median = results[len(results) // 2]
+    print(f"  median {median:.1f} ms, best {results[0]:.1f} ms (budget {STARTUP_BUDGET_MS} ms)")
+    ok = ok and median <= STARTUP_BUDGET_MS
+
+    print("\n  " + ("Within budget" if ok else "OVER BUDGET"))
+    return 0 if ok else 1
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="KodeKloud Computer Quest startup benchmark")
+    parser.add_argument("--samples", type=int, default=5, help="Number of cold starts to time")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    sys.exit(run(parse_args().samples))
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+World construction benchmark
+
+Compares building the world from scratch with loading it from the
+snapshot cache, and parsing the world data files with loading their
+compiled cache. Also times building every world pack, cold and from the
+shared cache, against WORLD_LOAD_BUDGET_MS; exits non-zero when a pack is
+over budget.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+try:
+    from benchmarks.common import print_header, print_rate, timed
+except ImportError:
+    from common import print_header, print_rate, timed  # type: ignore
+
+from computerquest.config import CACHE_DIR_ENV, WORLD_LOAD_BUDGET_MS
+from computerquest.world import loader
+from computerquest.world.architecture import ComputerArchitecture
+from computerquest.world.loader import load_world_data, world_packs
+
+def build_ms(data_dir):
+    """Milliseconds to build and set up a pack's world"""
+    start = time.perf_counter()
+    ComputerArchitecture(data_dir=data_dir).setup()
+    return (time.perf_counter() - start) * 1000
+
+def run_packs():
+    """
+    Time every world pack: parsed from scratch, from the on-disk cache
+    (a new process switching packs) and already loaded by this process
+
+    Returns:
+        bool: True if every pack is within budget
+    """
+    print_header(f"World packs (budget {WORLD_LOAD_BUDGET_MS} ms)")
+    print(f"  {'pack':<16}{'cold':>10}{'disk cache':>12}{'in process':>12}")
+    ok = True
+    for name, data_dir in world_packs().items():
+        loader._loaded.clear()
+        cold = build_ms(data_dir)
+        loader._loaded.clear()
+        disk = build_ms(data_dir)
+        warm = build_ms(data_dir)
+        ok = ok and max(cold, disk, warm) < WORLD_LOAD_BUDGET_MS
+        print(f"  {name:<16}{cold:>8.2f}ms{disk:>10.2f}ms{warm:>10.2f}ms")
+    return ok
+
+def run(repeat):
+    """Run the world construction benchmark"""
+    with tempfile.TemporaryDirectory() as cache:
+        os.environ[CACHE_DIR_ENV] = cache
+
+        # Prime the cache
+        ComputerArchitecture(use_cache=True).setup()
+
+        print_header(f"Default world construction ({repeat} runs)")
+        built = print_rate("build from scratch", repeat,
+                           timed(lambda: ComputerArchitecture().setup(), repeat))
+        loaded = print_rate("load snapshot", repeat,
+                            timed(lambda: ComputerArchitecture(use_cache=True).setup(), repeat))
+        print(f"\n  Snapshot speedup: {loaded / built:.1f}x")
+
+        # Prime the data cache
+        load_world_data()
+
+        print_header(f"World data files ({repeat} loads)")
+        parsed = print_rate("parse and validate JSON", repeat,
+                            timed(lambda: load_world_data(use_cache=False), repeat))
+        cached = print_rate("load compiled cache", repeat,
+                            timed(lambda: (loader._loaded.clear(), load_world_data()), repeat))
+        print(f"\n  Compiled cache speedup: {cached / parsed:.1f}x")
+
+    with tempfile.TemporaryDirectory() as cache:
+        os.environ[CACHE_DIR_ENV] = cache
+        ok = run_packs()
+    print("\n  " + ("Within budget" if ok else "OVER BUDGET"))
+    return 0 if ok else 1
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="KodeKloud Computer Quest world benchmark")
+    parser.add_argument("--repeat", type=int, default=2000, help="Number of worlds to construct")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    sys.exit(run(parse_args().repeat))
@@ -0,0 +1,43 @@
+"""
+Shared helpers for the ComputerQuest benchmark scripts
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+def headless_game(game_map=None):
+    """Create a Game without printing the welcome screen"""
+    from computerquest.game import Game
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        return Game(game_map)
+
+def timed(fn, repeat):
+    """
+    Call fn() repeat times
+
+    Returns:
+        float: Elapsed seconds
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return time.perf_counter() - start
+
+def print_header(title):
+    """Print a benchmark section header"""
+    print("=" * 70)
+    print(title)
+    print("=" * 70)
+
+def print_rate(label, count, elapsed):
+    """Print an operations-per-second line"""
+    rate = count / elapsed if elapsed else float('inf')
+    print(f"  {label:<40} {rate:>12,.0f} ops/s  ({elapsed * 1000:.1f} ms)")
+    return rate
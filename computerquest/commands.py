@@ -4,13 +4,58 @@ Command Pattern implementation
 Handles command processing through the Command pattern.
 """
 
-from computerquest.config import DIRECTION_MAPPING, VIRUS_TYPES
+from typing import Optional
+from computerquest.config import DIRECTION_MAPPING, VIRUS_TYPES, MAX_MACRO_DEPTH, JOB_INLINE_WAIT, LEADERBOARD_SIZE
+from computerquest.utils.helpers import ErrorText
+from computerquest.utils.trie import CommandTrie, AMBIGUOUS
+from computerquest.utils.perf import PerfRecorder
+from computerquest.mechanics.jobs import JobManager
+
+# Common typos and variations of command words
+TYPO_CORRECTIONS = {
+    # Direction typos
+    'nort': 'north', 'norht': 'north', 'nrth': 'north', 'noth': 'north',
+    'sout': 'south', 'souht': 'south', 'suth': 'south', 'souh': 'south',
+    'easr': 'east', 'eas': 'east', 'esat': 'east', 'est': 'east',
+    'wesr': 'west', 'wets': 'west', 'wst': 'west', 'wes': 'west',
+    'norteast': 'northeast', 'northeat': 'northeast', 'norhteast': 'northeast',
+    'nortwest': 'northwest', 'northwet': 'northwest', 'norhtwest': 'northwest',
+    'souteast': 'southeast', 'southeat': 'southeast', 'souhteast': 'southeast',
+    'soutwest': 'southwest', 'southwet': 'southwest', 'souhtwest': 'southwest',
+    
+    # Command typos
+    'lok': 'look', 'loook': 'look', 'luk': 'look', 'loo': 'look',
+    'invntory': 'inventory', 'invetory': 'inventory', 'inv': 'inventory',
+    'tak': 'take', 'tke': 'take', 'tkae': 'take',
+    'hlp': 'help', 'hlep': 'help', 'hel': 'help',
+    'mp': 'map', 'mpa': 'map',
+    'qit': 'quit', 'qt': 'quit', 'ext': 'exit',
+    'scn': 'scan', 'sacan': 'scan',
+    'clr': 'clear', 'clar': 'clear', 'clera': 'clear',
+}
 
 class Command:
     """Base class for all commands"""
+    # Vocabulary the command's argument tab-completes from (see CompletionEngine)
+    completes: Optional[str] = None
+    
+    # Long-running commands execute as background jobs (see computerquest.mechanics.jobs)
+    long_running = False
+    
     def __init__(self, game, args=None):
         self.game = game
         self.args = args or []
+        self.job = None  # Set while running as a background job
+        
+    def report(self, line):
+        """Stream a progress line when running in the background"""
+        if self.job is not None:
+            self.job.report(line)
+            
+    def checkpoint(self):
+        """Stop here if the background job was cancelled"""
+        if self.job is not None:
+            self.job.checkpoint()
         
     def execute(self):
         """Execute the command - to be implemented by subclasses"""
@@ -22,6 +67,8 @@ class Command:
 
 class MoveCommand(Command):
     """Command to move player between components"""
+    completes = 'exits'
+    
     def can_execute(self):
         if not self.args:
             return False, "Please specify a direction."
@@ -31,8 +78,22 @@ class MoveCommand(Command):
         direction = self.args[0].lower()
         return self.game.move(direction)
 
+class GotoCommand(Command):
+    """Command to travel to a visited component along the shortest route"""
+    completes = 'visited'
+    
+    def can_execute(self):
+        if not self.args:
+            return False, "Where do you want to go? Usage: goto [component]"
+        return True, None
+        
+    def execute(self):
+        return self.game.travel(' '.join(self.args))
+
 class LookCommand(Command):
     """Command to look around or examine an item"""
+    completes = 'items'
+    
     def execute(self):
         if not self.args:
             # Mark component as visited to reveal more technical details
@@ -56,6 +117,8 @@ class LookCommand(Command):
 
 class TakeCommand(Command):
     """Command to take an item"""
+    completes = 'room_items'
+    
     def can_execute(self):
         if not self.args:
             return False, "What do you want to take?"
@@ -71,6 +134,8 @@ class TakeCommand(Command):
 
 class DropCommand(Command):
     """Command to drop an item"""
+    completes = 'inventory'
+    
     def can_execute(self):
         if not self.args:
             return False, "What do you want to drop?"
@@ -103,6 +168,8 @@ class InventoryCommand(Command):
 
 class ScanCommand(Command):
     """Command to scan for viruses"""
+    completes = 'items'
+    
     def execute(self):
         if not self.args:
             result = self.game.player.scan()
@@ -118,6 +185,8 @@ class ScanCommand(Command):
 
 class AdvancedScanCommand(Command):
     """Command to perform advanced scan"""
+    completes = 'items'
+    
     def execute(self):
         if not self.args:
             result = self.game.player.advanced_scan()
@@ -133,6 +202,8 @@ class AdvancedScanCommand(Command):
 
 class AnalyzeCommand(Command):
     """Command to deeply analyze an item"""
+    completes = 'items'
+    
     def can_execute(self):
         if not self.args:
             return False, "What do you want to analyze? Usage: analyze [item]"
@@ -153,14 +224,19 @@ class QuarantineCommand(Command):
         
     def execute(self):
         virus_name = self.args[0].lower()
+        before = len(self.game.player.quarantined_viruses)
         result = self.game.player.quarantine(virus_name)
         self.game.turns += 1
         
         # Check for victory condition
-        if len(self.game.player.quarantined_viruses) == len(VIRUS_TYPES):
+        quarantined = len(self.game.player.quarantined_viruses)
+        if quarantined == len(VIRUS_TYPES):
             self.game.victory = True
             result += "\n\n" + self.game.victory_message()
             self.game.game_over = True
+            # Only the quarantine that completed the set finishes the run
+            if before < quarantined:
+                self.game.record_run()
             
         return result
 
@@ -223,6 +299,8 @@ class MotherboardCommand(Command):
 
 class ReadCommand(Command):
     """Command to read text content of an item"""
+    completes = 'items'
+    
     def can_execute(self):
         if not self.args:
             return False, "What do you want to read?"
@@ -264,6 +342,8 @@ class ReadCommand(Command):
 
 class AboutCommand(Command):
     """Command to get information about computer components"""
+    completes = 'topics'
+    
     def can_execute(self):
         if not self.args:
             return False, "What topic would you like information about? Try 'about cpu', 'about memory', etc."
@@ -288,6 +368,34 @@ class AchievementsCommand(Command):
     def execute(self):
         return self.game.progress.get_progress_report()
 
+class LeaderboardCommand(Command):
+    """Command to show the best finished runs"""
+    def execute(self):
+        filters = {}
+        count = LEADERBOARD_SIZE
+        args = list(self.args)
+        while args:
+            word = args.pop(0)
+            if word in ('world', 'cohort') and args:
+                filters[word] = args.pop(0)
+            elif word.isdigit() and int(word) > 0:
+                count = int(word)
+            else:
+                return ErrorText("Usage: leaderboard [world <pack>] [cohort <week>] [count]")
+        # Input is lower-cased; default cohorts are ISO weeks such as 2026-W42
+        if 'cohort' in filters:
+            filters['cohort'] = filters['cohort'].upper()
+        
+        runs = self.game.leaderboard.top(count, **filters)
+        title = "Leaderboard" + "".join(f" ({name} {value})" for name, value in filters.items())
+        if not runs:
+            return f"{title}: no finished runs yet."
+        lines = [f"{title}:", f"  {'#':>3}  {'Score':>7}  {'Turns':>5}  {'Achievements':>12}  {'World':<12}  Cohort"]
+        for rank, run in enumerate(runs, 1):
+            lines.append(f"  {rank:>3}  {run.score:>7,}  {run.turns:>5}  {run.achievements:>12}  "
+                         f"{run.world:<12}  {run.cohort}")
+        return "\n".join(lines)
+
 class SaveCommand(Command):
     """Command to save the game"""
     def execute(self):
@@ -336,20 +444,28 @@ class DeleteSaveCommand(Command):
 
 class VisualizeCommand(Command):
     """Command to visualize components"""
+    long_running = True
+    
     def execute(self):
         if not self.args:
             return self.game.handle_visualization()
         else:
             viz_type = self.args[0].lower()
+            self.report(f"Rendering {viz_type} visualization")
+            self.checkpoint()
             return self.game.handle_visualization(viz_type)
 
 class SimulateCommand(Command):
     """Command to run simulations"""
+    long_running = True
+    
     def execute(self):
         if not self.args:
             return "Please specify a simulation type (cpu, memory) or action (step, toggle, reset, stop)."
             
         sim_action = self.args[0].lower()
+        self.report(f"Running simulation: {sim_action}")
+        self.checkpoint()
         
         if sim_action == 'cpu':
             return self.game.start_cpu_minigame()
@@ -362,53 +478,73 @@ class SimulateCommand(Command):
 class QuickHelpCommand(Command):
     """Command to display a quick help overlay"""
     def execute(self):
-        from computerquest.utils.helpers import Colors
-        
-        quick_help = f"""┏━━━━━━━━━━━━━━━━━━━━━ {Colors.YELLOW}{Colors.BOLD}COMMAND REFERENCE{Colors.RESET} ━━━━━━━━━━━━━━━━━━━━━┓
-│                                                                      │
-│  {Colors.BOLD}Movement:{Colors.RESET}                                                           │
-│    {Colors.GREEN}n, s, e, w{Colors.RESET} - Go North, South, East, West                         │
-│    {Colors.GREEN}ne, nw, se, sw{Colors.RESET} - Go Northeast, Northwest, Southeast, Southwest   │
-│    {Colors.CYAN}u, d{Colors.RESET} - Go Up, Down                                               │
-│                                                                      │
-│  {Colors.BOLD}Basic Commands:{Colors.RESET}                                                     │
-│    {Colors.GREEN}l, look{Colors.RESET} - Examine your surroundings or an item                    │
-│    {Colors.GREEN}look [item]{Colors.RESET} - Examine a specific item                             │
-│    {Colors.GREEN}i{Colors.RESET} - Check your inventory                                          │
-│    {Colors.GREEN}t [item]{Colors.RESET} - Take an item                                           │
-│    {Colors.GREEN}drop [item]{Colors.RESET} - Remove an item from your inventory                  │
-│    {Colors.GREEN}m{Colors.RESET} - Show map                                                      │
-│    {Colors.GREEN}mb{Colors.RESET} - Show motherboard layout                                      │
-│    {Colors.GREEN}c{Colors.RESET} - Clear screen                                                  │
-│                                                                      │
-│  {Colors.BOLD}Security Functions:{Colors.RESET}                                                 │
-│    {Colors.GREEN}s, scan{Colors.RESET} - Scan for viruses in current location                    │
-│    {Colors.GREEN}scan [item]{Colors.RESET} - Check if an item contains a virus                   │
-│    {Colors.GREEN}quarantine [virus]{Colors.RESET} - Contain a discovered virus                   │
-│    {Colors.GREEN}advscan{Colors.RESET} - Perform advanced scan (requires decoder_tool)           │
-│                                                                      │
-│  {Colors.BOLD}Information & Progress:{Colors.RESET}                                             │
-│    {Colors.GREEN}status{Colors.RESET} - Check your virus discovery progress                      │
-│    {Colors.GREEN}knowledge{Colors.RESET} - View your computer architecture knowledge             │
-│    {Colors.GREEN}about [topic]{Colors.RESET} - Get information about a computer component        │
-│    {Colors.GREEN}achievements{Colors.RESET} - View your achievements and progress                │
-│                                                                      │
-│  {Colors.BOLD}Educational Features:{Colors.RESET}                                               │
-│    {Colors.GREEN}viz [comp]{Colors.RESET} - Show visualization of a component                    │
-│    {Colors.GREEN}simulate cpu{Colors.RESET} - Start CPU pipeline simulation                      │
-│    {Colors.GREEN}simulate memory{Colors.RESET} - Start memory hierarchy simulation               │
-│                                                                      │
-│  {Colors.BOLD}System Commands:{Colors.RESET}                                                    │
-│    {Colors.GREEN}help, h{Colors.RESET} - Show full help message                                  │
-│    {Colors.GREEN}save [name]{Colors.RESET} - Save your game progress                             │
-│    {Colors.GREEN}load [name]{Colors.RESET} - Load a saved game                                   │
-│    {Colors.GREEN}saves{Colors.RESET} - List available save files                                 │
-│    {Colors.GREEN}q{Colors.RESET} - Quit game                                                     │
-│                                                                      │
-┗━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┛
-
-{Colors.BOLD}TIP:{Colors.RESET} Use {Colors.BOLD}Tab{Colors.RESET} key for command completion and {Colors.BOLD}Up/Down arrows{Colors.RESET} for command history!"""
-        return quick_help
+        from computerquest.utils.help_text import quick_help
+        return quick_help()
+
+class JobsCommand(Command):
+    """Command to list background jobs"""
+    def execute(self):
+        running = self.game.command_processor.jobs.running()
+        if not running:
+            return "No background jobs running."
+        return "Background jobs:\n" + "\n".join(f"  #{job.id} {job.name}" for job in running)
+
+class CancelCommand(Command):
+    """Command to cancel a background job"""
+    def execute(self):
+        job_id = None
+        if self.args:
+            if not self.args[0].lstrip('#').isdigit():
+                return ErrorText("Usage: cancel [job number]")
+            job_id = int(self.args[0].lstrip('#'))
+        
+        job = self.game.command_processor.jobs.cancel(job_id)
+        if job is None:
+            return ErrorText("No matching background job is running.")
+        return f"Cancelling job #{job.id} ({job.name})..."
+
+class MacroCommand(Command):
+    """Command to define, list or delete macros"""
+    completes = 'macros'
+    
+    def execute(self):
+        macros = self.game.command_processor.macros
+        text = ' '.join(self.args)
+        
+        # 'macro' lists all macros, 'macro name' shows one
+        if '=' not in text:
+            if not text:
+                if not macros:
+                    return "No macros defined. Usage: macro [name] = [command]; [command]; ..."
+                return "Macros:\n" + "\n".join(f"  {name} = {body}" for name, body in sorted(macros.items()))
+            if text not in macros:
+                return ErrorText(f"No macro named '{text}'.")
+            return f"{text} = {macros[text]}"
+        
+        name, body = (part.strip() for part in text.split('=', 1))
+        if not name.replace('_', '').replace('-', '').isalnum():
+            return ErrorText("Macro names must be a single word.")
+        if name in self.game.command_processor.commands:
+            return ErrorText(f"'{name}' is already a command.")
+        
+        # 'macro name =' deletes the macro
+        if not body:
+            if macros.pop(name, None) is None:
+                return ErrorText(f"No macro named '{name}'.")
+            return f"Macro '{name}' deleted."
+        
+        steps = [step.strip() for step in body.split(';') if step.strip()]
+        macros[name] = '; '.join(steps)
+        return f"Macro '{name}' defined: {macros[name]}"
+
+class PerfCommand(Command):
+    """Hidden command showing per-command latency percentiles"""
+    def execute(self):
+        perf = self.game.command_processor.perf
+        if self.args and self.args[0].lower() == 'reset':
+            perf.reset()
+            return "Performance statistics cleared."
+        return perf.report()
 
 class CommandProcessor:
     """Processes user commands using Command pattern"""
@@ -426,6 +562,8 @@ class CommandProcessor:
         self.commands = {
             'go': MoveCommand,
             'move': MoveCommand,
+            'goto': GotoCommand,
+            'travel': GotoCommand,
             'north': self._direction_command('north'),
             'n': self._direction_command('north'),
             'south': self._direction_command('south'),
@@ -482,6 +620,8 @@ class CommandProcessor:
             'achievements': AchievementsCommand,
             'achieve': AchievementsCommand,
             'stats': AchievementsCommand,
+            'leaderboard': LeaderboardCommand,
+            'scores': LeaderboardCommand,
             'save': SaveCommand,
             'load': LoadCommand,
             'saves': SavesCommand,
@@ -494,7 +634,26 @@ class CommandProcessor:
             'clear': ClearCommand,
             'cls': ClearCommand,
             'c': ClearCommand,
+            'macro': MacroCommand,
+            'perf': PerfCommand,
+            'jobs': JobsCommand,
+            'cancel': CancelCommand,
         }
+        
+        # Built on first use from the command table
+        self._resolver = None
+        self._resolver_key = None
+        self._fuzzy = None
+        self._fuzzy_key = None
+        
+        # User-defined macros: name -> ';'-separated command string
+        self.macros = {}
+        
+        # Per-command latency statistics (see the hidden 'perf' command)
+        self.perf = PerfRecorder()
+        
+        # Background jobs for long-running commands
+        self.jobs = JobManager()
     
     def _direction_command(self, direction):
         """Create a move command with direction already specified"""
@@ -504,59 +663,123 @@ class CommandProcessor:
     
     def preprocess_command(self, user_input):
         """
-        Preprocess command for common typos and normalization
-        Returns corrected command string
+        Normalize a command string
+        Typos are corrected when the command word is resolved
         """
         # Remove extra whitespace
-        processed = user_input.strip().lower()
-        
-        # Handle common typos and variations
-        typo_corrections = {
-            # Direction typos
-            'nort': 'north', 'norht': 'north', 'nrth': 'north', 'noth': 'north',
-            'sout': 'south', 'souht': 'south', 'suth': 'south', 'souh': 'south',
-            'easr': 'east', 'eas': 'east', 'esat': 'east', 'est': 'east',
-            'wesr': 'west', 'wets': 'west', 'wst': 'west', 'wes': 'west',
-            'norteast': 'northeast', 'northeat': 'northeast', 'norhteast': 'northeast',
-            'nortwest': 'northwest', 'northwet': 'northwest', 'norhtwest': 'northwest',
-            'souteast': 'southeast', 'southeat': 'southeast', 'souhteast': 'southeast',
-            'soutwest': 'southwest', 'southwet': 'southwest', 'souhtwest': 'southwest',
-            
-            # Command typos
-            'lok': 'look', 'loook': 'look', 'luk': 'look', 'loo': 'look',
-            'invntory': 'inventory', 'invetory': 'inventory', 'inv': 'inventory',
-            'tak': 'take', 'tke': 'take', 'tkae': 'take',
-            'hlp': 'help', 'hlep': 'help', 'hel': 'help',
-            'mp': 'map', 'mpa': 'map',
-            'qit': 'quit', 'qt': 'quit', 'ext': 'exit',
-            'scn': 'scan', 'sacan': 'scan',
-            'clr': 'clear', 'clar': 'clear', 'clera': 'clear',
-        }
-        
-        # Check if the first word is a known typo
-        words = processed.split()
-        if words and words[0] in typo_corrections:
-            words[0] = typo_corrections[words[0]]
-            processed = ' '.join(words)
-            
-        return processed
+        return ' '.join(user_input.strip().lower().split())
+
+    @property
+    def resolver(self):
+        """Command trie, rebuilt whenever the command table is replaced or resized"""
+        key = (id(self.commands), len(self.commands))
+        if self._resolver is None or self._resolver_key != key:
+            self._resolver = CommandTrie(self.commands, TYPO_CORRECTIONS)
+            self._resolver_key = key
+        return self._resolver
+
+    def suggest_commands(self, word):
+        """Nearest command names to a misspelled word"""
+        key = (id(self.commands), len(self.commands))
+        if self._fuzzy is None or self._fuzzy_key != key:
+            from computerquest.utils.fuzzy import FuzzyIndex
+            self._fuzzy = FuzzyIndex(name for name in self.commands if len(name) > 2)
+            self._fuzzy_key = key
+        return self._fuzzy.suggest(word)
+
+    def resolve_command(self, word):
+        """
+        Resolve a command word that may be an alias, prefix or typo
+
+        Returns:
+            Resolution: see computerquest.utils.trie
+        """
+        return self.resolver.resolve(word)
         
+    def split_commands(self, user_input):
+        """
+        Split an input line into ';'-separated commands
+        A macro definition keeps its ';' as part of the macro body
+        """
+        words = user_input.split()
+        if words and self.resolve_command(words[0].lower()).name == 'macro':
+            return [user_input.strip()]
+        return [part.strip() for part in user_input.split(';') if part.strip()]
+
     def process(self, user_input):
-        """Process a user command"""
+        """Process a user command, a ';'-separated chain of commands or a macro"""
         # Skip empty inputs
         if not user_input.strip():
             return "Please enter a command. Type 'help' for available commands."
             
-        # Preprocess command for typos
-        processed_input = self.preprocess_command(user_input)
+        steps = self.split_commands(user_input)
+        if not steps:
+            return ErrorText("Please enter a command. Type 'help' for available commands.")
+        
+        if len(steps) == 1 and steps[0].split()[0].lower() not in self.macros:
+            result, newly_unlocked = self.run_command(steps[0])
+        else:
+            # Only the final screen is shown, so skipped output is never rendered
+            result, newly_unlocked, failed_step = self.run_batch(steps)
+            if failed_step is not None:
+                result = ErrorText(f"{result}\n\nStopped at '{failed_step}'; the rest of the line was skipped.")
+        
+        # Report new achievements
+        if newly_unlocked:
+            result += "\n\nACHIEVEMENT UNLOCKED!\n"
+            for achievement in newly_unlocked:
+                result += f"- {achievement.name}: {achievement.description}\n"
+                
+        return result
+
+    def run_batch(self, steps, depth=0):
+        """
+        Run commands in order, expanding macros and stopping at the first error
+
+        Args:
+            steps (list): Command strings
+            depth (int): Macro nesting depth
+
+        Returns:
+            tuple: (last result, newly unlocked achievements, failing step or None)
+        """
+        result = ""
+        newly_unlocked = []
+        for step in steps:
+            name = step.split()[0].lower()
+            if name in self.macros:
+                if depth >= MAX_MACRO_DEPTH:
+                    return ErrorText(f"Macro '{name}' nests too deeply."), newly_unlocked, step
+                result, unlocked, failed_step = self.run_batch(self.split_commands(self.macros[name]), depth + 1)
+            else:
+                result, unlocked = self.run_command(step)
+                failed_step = step if isinstance(result, ErrorText) else None
+            newly_unlocked.extend(unlocked)
             
-        # Split into command words
-        cmd_words = processed_input.split()
-        command = cmd_words[0]
+            if failed_step is not None:
+                return result, newly_unlocked, failed_step
+            if self.game.game_over:
+                break
+        return result, newly_unlocked, None
+
+    def run_command(self, user_input):
+        """
+        Run a single command
+
+        Returns:
+            tuple: (result, newly unlocked achievements); failures are ErrorText
+        """
+        # Normalize and split into command words
+        cmd_words = self.preprocess_command(user_input).split()
         args = cmd_words[1:]
         
-        # Apply command prefix matching
-        command = self.game._match_command_prefix(command)
+        # Resolve aliases, typos and unique prefixes in one walk
+        resolution = self.resolve_command(cmd_words[0])
+        command = resolution.name
+        if resolution.kind == AMBIGUOUS:
+            from computerquest.utils.helpers import Colors
+            options = ', '.join(f"{Colors.GREEN}{name}{Colors.RESET}" for name in resolution.candidates)
+            return ErrorText(f"Command '{command}' is ambiguous. Did you mean: {options}?"), []
         
         # Check if command exists
         if command in self.commands:
@@ -566,30 +789,39 @@ class CommandProcessor:
             # Validate command
             can_execute, error = cmd.can_execute() if hasattr(cmd, 'can_execute') else (True, None)
             if not can_execute:
-                return error
+                return ErrorText(error), []
                 
-            # Execute command
-            result = cmd.execute()
-            
-            # Check for new achievements
-            newly_unlocked = self.game.progress.update()
-            if newly_unlocked:
-                result += "\n\nACHIEVEMENT UNLOCKED!\n"
-                for achievement in newly_unlocked:
-                    result += f"- {achievement.name}: {achievement.description}\n"
-                    
-            return result
+            # Execute command (timed per command class), then check for new achievements
+            if getattr(type(cmd), 'long_running', False):
+                result = self.run_in_background(cmd, ' '.join(cmd_words))
+            else:
+                result = self.perf.measure(type(cmd).__name__, cmd.execute)
+            return result, self.game.progress.update()
         else:
-            # Try to find similarly named commands (fuzzy matching)
+            # Suggest the nearest command names by edit distance
             from computerquest.utils.helpers import Colors
-            similar_commands = []
-            for cmd in self.commands.keys():
-                # Simple similarity check - more than half of letters match
-                if len(cmd) > 2 and sum(c in command for c in cmd) >= len(cmd) // 2:
-                    similar_commands.append(cmd)
+            similar_commands = self.suggest_commands(command)
             
             if similar_commands:
-                suggestions = ', '.join([f"{Colors.GREEN}{cmd}{Colors.RESET}" for cmd in similar_commands[:3]])
-                return f"Command '{command}' not recognized. Did you mean: {suggestions}?\nType 'help' for available commands."
+                suggestions = ', '.join([f"{Colors.GREEN}{cmd}{Colors.RESET}" for cmd in similar_commands])
+                return ErrorText(f"Command '{command}' not recognized. Did you mean: {suggestions}?\nType 'help' for available commands."), []
             else:
-                return f"Command '{command}' not recognized. Type 'help' for available commands."
\ No newline at end of file
+                return ErrorText(f"Command '{command}' not recognized. Type 'help' for available commands."), []
+
+    def run_in_background(self, cmd, name):
+        """
+        Run a long-running command as a background job
+        
+        Returns:
+            The command's result if it finished within JOB_INLINE_WAIT seconds,
+            otherwise a note that it is running in the background
+        """
+        def work(job):
+            cmd.job = job
+            return self.perf.measure(type(cmd).__name__, cmd.execute)
+        
+        job = self.jobs.submit(name, work)
+        if job.wait(JOB_INLINE_WAIT) or not self.jobs.to_background(job):
+            # Quick enough to show right away, as if it ran in the foreground
+            return self.jobs.collect(job)
+        return f"Started job #{job.id}: {job.name}. Its output appears when it finishes; 'jobs' lists running jobs, 'cancel {job.id}' stops it."
@@ -4,12 +4,52 @@ KodeKloud Computer Quest Configuration
 Central configuration file for game settings and constants
 """
 
+import os
+
 # Game Information
 GAME_NAME = "KodeKloud Computer Quest"
 GAME_VERSION = "1.0.0"
 
 # File System
 SAVE_DIR = ".kodekloud_quest"
+CACHE_DIR_ENV = "COMPUTERQUEST_CACHE_DIR"  # Overrides ~/SAVE_DIR/cache when set
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+WORLDS_DIR = os.path.join(DATA_DIR, "worlds")  # One subdirectory per world pack
+DEFAULT_WORLD = "default"  # Pack name of the built-in world in DATA_DIR
+WORLD_LOAD_BUDGET_MS = 50  # Building any pack's world must stay under this
+
+# World snapshot cache
+WORLD_CACHE_ENABLED = False  # Opt-in: pays off only for worlds that are costly to build
+WORLD_DATA_CACHE_ENABLED = True  # Keep parsed, validated world data files in the cache
+SNAPSHOT_VERSION = 5  # Bump when the snapshot layout changes
+CACHE_MAX_BYTES = 200 * 1024 * 1024  # Least recently used cache files are evicted beyond this
+CACHE_MAX_AGE_DAYS = 30  # Cache files unused for longer are evicted
+
+# Description text store
+TEXT_STORE_MIN_COMPONENTS = 1000  # Worlds this large keep descriptions in a memory-mapped store
+TEXT_CACHE_SIZE = 256  # Decoded descriptions kept in memory per store
+
+# Graph analytics
+DENSE_GRAPH_LIMIT = 512  # Worlds up to this many components get all-pairs distance tables
+GRAPH_CACHE_SIZE = 64  # Per-source BFS rows kept for larger worlds
+
+# Item registry
+ITEM_CACHE_SIZE = 1024  # Items first seen during play kept classified, least recently used dropped first
+
+# Entity engine
+ENTITY_KINDS = {  # Agent kind -> ticks between moves
+    "roaming_virus": 2,
+    "helper_daemon": 3,
+    "security_scanner": 1,
+}
+ENTITY_TICK_BUDGET_MS = 10  # Target for one tick of 100k agents (with NumPy)
+ENTITY_AGENTS = 0  # Agents of each kind spawned when a game starts (main.py --agents); 0 leaves them out
+
+# Virus spread simulation
+SPREAD_BASE_RATE = 0.05  # Per-turn chance infection crosses a door into an unprotected component
+SPREAD_RECOVERY = 0.02  # Share of a component's infection cleared each turn
+SPREAD_ERROR_THRESHOLD = 0.5  # Infection level at which a component shows an error
+SPREAD_ENABLED = False  # Let infection spread from the viruses each turn (main.py --spread)
 
 # Direction Constants
 DIRECTION_MAPPING = {
@@ -59,9 +99,39 @@ KNOWLEDGE_AREAS = {
 # Maximum knowledge level per area
 MAX_KNOWLEDGE = 5
 
+# Component types, tried in order against the lower-cased component name:
+# type -> (name keywords, knowledge area -> points gained by a clean scan)
+COMPONENT_TYPES = {
+    "cpu": (("cpu", "alu", "control", "register"), {"cpu": 1}),
+    "memory": (("memory", "ram", "cache"), {"memory": 1}),
+    "storage": (("ssd", "hdd", "drive", "disk", "storage"), {"storage": 1}),
+    "network": (("network", "interface"), {"networking": 1}),
+    "firmware": (("bios", "firmware", "uefi"), {}),
+}
+
 # Map display settings
 MAP_WIDTH = 70
 MAP_HEIGHT = 60
 
+# Command chains and macros
+MAX_MACRO_DEPTH = 8  # Macros may call macros up to this depth
+
+# Background jobs
+JOB_INLINE_WAIT = 0.25  # Seconds to wait for a long-running command before backgrounding it
+
+# Leaderboard
+LEADERBOARD_FILE = "leaderboard.db"  # SQLite database in ~/SAVE_DIR
+LEADERBOARD_PATH_ENV = "COMPUTERQUEST_LEADERBOARD"  # Overrides the database path when set
+LEADERBOARD_BATCH_SIZE = 2000  # Most finished runs written in one transaction
+LEADERBOARD_FLUSH_INTERVAL = 1.0  # Seconds the writer waits to fill a batch
+LEADERBOARD_SIZE = 10  # Runs shown by the leaderboard command
+LEADERBOARD_DEFAULT_PLAYER = "player"  # Recorded when the user name can't be determined
+LEADERBOARD_QUERY_BUDGET_MS = 5  # Top-k queries over a million runs must stay under this
+
 # Performance settings
-PERFORMANCE_METRICS = ["speed", "capacity", "reliability"]
\ No newline at end of file
+PERFORMANCE_METRICS = ["speed", "capacity", "reliability"]
+
+# Startup budgets (milliseconds), checked by tests/test_startup.py and
+# benchmarks/bench_startup.py
+STARTUP_IMPORT_BUDGET_MS = 150   # python -X importtime cumulative for computerquest.game
+STARTUP_BUDGET_MS = 500          # process start to first "> " prompt
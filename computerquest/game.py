@@ -4,264 +4,41 @@ Game controller for KodeKloud Computer Quest
 Main game logic and controller
 """
 
+import functools
+import os
+import threading
 import time
-import random
 from computerquest.world.architecture import ComputerArchitecture
 from computerquest.mechanics.progress import ProgressSystem
 from computerquest.commands import CommandProcessor
-from computerquest.utils.helpers import prefix_match, format_box
-from computerquest.config import DIRECTION_MAPPING, DIRECTION_NAMES, VIRUS_TYPES
+from computerquest.utils.helpers import prefix_match, LazyText, ErrorText, render_location
+from computerquest.config import (DIRECTION_MAPPING, WORLD_CACHE_ENABLED, DEFAULT_WORLD, LEADERBOARD_DEFAULT_PLAYER,
+                                  ENTITY_AGENTS, SPREAD_ENABLED)
 
-# Implemented component visualizer
-class ComponentVisualizer:
-    def render_cpu_text(self, clock_speed=3.6, cores=4, cache=8):
-        """Visualize CPU architecture in text-only mode"""
-        result = "++" + "-" * 50 + "++\n"
-        result += "|" + "CPU ARCHITECTURE".center(52) + "|\n"
-        result += "|" + f"Clock Speed: {clock_speed}GHz | Cores: {cores} | Cache: {cache}MB".center(52) + "|\n"
-        result += "+" + "-" * 50 + "+\n"
-        
-        # ASCII art CPU
-        cpu_art = [
-            "    +---------------------------+    ",
-            "    |                           |    ",
-            "    |    +-----+     +-----+    |    ",
-            "    |    |CPU 1|     |CPU 2|    |    ",
-            "    |    +-----+     +-----+    |    ",
-            "    |                           |    ",
-            "    |    +-----+     +-----+    |    ",
-            "    |    |CPU 3|     |CPU 4|    |    ",
-            "    |    +-----+     +-----+    |    ",
-            "    |                           |    ",
-            "    |    +-------------------+  |    ",
-            "    |    |     L3 Cache      |  |    ",
-            "    |    +-------------------+  |    ",
-            "    |                           |    ",
-            "    +---------------------------+    ",
-            "       | | | | | | | | | | | |      ",
-            "       v v v v v v v v v v v v      "
-        ]
-        
-        for line in cpu_art:
-            result += "|" + line.center(52) + "|\n"
-            
-        result += "+" + "-" * 50 + "+\n\n"
-        
-        # Educational text
-        info_text = [
-            "CPU (Central Processing Unit):",
-            "- Executes instructions to process data",
-            "- Contains multiple cores for parallel processing",
-            "- Uses cache memory for faster data access",
-            "- Clock speed determines how many cycles per second",
-            "- Connected to system via socket on motherboard"
-        ]
-        
-        for line in info_text:
-            result += line + "\n"
-            
-        return result
-        
-    def render_memory_hierarchy_text(self):
-        """Visualize memory hierarchy in text-only mode"""
-        result = "++" + "-" * 50 + "++\n"
-        result += "|" + "MEMORY HIERARCHY".center(52) + "|\n"
-        result += "+" + "-" * 50 + "+\n\n"
-        
-        # Memory levels
-        levels = [
-            {"name": "CPU Registers", "size": "KB", "speed": "0.5ns", "width": 10},
-            {"name": "L1 Cache", "size": "64KB", "speed": "1ns", "width": 16},
-            {"name": "L2 Cache", "size": "256KB", "speed": "3ns", "width": 22},
-            {"name": "L3 Cache", "size": "8MB", "speed": "10ns", "width": 28},
-            {"name": "RAM", "size": "16GB", "speed": "100ns", "width": 34},
-            {"name": "SSD", "size": "1TB", "speed": "10μs", "width": 40},
-            {"name": "HDD", "size": "4TB", "speed": "10ms", "width": 46}
-        ]
-        
-        for i, level in enumerate(levels):
-            box_width = level["width"]
-            padding = (50 - box_width) // 2
-            result += "|" + " " * padding + "+" + "-" * box_width + "+" + " " * padding + "|\n"
-            
-            name_line = f"{level['name']} ({level['size']} | {level['speed']})"
-            name_padding = (box_width - len(name_line)) // 2
-            if name_padding < 0:
-                name_padding = 0
-                name_line = name_line[:box_width]
-            
-            result += "|" + " " * padding + "|" + " " * name_padding + name_line + " " * (box_width - len(name_line) - name_padding) + "|" + " " * padding + "|\n"
-            result += "|" + " " * padding + "+" + "-" * box_width + "+" + " " * padding + "|\n"
-            
-            # Add connecting arrow
-            if i < len(levels) - 1:
-                result += "|" + " " * 25 + "v" + " " * 26 + "|\n"
-        
-        result += "+" + "-" * 50 + "+\n\n"
-        
-        # Educational text
-        info_text = [
-            "Memory Hierarchy:",
-            "- Balances speed, size, and cost",
-            "- Faster memory is smaller and more expensive",
-            "- CPU checks each level in order when requesting data",
-            "- Takes advantage of locality of reference",
-            "- Hit: Data found at current level",
-            "- Miss: Must check next level down"
-        ]
-        
-        for line in info_text:
-            result += line + "\n"
-            
-        return result
-        
-    def render_network_stack_text(self):
-        """Visualize network stack in text-only mode"""
-        result = "++" + "-" * 50 + "++\n"
-        result += "|" + "NETWORK PROTOCOL STACK".center(52) + "|\n"
-        result += "+" + "-" * 50 + "+\n\n"
-        
-        layers = [
-            "Application Layer (HTTP, FTP, SMTP, DNS)",
-            "Transport Layer (TCP, UDP)",
-            "Internet Layer (IP, ICMP, ARP)",
-            "Link Layer (Ethernet, WiFi, PPP)",
-            "Physical Layer (Cables, Radio, Fiber)"
-        ]
-        
-        for i, layer in enumerate(layers):
-            result += "+" + "-" * 50 + "+\n"
-            result += "|" + layer.center(50) + "|\n"
-            
-            # Add arrow
-            if i < len(layers) - 1:
-                result += "|" + " " * 24 + "↕" + " " * 25 + "|\n"
-        
-        result += "+" + "-" * 50 + "+\n\n"
-        
-        # Educational text
-        info_text = [
-            "Network Protocol Stack:",
-            "- Data encapsulation when sending (down)",
-            "- Data decapsulation when receiving (up)",
-            "- Each layer adds its own headers/trailers",
-            "- Provides abstraction between layers",
-            "- Each layer has a specific role",
-            "- Based on the OSI or TCP/IP model"
-        ]
-        
-        for line in info_text:
-            result += line + "\n"
-            
-        return result
-        
-    def render_storage_hierarchy_text(self):
-        """Visualize storage systems in text-only mode"""
-        result = "++" + "-" * 50 + "++\n"
-        result += "|" + "STORAGE SYSTEMS".center(52) + "|\n"
-        result += "+" + "-" * 50 + "+\n\n"
-        
-        # HDD vs SSD
-        result += "HDD (Hard Disk Drive)         SSD (Solid State Drive)\n"
-        result += "+" + "-" * 24 + "+        +" + "-" * 24 + "+\n"
-        result += "|  " + "[]===O".center(20) + "  |        |  " + "[][][][][]".center(20) + "  |\n"
-        result += "|  " + "Mechanical".center(20) + "  |        |  " + "No Moving Parts".center(20) + "  |\n"
-        result += "|  " + "Slower".center(20) + "  |        |  " + "Faster".center(20) + "  |\n"
-        result += "|  " + "Magnetic".center(20) + "  |        |  " + "Flash Memory".center(20) + "  |\n"
-        result += "+" + "-" * 24 + "+        +" + "-" * 24 + "+\n\n"
-        
-        # Data organization
-        result += "Data Organization:\n"
-        result += "Files → File System → Logical Blocks → Physical Storage\n\n"
-        
-        # Educational text
-        info_text = [
-            "Storage Systems:",
-            "- HDD: Mechanical, uses magnetic platters",
-            "- SSD: Solid-state, uses flash memory cells",
-            "- Data is organized hierarchically",
-            "- File systems manage the mapping",
-            "- Trade-offs: Speed vs. Capacity vs. Cost"
-        ]
-        
-        for line in info_text:
-            result += line + "\n"
-            
-        return result
-            
-    def render_motherboard_layout_text(self):
-        """Visualize the motherboard layout in text-only mode"""
-        result = "++" + "-" * 50 + "++\n"
-        result += "|" + "MODERN MOTHERBOARD LAYOUT".center(52) + "|\n"
-        result += "+" + "-" * 50 + "+\n\n"
-        
-        # Create ASCII representation of the motherboard layout
-        layout = [
-            "                  CPU PACKAGE                    ",
-            "     +-------------------------------------+     ",
-            "     |                                     |     ",
-            "     |    +-------+          +-------+    |     ",
-            "     |    | Core1 |          | Core2 |    |     ",
-            "     |    +-------+          +-------+    |     ",
-            "     |                                     |     ",
-            "     |    +---------------------------+    |     ",
-            "     |    |      L3 Cache (Shared)    |    |     ",
-            "     |    +---------------------------+    |     ",
-            "     +-------------------------------------+     ",
-            "                      |                          ",
-            "                 DMI Link                        ",
-            "                      |                          ",
-            "     +-------------------------------------+     ",
-            "     |             PCH CHIPSET             |     ",
-            "     |                                     |     ",
-            "     |  +--------+  +-------+  +--------+ |     ",
-            "     |  |Storage |  | PCIe  |  |Network | |     ",
-            "     |  |Control |  |Control|  |Interface| |     ",
-            "     |  +--------+  +-------+  +--------+ |     ",
-            "     |                                     |     ",
-            "     |  +--------+                         |     ",
-            "     |  |BIOS/UEFI|                        |     ",
-            "     |  +--------+                         |     ",
-            "     +-------------------------------------+     ",
-        ]
-        
-        for line in layout:
-            result += line + "\n"
-            
-        result += "\nVirus Locations:\n"
-        result += "- Boot Sector Virus: SSD\n"
-        result += "- Rootkit Virus: OS Kernel (in RAM)\n"
-        result += "- Memory Resident Virus: RAM DIMM 1\n"
-        result += "- Firmware Virus: BIOS/UEFI Flash\n"
-        result += "- Packet Sniffer Virus: Network Interface\n"
-        
-        return result
+# Heavy modules that are only imported when first used, keeping startup fast.
+# They stay reachable as attributes of this module for backward compatibility.
+_LAZY_ATTRIBUTES = {
+    'ComponentVisualizer': 'computerquest.utils.visualizer',
+    'CPUPipelineMinigame': 'computerquest.mechanics.minigames.cpu_pipeline',
+    'MemoryHierarchyMinigame': 'computerquest.mechanics.minigames.memory_hierarchy',
+}
 
-class CPUPipelineMinigame:
-    def __init__(self, game):
-        self.game = game
-        
-    def explain(self):
-        return "CPU Pipeline Minigame placeholder"
-        
-    def get_status(self):
-        return "CPU Pipeline status"
-        
-    def step(self):
-        return "Advanced pipeline by one step"
-        
-    def toggle_pipeline(self):
-        return "Toggled pipeline mode"
-        
-    def reset(self):
-        return "Reset pipeline simulation"
-        
-class MemoryHierarchyMinigame:
-    def __init__(self, game):
-        self.game = game
-        
-    def explain(self):
-        return "Memory Hierarchy Minigame placeholder"
+def __getattr__(name):
+    """Resolve lazily imported classes on first access"""
+    if name in _LAZY_ATTRIBUTES:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def _holding_state_lock(method):
+    """Run a Game method under the game's state lock; background jobs call it too"""
+    @functools.wraps(method)
+    def locked(self, *args, **kwargs):
+        with self.state_lock:
+            return method(self, *args, **kwargs)
+    return locked
 
 # SaveLoadSystem placeholder (will need to be properly implemented)
 class SaveLoadSystem:
@@ -281,14 +58,21 @@ class SaveLoadSystem:
         return f"Deleted save: {name}"
 
 class Game:
-    def __init__(self):
+    def __init__(self, game_map=None, agents=ENTITY_AGENTS, spread=SPREAD_ENABLED):
         """
         Constructor: Create a KodeKloud Computer Quest game
         Initialize the game world and components
+        game_map: world to play in (e.g. a GeneratedArchitecture); set up here
+            if it has no player yet. Defaults to the built-in world.
+        agents: agents of each ENTITY_KINDS kind to put in the world (see start_agents)
+        spread: whether infection spreads from the viruses each turn (see SpreadModel)
         """
         # Initialize computer architecture
-        self.game_map = ComputerArchitecture()
-        self.game_map.setup()
+        if game_map is None:
+            game_map = ComputerArchitecture(use_cache=WORLD_CACHE_ENABLED)
+        if game_map.player is None:
+            game_map.setup()
+        self.game_map = game_map
         
         # Get player from the map
         self.player = self.game_map.player
@@ -300,17 +84,45 @@ class Game:
         self.victory = False
         self.last_save_turn = 0  # Track the turn of the last save
         self.changes_since_save = True  # Flag to track unsaved changes
+        self.start_time = time.time()  # For the run's duration on the leaderboard
         
         # Initialize the progress tracking system
         self.progress = ProgressSystem(self)
         
-        # Initialize visualizer
-        self.visualizer = ComponentVisualizer()
+        # Visualizer is created on first use (see the visualizer property)
+        self._visualizer = None
+        
+        # Shared leaderboard, looked up on first use (see the leaderboard property)
+        self._leaderboard = None
+        
+        # Fuzzy indexes for misspelled items and topics, built on first use
+        self._item_index = None
+        self._topic_index = None
+        
+        # Shortest-path router for goto, created on first use
+        self._router = None
         
-        # Initialize minigame state
+        # EntityEngine moving autonomous agents, if any are in play
+        self.entities = None
+        if agents:
+            self.start_agents(agents)
+        
+        # SpreadModel spreading infection from the viruses, if enabled
+        self.spread = None
+        if spread:
+            from computerquest.mechanics.spread import SpreadModel
+            self.spread = SpreadModel(self.game_map)
+        
+        # Initialize minigame state; background jobs change it, so it is
+        # only touched under state_lock
+        self.state_lock = threading.RLock()
         self.current_minigame = None
         self.current_visualization = None
         
+        # Held while printing, so job output streamed from worker threads
+        # does not interleave with command results
+        self.output_lock = threading.Lock()
+        
         # Initialize save/load system
         self.save_load = SaveLoadSystem(self)
         
@@ -330,41 +142,131 @@ class Game:
         # Print welcome message
         self.display_welcome()
 
-    def _init_map_grid(self):
-        """Initialize the map grid for tracking visited components"""
-        self.map_grid = {}
-        
-        # CPU and cores
-        cpu_components = ['cpu_package', 'core1', 'core1_cu', 'core1_alu', 'core1_registers', 
-                         'core1_l1', 'core2', 'core2_cu', 'core2_alu', 'core2_registers', 'core2_l1']
-        
-        # Cache and memory
-        memory_components = ['l2_cache1', 'l2_cache2', 'l3_cache', 'memory_controller',
-                            'ram_dimm1', 'ram_dimm2', 'ram_dimm3', 'ram_dimm4']
-        
-        # Conceptual components
-        conceptual_components = ['kernel', 'virtual_memory']
-        
-        # PCH components
-        pch_components = ['pch', 'storage_controller', 'pcie_controller', 
-                         'network_interface', 'bios']
-        
-        # Storage components
-        storage_components = ['sata_ports', 'ssd', 'hdd']
-        
-        # PCIe components
-        pcie_components = ['pcie_x16', 'pcie_x1_1', 'pcie_x1_2', 'gpu']
-        
-        # External ports
-        port_components = ['usb_ports', 'ethernet']
+    @property
+    def visualizer(self):
+        """Component visualizer, imported and created on first use"""
+        if self._visualizer is None:
+            from computerquest.utils.visualizer import ComponentVisualizer
+            self._visualizer = ComponentVisualizer()
+        return self._visualizer
+
+    @visualizer.setter
+    def visualizer(self, value):
+        self._visualizer = value
+
+    @property
+    def leaderboard(self):
+        """Leaderboard of finished runs, shared by every game in the process and opened on first use"""
+        if self._leaderboard is None:
+            from computerquest.mechanics.leaderboard import get_leaderboard
+            self._leaderboard = get_leaderboard()
+        return self._leaderboard
+
+    @leaderboard.setter
+    def leaderboard(self, value):
+        self._leaderboard = value
+
+    def record_run(self):
+        """Queue the finished run for the leaderboard"""
+        import getpass
+        from computerquest.mechanics.leaderboard import Run, cohort_of
         
-        # Combine all components
-        all_components = (cpu_components + memory_components + conceptual_components + 
-                         pch_components + storage_components + pcie_components + port_components)
+        self.progress.update()  # Unlock the achievements the final move earned
+        spec = getattr(self.game_map, 'spec', None)
+        try:
+            player = getpass.getuser()
+        except (KeyError, OSError):
+            # No login name in the environment and no password database entry
+            player = LEADERBOARD_DEFAULT_PLAYER
+        finished = time.time()
+        self.leaderboard.record(Run(
+            player,
+            self.progress.calculate_score(),
+            self.turns,
+            sum(1 for achievement in self.progress.achievements if achievement.unlocked),
+            self.game_map.world_name,
+            spec.seed if spec is not None else None,
+            finished - self.start_time,
+            cohort_of(finished),
+            finished,
+        ))
+
+    @property
+    def router(self):
+        """Router over visited components, created on first use"""
+        if self._router is None:
+            from computerquest.world.routing import Router
+            self._router = Router(self.game_map)
+        return self._router
+
+    def travel(self, destination):
+        """
+        Walk the shortest route through visited components to a destination
+        destination: room key, component name or unique prefix of either
+        Returns: Route summary followed by the final location, or an error message
+        """
+        rooms = self.game_map.rooms
+        target = destination.strip().lower()
+        names = {room.name.lower(): key for key, room in rooms.items() if room.visited}
+        known = sorted(key for key, room in rooms.items() if room.visited)
+        
+        key = names.get(target) or prefix_match(target.replace(' ', '_'), known)
+        if key not in rooms or not rooms[key].visited:
+            if key in rooms:
+                return ErrorText(f"You haven't visited {rooms[key].name} yet, so you don't know the way.")
+            return ErrorText(f"Unknown destination '{destination}'. Visited components: {', '.join(known) or 'none'}")
+        
+        source = self.game_map.key_of(self.player.location)
+        steps = self.router.route(source, key)
+        if steps is None:
+            return ErrorText(f"No known route from {self.player.location.name} to {rooms[key].name}.")
+        if not steps:
+            return f"You are already at {rooms[key].name}."
+        
+        # Make the moves as one batch; only the final location is rendered
+        start_name = self.player.location.name
+        for direction, _ in steps:
+            result = self.move(direction)
+            if isinstance(result, ErrorText):
+                return result
         
-        # Initialize all as not visited
-        for component in all_components:
-            self.map_grid[component] = {'visited': False}
+        route = ' -> '.join([start_name] + [rooms[step].name for _, step in steps])
+        summary = f"Route ({len(steps)} moves): {route}\n\n"
+        return summary + result
+
+    @property
+    def item_index(self):
+        """Fuzzy index over every item name in the world and inventory"""
+        if self._item_index is None:
+            from computerquest.utils.fuzzy import FuzzyIndex
+            names = set(self.player.items) if self.player else set()
+            for room in self.game_map.rooms.values():
+                names.update(room.items)
+            self._item_index = FuzzyIndex(sorted(names))
+        return self._item_index
+
+    @property
+    def topic_index(self):
+        """Fuzzy index over 'about' topics"""
+        if self._topic_index is None:
+            from computerquest.utils.fuzzy import FuzzyIndex
+            from computerquest.utils.help_text import ABOUT_TOPICS
+            self._topic_index = FuzzyIndex(sorted(ABOUT_TOPICS))
+        return self._topic_index
+
+    def _init_map_grid(self):
+        """Initialize the map grid for tracking visited components"""
+        self.map_grid = {key: {'visited': False} for key in self.game_map.rooms}
+
+    @property
+    def has_default_layout(self):
+        """True if the world is the built-in one the map and motherboard drawings show"""
+        return self.game_map.world_name == DEFAULT_WORLD
+
+    def layout_unavailable(self, drawing):
+        """Message for drawings that only exist for the built-in world"""
+        return (f"No {drawing} is available for {self.game_map.name}: it is only drawn for the built-in world. "
+                "Use 'look' and 'goto' to find your way.")
         
     def setup_readline(self):
         """
@@ -372,45 +274,13 @@ class Game:
         """
         try:
             import readline
-            import rlcompleter
             
-            # Define our custom completer function for game commands
+            # Complete commands, then arguments from the command's own vocabulary
+            from computerquest.utils.completion import CompletionEngine
+            self.completion = CompletionEngine(self)
+            
             def completer(text, state):
-                # First, try to complete commands
-                command_options = [cmd for cmd in self.command_processor.commands.keys() 
-                                  if cmd.startswith(text)]
-                
-                # Then, try to complete directions
-                direction_options = [dir_name for dir_name in self.command_processor.direction_words
-                                    if dir_name.startswith(text)]
-                
-                # Finally, try to complete items in the current location or inventory
-                item_options = []
-                if self.player and self.player.location:
-                    # Items in current location
-                    item_options.extend([item for item in self.player.location.items.keys() 
-                                         if isinstance(item, str) and item.startswith(text)])
-                    
-                if self.player:
-                    # Items in inventory
-                    item_options.extend([item for item in self.player.items.keys() 
-                                         if isinstance(item, str) and item.startswith(text)])
-                
-                # Special cases for specific commands
-                words = readline.get_line_buffer().split()
-                if len(words) > 0 and words[0] in ['take', 'get', 't']:
-                    # Only show items in the room for take command
-                    if self.player and self.player.location:
-                        item_options = [item for item in self.player.location.items.keys() 
-                                        if isinstance(item, str) and item.startswith(text)]
-                
-                # Combine all options
-                options = command_options + direction_options + item_options
-                
-                # Return the state-th completion or None if no more completions
-                if state < len(options):
-                    return options[state]
-                return None
+                return self.completion.complete(readline.get_line_buffer(), readline.get_begidx(), text, state)
             
             # Set the completer function
             readline.set_completer(completer)
@@ -454,8 +324,15 @@ class Game:
             from computerquest.utils.helpers import Colors
             print(f"\n{Colors.GREEN}TIP:{Colors.RESET} Use {Colors.BOLD}Tab{Colors.RESET} for command completion and {Colors.BOLD}Up/Down arrows{Colors.RESET} for command history!")
         
+        # Background jobs print their progress as it arrives
+        self.command_processor.jobs.output = self.show_job_output
+        
         # Loop until victory or quit
         while not self.game_over:
+            # Show progress and results from background jobs
+            for line in self.command_processor.jobs.drain():
+                print(f"\n{line}")
+            
             # Get user input
             try:
                 user_input = input("\n> ").strip()
@@ -490,13 +367,15 @@ class Game:
             if cmd not in ['save', 'load', 'saves', 'help', 'h', '?', 'clear', 'cls', 'c']:
                 self.changes_since_save = True
             
-            # Clear the screen before showing the new output (except for the first command)
-            import os
-            os.system('cls' if os.name == 'nt' else 'clear')
-            
-            # Display result
-            print(f"\n{response}")
-            
+            # Display result (rendering lazy output is timed separately)
+            text = self.command_processor.perf.measure('(render)', str, response)
+            with self.output_lock:
+                # Clear the screen before showing the new output
+                os.system('cls' if os.name == 'nt' else 'clear')
+                print(f"\n{text}")
+        
+        self.command_processor.jobs.output = None
+        
         # Game over - ask to play again or exit
         if self.victory:
             print("\nWould you like to play again? (y/n)")
@@ -510,6 +389,16 @@ class Game:
         else:
             print("\nExiting KodeKloud Computer Quest. Goodbye!")
 
+    def show_job_output(self, line):
+        """Print a line from a background job over the prompt, then redraw the prompt"""
+        try:
+            import readline
+            typed = readline.get_line_buffer()
+        except (ImportError, AttributeError):
+            typed = ""
+        with self.output_lock:
+            print(f"\n{line}\n\n> {typed}", end="", flush=True)
+        
     def display_welcome(self):
         """Display welcome message and game introduction"""
         from computerquest.utils.helpers import Colors
@@ -570,169 +459,138 @@ class Game:
             # If successfully moved
             curr_location = self.player.location
             
-            # Mark newly visited components
-            curr_location.mark_visited()
+            # Routes may now pass through newly visited components
+            if curr_location.mark_visited() and self._router is not None:
+                self._router.invalidate()
             
-            # Update map - find which room this is
-            for room_id, room in self.game_map.rooms.items():
-                if room == curr_location:
-                    # Found the room ID
-                    if room_id in self.map_grid:
-                        self.map_grid[room_id]['visited'] = True
-                    break
+            # Update map
+            room_id = self.game_map.key_of(curr_location)
+            if room_id in self.map_grid:
+                self.map_grid[room_id]['visited'] = True
             
             # Update turn counter
             self.turns += 1
             
+            # Agents move once per turn
+            if self.entities is not None:
+                self.entities.tick()
+                self.entities.sync_play(curr_location)
+            
+            # Infection spreads once per turn
+            if self.spread is not None:
+                self.spread.reseed()
+                self.spread.step()
+                self.spread.apply()
+            
             # Add system architecture educational note on first visit
             if prev_location.name != curr_location.name:
-                # Create movement header with fancy styling
-                result = f"┏━━━━━━━━━━━━━━━━━━━━ MOVEMENT ━━━━━━━━━━━━━━━━━━━━┓\n"
-                result += f"  Moved from {prev_location.name} to {curr_location.name}.\n"
-                result += f"┗━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┛\n\n"
-                
-                # Use the new formatted look output for the current location
-                from computerquest.utils.helpers import format_look_output
-                
-                # Generate technical details if the component has been visited
-                technical_details = None
-                if curr_location.visited:
-                    technical_details = []
-                    if curr_location.security_level > 0:
-                        technical_details.append(f"Security Level: {curr_location.security_level}")
-                    if curr_location.data_types:
-                        technical_details.append(f"Data Types: {', '.join(curr_location.data_types)}")
-                    if any(curr_location.performance.values()):
-                        technical_details.append("Performance Metrics:")
-                        for metric, value in curr_location.performance.items():
-                            if value > 0:
-                                technical_details.append(f"  * {metric.capitalize()}: {value}/10")
-                
-                result += format_look_output(
-                    location=curr_location,
-                    connections=curr_location.doors,
-                    items=list(curr_location.items.keys()),
-                    technical_details=technical_details
-                )
-                
-                # Handle any NPCs or hostile entities
-                if curr_location.play:
-                    # In future versions, handle encounters here
-                    pass
-                    
-                return result
+                # Defer the banner, look output and any encounter until the result is displayed
+                return LazyText(self._render_move, prev_location.name, curr_location)
             else:
                 # This shouldn't happen with the current implementation
                 return f"You remain at {curr_location.name}."
         else:
             # Failed to move
-            return f"┏━━━━━━━━━━━━━━━━━━━━ ERROR ━━━━━━━━━━━━━━━━━━━━┓\n  There is no connection to the {direction} from {self.player.location.name}.\n┗━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┛"
-            
+            return ErrorText(f"┏━━━━━━━━━━━━━━━━━━━━ ERROR ━━━━━━━━━━━━━━━━━━━━┓\n  There is no connection to the {direction} from {self.player.location.name}.\n┗━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┛")
+
+    def _render_move(self, prev_name, curr_location):
+        """Build the movement banner and look output for a completed move"""
+        # Create movement header with fancy styling
+        result = f"┏━━━━━━━━━━━━━━━━━━━━ MOVEMENT ━━━━━━━━━━━━━━━━━━━━┓\n"
+        result += f"  Moved from {prev_name} to {curr_location.name}.\n"
+        result += f"┗━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┛\n\n"
+
+        # Use the formatted look output for the current location
+        result += render_location(curr_location)
+        
+        # Agents the player runs into
+        encounter = self.describe_encounter(curr_location)
+        if encounter:
+            result += f"\n\n{encounter}"
+        return result
+
+    def start_agents(self, count, seed=None):
+        """
+        Put autonomous agents in the world; they move once per turn
+        count: agents of each ENTITY_KINDS kind, placed in random components
+        seed: seed for placement and movement
+        """
+        import random
+        from collections import Counter
+        from computerquest.mechanics.entities import EntityEngine, KIND_NAMES
+        
+        self.entities = EntityEngine(self.game_map, seed)
+        rng = random.Random(seed)
+        keys = list(self.game_map.rooms)
+        for kind in KIND_NAMES:
+            for key, placed in Counter(rng.choice(keys) for _ in range(count)).items():
+                self.entities.spawn(kind, key, placed)
+        self.entities.sync_play(self.player.location)
+
+    def describe_encounter(self, location):
+        """
+        Agents in a component, e.g. "You encounter 2 Roaming Viruses and a Security Scanner."
+        Returns: The sentence, or "" if no agent is there
+        """
+        from computerquest.mechanics.entities import Agent
+        
+        counts = {}
+        for entity in location.play:
+            if isinstance(entity, Agent):
+                name = str(entity)
+                counts[name] = counts.get(name, 0) + 1
+        if not counts:
+            return ""
+        parts = [f"{count} {name}s" if count > 1 else f"a {name}" for name, count in counts.items()]
+        listed = parts[0] if len(parts) == 1 else ", ".join(parts[:-1]) + " and " + parts[-1]
+        return f"You encounter {listed}."
+
     def display_map(self):
         """
         Display an interactive map of visited rooms
         Returns: ASCII map showing explored components
         """
+        if not self.has_default_layout:
+            return self.layout_unavailable("map")
+        
         from computerquest.utils.map_renderer import render_map
         
         # Make sure starting room is always marked as visited
-        for room_id, room in self.game_map.rooms.items():
-            if room == self.player.location:
-                if room_id in self.map_grid:
-                    self.map_grid[room_id]['visited'] = True
-                break
+        room_id = self.game_map.key_of(self.player.location)
+        if room_id in self.map_grid:
+            self.map_grid[room_id]['visited'] = True
                 
         # Generate and return the map
         return render_map(self, self.map_grid)
             
     def show_help(self):
         """Show available commands"""
-        from computerquest.utils.helpers import Colors
-        
-        help_text = f"""┏━━━━━━━━━━━━━━━━━━ {Colors.YELLOW}{Colors.BOLD}KODEKLOUD COMPUTER QUEST COMMANDS{Colors.RESET} ━━━━━━━━━━━━━━━━━━┓
-│                                                                          │
-│  {Colors.BOLD}Movement:{Colors.RESET}                                                               │
-│    go [direction]   - Move between components (n, s, e, w, ne, sw, etc.) │
-│    [direction]      - You can also just type the direction (n, s, e, w)  │
-│                                                                          │
-│  {Colors.BOLD}Exploration:{Colors.RESET}                                                            │
-│    {Colors.GREEN}look, l{Colors.RESET}          - Examine your current location                      │
-│    {Colors.GREEN}look [item]{Colors.RESET}      - Examine a specific item                            │
-│    {Colors.GREEN}read [item], r{Colors.RESET}   - Read text content of an item                       │
-│    {Colors.GREEN}map, m{Colors.RESET}           - Display a map of visited computer components       │
-│    {Colors.GREEN}motherboard, mb{Colors.RESET}  - Show the motherboard layout of the computer system │
-│                                                                          │
-│  {Colors.BOLD}Inventory:{Colors.RESET}                                                              │
-│    {Colors.GREEN}inventory, i{Colors.RESET}     - List items in your storage                         │
-│    {Colors.GREEN}take [item], t{Colors.RESET}   - Add an item to your inventory                      │
-│    {Colors.GREEN}drop [item]{Colors.RESET}      - Remove an item from your inventory                 │
-│                                                                          │
-│  {Colors.BOLD}Security Functions:{Colors.RESET}                                                     │
-│    {Colors.GREEN}scan, s{Colors.RESET}          - Search for viruses in current location             │
-│    {Colors.GREEN}scan [item]{Colors.RESET}      - Check if a specific item contains a virus          │
-│    {Colors.GREEN}advscan{Colors.RESET}          - Perform advanced scan (requires decoder_tool)      │
-│    {Colors.GREEN}advscan [item]{Colors.RESET}   - Perform advanced scan on specific item             │
-│    {Colors.GREEN}analyze [item]{Colors.RESET}   - Deeply analyze an item for hidden properties       │
-│    {Colors.GREEN}quarantine [virus]{Colors.RESET} - Contain a discovered virus                       │
-│                                                                          │
-│  {Colors.BOLD}Information:{Colors.RESET}                                                            │
-│    {Colors.GREEN}status{Colors.RESET}           - Check your virus discovery progress                │
-│    {Colors.GREEN}knowledge{Colors.RESET}        - View your computer architecture knowledge          │
-│    {Colors.GREEN}about [topic]{Colors.RESET}    - Get information about a computer component         │
-│                                                                          │
-│  {Colors.BOLD}Progress Tracking:{Colors.RESET}                                                      │
-│    {Colors.GREEN}achievements{Colors.RESET}     - View your achievements and progress report         │
-│    {Colors.GREEN}stats{Colors.RESET}            - Alternative command for achievements               │
-│                                                                          │
-│  {Colors.BOLD}Educational Features:{Colors.RESET}                                                   │
-│    {Colors.GREEN}visualize [comp]{Colors.RESET} - Show visualization of a component                  │
-│    {Colors.GREEN}viz [comp]{Colors.RESET}       - Shorthand for visualize                            │
-│    {Colors.GREEN}simulate cpu{Colors.RESET}     - Start CPU pipeline simulation minigame             │
-│    {Colors.GREEN}simulate memory{Colors.RESET}  - Start memory hierarchy simulation                  │
-│    {Colors.GREEN}simulate step{Colors.RESET}    - Advance simulation by one step                     │
-│    {Colors.GREEN}simulate toggle{Colors.RESET}  - Toggle between simulation modes                    │
-│    {Colors.GREEN}simulate reset{Colors.RESET}   - Reset the simulation                               │
-│                                                                          │
-│  {Colors.BOLD}Save/Load:{Colors.RESET}                                                              │
-│    {Colors.GREEN}save [name]{Colors.RESET}      - Save your game progress (optional name)            │
-│    {Colors.GREEN}load [name]{Colors.RESET}      - Load a saved game                                  │
-│    {Colors.GREEN}saves{Colors.RESET}            - List all available save files                      │
-│    {Colors.GREEN}deletesave [name]{Colors.RESET} - Delete a saved game                               │
-│                                                                          │
-│  {Colors.BOLD}System:{Colors.RESET}                                                                 │
-│    {Colors.GREEN}help, h{Colors.RESET}          - Show this help message                             │
-│    {Colors.GREEN}?{Colors.RESET}                - Show quick help overlay                            │
-│    {Colors.GREEN}clear, cls, c{Colors.RESET}    - Clear the screen and refresh display               │
-│    {Colors.GREEN}quit, q, exit{Colors.RESET}    - Exit the game                                      │
-│                                                                          │
-┗━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┛
-
-{Colors.BOLD}Main Shortcuts:{Colors.RESET}
-  Movement: {Colors.GREEN}[N]{Colors.RESET}orth {Colors.GREEN}[S]{Colors.RESET}outh {Colors.GREEN}[E]{Colors.RESET}ast {Colors.GREEN}[W]{Colors.RESET}est {Colors.GREEN}[NE]{Colors.RESET} {Colors.GREEN}[SE]{Colors.RESET} {Colors.GREEN}[SW]{Colors.RESET} {Colors.GREEN}[NW]{Colors.RESET} {Colors.CYAN}[U]{Colors.RESET}p {Colors.CYAN}[D]{Colors.RESET}own
-  Commands: {Colors.GREEN}[L]{Colors.RESET}ook {Colors.GREEN}[I]{Colors.RESET}nventory {Colors.GREEN}[T]{Colors.RESET}ake {Colors.GREEN}[H]{Colors.RESET}elp {Colors.GREEN}[M]{Colors.RESET}ap {Colors.GREEN}[C]{Colors.RESET}lear {Colors.GREEN}[Q]{Colors.RESET}uit {Colors.GREEN}[S]{Colors.RESET}can
-  
-Use '{Colors.GREEN}?{Colors.RESET}' for a quick command reference at any time.
-"""
-        return help_text
+        from computerquest.utils.help_text import full_help
+        return full_help()
         
+    @_holding_state_lock
     def start_cpu_minigame(self):
         """Start the CPU pipeline simulation minigame"""
         if self.player.knowledge['cpu'] < 3:
             return "You need more knowledge about CPU architecture to understand this simulation. Explore CPU components and learn more first."
         
+        from computerquest.mechanics.minigames.cpu_pipeline import CPUPipelineMinigame
         self.current_minigame = CPUPipelineMinigame(self)
         
         return self.current_minigame.explain() + "\n\n" + self.current_minigame.get_status() + "\n\nUse 'simulate step' to advance the simulation, 'simulate toggle' to switch modes, and 'simulate reset' to restart."
         
+    @_holding_state_lock
     def start_memory_minigame(self):
         """Start the memory hierarchy simulation minigame"""
         if self.player.knowledge['memory'] < 3:
             return "You need more knowledge about memory systems to understand this simulation. Explore memory components and learn more first."
         
+        from computerquest.mechanics.minigames.memory_hierarchy import MemoryHierarchyMinigame
         self.current_minigame = MemoryHierarchyMinigame(self)
         
         return self.current_minigame.explain()
         
+    @_holding_state_lock
     def handle_visualization(self, viz_type=None):
         """Handle visualization commands"""
         if not viz_type or viz_type in ['help', 'list', '?']:
@@ -776,6 +634,7 @@ Usage: viz [type] (e.g., 'viz cpu')"""
         else:
             return f"Unknown visualization type: {viz_type}. Try 'cpu', 'memory', 'network', 'storage', or 'motherboard'."
             
+    @_holding_state_lock
     def handle_simulation(self, action=None):
         """Handle simulation commands"""
         if not self.current_minigame:
@@ -807,97 +666,14 @@ Usage: viz [type] (e.g., 'viz cpu')"""
             
     def get_component_info(self, topic):
         """Provide educational information about computer components"""
-        topics = {
-            "cpu": """CPU (Central Processing Unit):
-The CPU is the primary component that executes instructions and processes data. It consists of:
-- Control Unit: Coordinates CPU operations and decodes instructions
-- ALU (Arithmetic Logic Unit): Performs mathematical calculations
-- Registers: Ultra-fast storage locations for immediate data
-- Cache: Fast memory that stores frequently used data
-The CPU operates using a cycle of fetch, decode, execute, and writeback phases.""",
-
-            "memory": """Computer Memory Hierarchy:
-Computer systems use multiple types of memory arranged in a hierarchy:
-1. Registers: Tiny, ultra-fast storage inside the CPU
-2. Cache Memory: Small, very fast memory close to the CPU (L1, L2, L3)
-3. RAM: Main system memory, volatile (erased when powered off)
-4. Virtual Memory: Uses hard drive space as an extension of RAM
-5. Storage: HDD/SSD for permanent data storage
-As you move down the hierarchy, capacity increases but speed decreases.""",
-
-            "cache": """Cache Memory:
-Cache memory serves as a high-speed buffer between the CPU and main memory.
-- L1 Cache: Smallest, fastest cache, located in the CPU
-- L2 Cache: Larger but slightly slower than L1
-- L3 Cache: Largest but slowest cache, often shared between CPU cores
-Caches use principles of temporal locality (recently used data will be used again soon) and spatial locality (data near recently used data will be used soon).""",
-
-            "storage": """Storage Systems:
-Storage provides permanent data retention, unlike volatile RAM:
-- SSD (Solid State Drive): Uses flash memory, no moving parts, fast
-- HDD (Hard Disk Drive): Uses magnetic storage on spinning platters
-- Storage Controller: Manages data flow between system and storage
-- File Systems: Organize data into files and directories
-Storage operations are much slower than memory but retain data without power.""",
-
-            "bus": """System Bus Architecture:
-Buses are communication pathways that transfer data between components:
-- System Bus: Main pathway connecting CPU, memory, and I/O
-- Address Bus: Carries memory addresses
-- Data Bus: Carries the actual data being transferred
-- Control Bus: Carries command signals
-- PCI/PCIe: High-speed buses for connecting expansion cards
-Bus width (16, 32, 64-bit) determines how much data can be transferred at once.""",
-
-            "network": """Network Interface:
-The network component connects the computer to other systems:
-- Network Interface Card: Hardware that enables network connectivity
-- Protocol Stack: Software layers that format and process network data
-- Packets: Units of data transferred over networks
-- Protocols: Rules that govern how data is transmitted (e.g., TCP/IP)
-Network interfaces handle encoding/decoding data and managing connections.""",
-
-            "firmware": """Firmware/BIOS:
-Firmware is software permanently programmed into hardware:
-- BIOS/UEFI: Initialize hardware components during boot
-- ROM (Read-Only Memory): Stores permanent firmware
-- Boot Sequence: Process of starting up computer hardware
-- Hardware Configuration: Settings for system components
-Firmware operates at a lower level than the operating system.""",
-
-            "gpu": """Graphics Processing Unit (GPU):
-The GPU specializes in parallel processing for graphics and computation:
-- Shader Cores: Small processors that handle graphical calculations
-- VRAM: Specialized memory for storing graphical data
-- Render Pipeline: Stages for transforming 3D data to 2D images
-- GPGPU: General-purpose computing on GPUs for non-graphics tasks
-GPUs excel at tasks that can be broken into many parallel operations.""",
-
-            "kernel": """Operating System Kernel:
-The kernel is the core of the operating system:
-- Process Management: Creates and schedules processes
-- Memory Management: Allocates and tracks system memory
-- Device Drivers: Interfaces with hardware components
-- File Systems: Manages data storage and retrieval
-- System Calls: Provides services to applications
-The kernel operates in a privileged mode with direct hardware access.""",
-
-            "virus": """Computer Viruses:
-Viruses are malicious programs that can damage systems:
-- Boot Sector Virus: Infects system startup areas
-- Rootkit: Hides in the operating system kernel
-- Memory-Resident Virus: Operates entirely in RAM
-- Firmware Virus: Infects system firmware/BIOS
-- Network Virus: Spreads via network connections
-Viruses typically attempt to hide their presence and propagate to other systems."""
-        }
+        from computerquest.utils.help_text import ABOUT_TOPICS as topics
         
         if topic in topics:
             return topics[topic]
         else:
-            related_topics = []
+            related_topics = self.topic_index.suggest(topic)
             for key in topics:
-                if key in topic or topic in key:
+                if (key in topic or topic in key) and key not in related_topics:
                     related_topics.append(key)
                     
             if related_topics:
@@ -907,6 +683,9 @@ Viruses typically attempt to hide their presence and propagate to other systems.
                 
     def display_motherboard(self):
         """Display the full motherboard layout of the computer system"""
+        if not self.has_default_layout:
+            return self.layout_unavailable("motherboard layout")
+        
         motherboard = [
             "+------------------------------------------------------------------+",
             "|               KodeKloud Computer Quest Motherboard Layout       |",
@@ -997,21 +776,14 @@ Your final statistics:
 Thank you for playing KodeKloud Computer Quest!
 """.format(
     turns=self.turns,
-    components=sum(1 for room in self.game_map.rooms.values() if room.visited),
+    components=self.progress.visited_count,
     total_components=len(self.game_map.rooms),
     knowledge_level=sum(self.player.knowledge.values())
 )
         
     def _match_command_prefix(self, cmd):
         """Match command prefix with valid commands, return full command if unique match found"""
-        if len(cmd) < 2:
-            return cmd  # Don't try to match single-letter commands
-            
-        # Get all command keys from the command processor
-        valid_commands = list(self.command_processor.commands.keys())
-        
-        # Use the helper function
-        return prefix_match(cmd, valid_commands)
+        return self.command_processor.resolve_command(cmd).name
             
     def _match_item_prefix(self, item_prefix):
         """Match item prefix with items in current room, return full item name if unique match found"""
@@ -1021,8 +793,8 @@ Thank you for playing KodeKloud Computer Quest!
         # Get all items in current room
         room_items = list(self.player.location.items.keys())
         
-        # Use the helper function
-        return prefix_match(item_prefix, room_items)
+        # Use the helper function, falling back to the nearest spelling
+        return self._match_item(item_prefix, room_items)
             
     def _match_inventory_item_prefix(self, item_prefix):
         """Match item prefix with items in inventory, return full item name if unique match found"""
@@ -1032,5 +804,12 @@ Thank you for playing KodeKloud Computer Quest!
         # Get all items in inventory
         inventory_items = list(self.player.items.keys())
         
-        # Use the helper function
-        return prefix_match(item_prefix, inventory_items)
\ No newline at end of file
+        # Use the helper function, falling back to the nearest spelling
+        return self._match_item(item_prefix, inventory_items)
+
+    def _match_item(self, item_prefix, items):
+        """Prefix match against items, then correct a misspelling if only one item is close"""
+        match = prefix_match(item_prefix, items)
+        if match in items:
+            return match
+        return self.item_index.correct(item_prefix, items) or item_prefix
\ No newline at end of file
@@ -0,0 +1,188 @@
+"""
+Achievement definitions
+
+Achievements are defined in a data file as threshold expressions over
+named progress metrics, such as "visited_count >= 10" or
+"knowledge.cpu >= max_knowledge". Each file is compiled once per process
+into AchievementRule records shared by every game: the expressions become
+(metric, comparison, operand) tests ordered cheapest first, and the
+metrics they read become the rule's dependencies. A game keeps only which
+achievements it has unlocked.
+"""
+
+import json
+import operator
+import os
+from collections import namedtuple
+from typing import Dict, Tuple
+from computerquest.config import DATA_DIR, KNOWLEDGE_AREAS, MAX_KNOWLEDGE, VIRUS_TYPES
+
+ACHIEVEMENT_FILE = "achievements_data.json"
+
+# Metrics the progress system provides to achievement tests
+METRICS = frozenset(
+    ["visited_count", "room_count", "found_count", "quarantined_count", "turns", "victory",
+     "knowledge.total", "knowledge.min"]
+    + [f"knowledge.{area}" for area in KNOWLEDGE_AREAS]
+)
+
+# Names usable as operands that stand for fixed values
+CONSTANTS = {
+    "true": True,
+    "false": False,
+    "max_knowledge": MAX_KNOWLEDGE,
+    "virus_count": len(VIRUS_TYPES),
+}
+
+COMPARISONS = {
+    ">=": operator.ge,
+    "<=": operator.le,
+    ">": operator.gt,
+    "<": operator.lt,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+# Relative cost of a test: comparing with a fixed value needs one metric lookup, with a metric two
+CONSTANT_COST = 1
+METRIC_COST = 2
+
+class AchievementDataError(ValueError):
+    """The achievement file is missing, unreadable or has an invalid definition"""
+
+# metric: metric on the left-hand side
+# compare: comparison function from COMPARISONS
+# value: fixed right-hand side, when other is None
+# other: metric on the right-hand side, or None
+Test = namedtuple('Test', ['metric', 'compare', 'value', 'other'])
+
+class AchievementRule(namedtuple('AchievementRule', ['id', 'name', 'description', 'tests', 'depends',
+                                                      'cost', 'reward'])):
+    """
+    A compiled achievement
+
+    tests: Test tuples, all of which must pass, cheapest first
+    depends: frozenset of the metrics the tests read
+    cost: total cost of the tests
+    reward: reward applied on unlocking (see ProgressSystem.apply_reward), or None
+    """
+    __slots__ = ()
+
+    def test(self, metrics):
+        """
+        Check the rule against current metric values
+
+        Args:
+            metrics (dict): Metric name -> value
+
+        Returns:
+            bool: True if every test passes
+        """
+        for metric, compare, value, other in self.tests:
+            if not compare(metrics[metric], value if other is None else metrics[other]):
+                return False
+        return True
+
+def _fail(achievement_id, message):
+    """Raise an AchievementDataError for an entry"""
+    raise AchievementDataError(f"{ACHIEVEMENT_FILE}: {achievement_id}: {message}")
+
+def compile_test(achievement_id, expression):
+    """
+    Compile one threshold expression
+
+    Args:
+        achievement_id (str): Achievement the expression belongs to, for errors
+        expression (str): "<metric> <comparison> <operand>", where the operand
+            is an integer, a name from CONSTANTS or another metric
+
+    Returns:
+        tuple: (Test, cost)
+
+    Raises:
+        AchievementDataError: If the expression is malformed
+    """
+    if not isinstance(expression, str) or len(expression.split()) != 3:
+        _fail(achievement_id, f"expected '<metric> <comparison> <value>', got {expression!r}")
+    metric, comparison, operand = expression.split()
+    if metric not in METRICS:
+        _fail(achievement_id, f"unknown metric '{metric}'")
+    if comparison not in COMPARISONS:
+        _fail(achievement_id, f"unknown comparison '{comparison}'")
+
+    compare = COMPARISONS[comparison]
+    if operand in METRICS:
+        return Test(metric, compare, None, operand), METRIC_COST
+    if operand in CONSTANTS:
+        return Test(metric, compare, CONSTANTS[operand], None), CONSTANT_COST
+    try:
+        return Test(metric, compare, int(operand), None), CONSTANT_COST
+    except ValueError:
+        _fail(achievement_id, f"'{operand}' is not a number, constant or metric")
+
+def compile_achievements(definitions):
+    """
+    Compile the contents of an achievement file
+
+    Args:
+        definitions (dict): Achievement id -> {"name", "description", "when", "reward"}
+
+    Returns:
+        tuple: AchievementRule records in file order
+
+    Raises:
+        AchievementDataError: If any entry is invalid
+    """
+    if not isinstance(definitions, dict):
+        raise AchievementDataError(f"{ACHIEVEMENT_FILE}: expected an object at the top level")
+    rules = []
+    for achievement_id, entry in definitions.items():
+        if not isinstance(entry, dict):
+            _fail(achievement_id, "entry must be an object")
+        for field in ('name', 'description'):
+            if not isinstance(entry.get(field), str) or not entry[field]:
+                _fail(achievement_id, f"'{field}' must be a non-empty string")
+        when = entry.get('when')
+        if not isinstance(when, list) or not when:
+            _fail(achievement_id, "'when' must be a non-empty list of expressions")
+        reward = entry.get('reward')
+        if reward is not None and not isinstance(reward, dict):
+            _fail(achievement_id, "'reward' must be an object")
+
+        compiled = sorted((compile_test(achievement_id, expression) for expression in when),
+                          key=lambda compiled_test: compiled_test[1])
+        tests = tuple(test for test, _ in compiled)
+        depends = frozenset(test.metric for test in tests) | frozenset(
+            test.other for test in tests if test.other is not None)
+        rules.append(AchievementRule(achievement_id, entry['name'], entry['description'], tests, depends,
+                                     sum(cost for _, cost in compiled), reward))
+    return tuple(rules)
+
+# Compiled achievement files, by path; shared by every game in the process
+_compiled: Dict[str, Tuple[AchievementRule, ...]] = {}
+
+def load_achievements(path=None):
+    """
+    Compiled achievements of a file, compiling it on first use
+
+    Args:
+        path (str): Achievement file (defaults to the one in DATA_DIR)
+
+    Returns:
+        tuple: AchievementRule records in file order
+
+    Raises:
+        AchievementDataError: If the file is missing or invalid
+    """
+    path = path or os.path.join(DATA_DIR, ACHIEVEMENT_FILE)
+    rules = _compiled.get(path)
+    if rules is None:
+        try:
+            with open(path, encoding='utf-8') as f:
+                definitions = json.load(f)
+        except OSError as e:
+            raise AchievementDataError(f"{ACHIEVEMENT_FILE}: cannot read file ({e.strerror})")
+        except ValueError as e:
+            raise AchievementDataError(f"{ACHIEVEMENT_FILE}: invalid JSON ({e})")
+        rules = _compiled[path] = compile_achievements(definitions)
+    return rules
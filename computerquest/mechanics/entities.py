@@ -0,0 +1,233 @@
+"""
+Entity engine
+
+Moves autonomous agents (roaming viruses, helper daemons, security
+scanners) around a world's door graph. Agents are stored as parallel
+arrays of location index, kind, state and timer rather than as objects,
+and every tick advances all of them at once: each agent whose timer runs
+out steps to a random neighbor picked from a CSR adjacency table built
+from the world's WorldGraph. With NumPy installed the whole tick is a
+handful of array operations; without it the same steps run in a loop.
+
+Agents only become objects when someone looks at them: sync_play fills a
+component's play list with Agent views of the agents standing in it.
+"""
+
+import random
+from array import array
+from computerquest.config import ENTITY_KINDS
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Agent states
+REMOVED = 0
+ACTIVE = 1
+
+KIND_NAMES = tuple(ENTITY_KINDS)
+
+class Agent:
+    """View of one agent, as placed in Component.play"""
+    __slots__ = ('engine', 'index')
+
+    def __init__(self, engine, index):
+        self.engine = engine
+        self.index = index
+
+    def __eq__(self, other):
+        return isinstance(other, Agent) and (self.engine, self.index) == (other.engine, other.index)
+
+    def __hash__(self):
+        return hash((id(self.engine), self.index))
+
+    @property
+    def kind(self):
+        """Kind name, a key of ENTITY_KINDS"""
+        return self.engine.kind_of(self.index)
+
+    @property
+    def location(self):
+        """Room key of the component the agent is in"""
+        return self.engine.location_of(self.index)
+
+    def __str__(self):
+        return self.kind.replace('_', ' ').title()
+
+class EntityEngine:
+    """Agents in a world, advanced together once per tick"""
+    def __init__(self, world, seed=None):
+        self.world = world
+        self.periods = [ENTITY_KINDS[name] for name in KIND_NAMES]  # Kind -> ticks between moves
+        self.ticks = 0
+        self._generation = None  # WorldGraph generation the adjacency table was built for
+        self._keys = []          # Graph keys the agent locations refer to
+        if np is not None:
+            self._rng = np.random.default_rng(seed)
+            self._periods = np.array(self.periods, dtype=np.int32)
+            self.location = np.zeros(0, dtype=np.int32)
+            self.kind = np.zeros(0, dtype=np.int8)
+            self.state = np.zeros(0, dtype=np.int8)
+            self.timer = np.zeros(0, dtype=np.int32)
+        else:
+            self._rng = random.Random(seed)
+            self.location = array('i')
+            self.kind = array('b')
+            self.state = array('b')
+            self.timer = array('i')
+
+    def __len__(self):
+        """Number of agents that have not been removed"""
+        if np is not None:
+            return int((self.state == ACTIVE).sum())
+        return sum(1 for state in self.state if state == ACTIVE)
+
+    def _refresh(self):
+        """Rebuild the adjacency table when the world's doors changed"""
+        graph = self.world.graph
+        graph.refresh()
+        if graph.generation == self._generation:
+            return
+
+        # Rooms may have been added or removed; follow agents by room key
+        if self._keys and self._keys != graph.keys:
+            remap = [graph.index.get(key, -1) for key in self._keys]
+            if np is not None:
+                moved = np.array(remap, dtype=np.int32)[self.location]
+                self.state[moved < 0] = REMOVED
+                self.location = np.maximum(moved, 0)
+            else:
+                for i, location in enumerate(self.location):
+                    moved = remap[location]
+                    if moved < 0:
+                        self.state[i] = REMOVED
+                    self.location[i] = max(moved, 0)
+
+        offsets = [0]
+        neighbors = []
+        for targets in graph.targets:
+            neighbors.extend(targets)
+            offsets.append(len(neighbors))
+        if np is not None:
+            self._offsets = np.array(offsets, dtype=np.int32)
+            self._neighbors = np.array(neighbors, dtype=np.int32)
+        else:
+            self._offsets = array('i', offsets)
+            self._neighbors = array('i', neighbors)
+        self._keys = list(graph.keys)
+        self._generation = graph.generation
+
+    def spawn(self, kind, room_key, count=1):
+        """
+        Add agents
+
+        Args:
+            kind (str): Agent kind, a key of ENTITY_KINDS
+            room_key (str): Room to place them in
+            count (int): Number of agents
+
+        Returns:
+            range: Indexes of the new agents
+        """
+        self._refresh()
+        kind_index = KIND_NAMES.index(kind)
+        location = self.world.graph.index[room_key]
+        period = self.periods[kind_index]
+        first = len(self.location)
+        if np is not None:
+            self.location = np.concatenate([self.location, np.full(count, location, dtype=np.int32)])
+            self.kind = np.concatenate([self.kind, np.full(count, kind_index, dtype=np.int8)])
+            self.state = np.concatenate([self.state, np.full(count, ACTIVE, dtype=np.int8)])
+            self.timer = np.concatenate([self.timer, np.full(count, period, dtype=np.int32)])
+        else:
+            self.location.extend([location] * count)
+            self.kind.extend([kind_index] * count)
+            self.state.extend([ACTIVE] * count)
+            self.timer.extend([period] * count)
+        return range(first, first + count)
+
+    def remove(self, index):
+        """Take an agent out of the world"""
+        self.state[index] = REMOVED
+
+    def kind_of(self, index):
+        """Kind name of an agent"""
+        return KIND_NAMES[self.kind[index]]
+
+    def location_of(self, index):
+        """Room key of an agent's component, or None if it was removed"""
+        self._refresh()
+        if self.state[index] != ACTIVE:
+            return None
+        return self._keys[self.location[index]]
+
+    def at(self, room_key):
+        """Indexes of the agents in a component"""
+        self._refresh()
+        location = self.world.graph.index[room_key]
+        if np is not None:
+            return [int(i) for i in np.flatnonzero((self.location == location) & (self.state == ACTIVE))]
+        return [i for i, (here, state) in enumerate(zip(self.location, self.state))
+                if here == location and state == ACTIVE]
+
+    def tick(self, ticks=1):
+        """Advance every agent by a number of ticks"""
+        self._refresh()
+        for _ in range(ticks):
+            if np is not None:
+                self._tick_arrays()
+            else:
+                self._tick_loop()
+            self.ticks += 1
+
+    def _tick_arrays(self):
+        """One tick with NumPy: count down timers and move every due agent"""
+        active = self.state == ACTIVE
+        self.timer -= active
+        due = np.flatnonzero(active & (self.timer <= 0))
+        if not len(due):
+            return
+
+        location = self.location[due]
+        start = self._offsets[location]
+        degree = self._offsets[location + 1] - start
+        pick = start + (self._rng.random(len(due)) * degree).astype(np.int32)
+        movable = degree > 0
+        self.location[due[movable]] = self._neighbors[pick[movable]]
+        self.timer[due] = self._periods[self.kind[due]]
+
+    def _tick_loop(self):
+        """One tick without NumPy, doing the same steps agent by agent"""
+        offsets = self._offsets
+        neighbors = self._neighbors
+        periods = self.periods
+        location = self.location
+        timer = self.timer
+        kind = self.kind
+        rand = self._rng.random
+        for i, state in enumerate(self.state):
+            if state != ACTIVE:
+                continue
+            timer[i] -= 1
+            if timer[i] > 0:
+                continue
+            here = location[i]
+            start = offsets[here]
+            degree = offsets[here + 1] - start
+            if degree:
+                location[i] = neighbors[start + int(rand() * degree)]
+            timer[i] = periods[kind[i]]
+
+    def sync_play(self, room):
+        """
+        Make a component's play list show the agents in it
+
+        Entities that are not agents of this engine, such as NPC players,
+        are left in place.
+        """
+        key = self.world.key_of(room)
+        if key is None:
+            return
+        kept = [entity for entity in room.play if not (isinstance(entity, Agent) and entity.engine is self)]
+        room.play = kept + [Agent(self, index) for index in self.at(key)]
@@ -0,0 +1,176 @@
+"""
+Background jobs
+
+Runs long-running commands in worker threads so the prompt stays
+responsive. Jobs stream progress lines through a queue, can be cancelled
+cooperatively, and hand their result back to the game loop when done.
+Once a job is moved to the background, its lines and result are passed
+to JobManager.output from the worker thread as they arrive, when an
+output function is set; otherwise they wait for drain().
+"""
+
+import itertools
+import queue
+import threading
+from computerquest.utils.helpers import ErrorText
+
+class JobCancelled(Exception):
+    """Raised inside a job that noticed it was cancelled"""
+
+class Job:
+    """A command running in a worker thread"""
+    def __init__(self, job_id, name):
+        self.id = job_id
+        self.name = name
+        self.state = "running"  # running, done, cancelled or failed
+        self.result = None
+        self.updates = queue.Queue()  # Progress lines not yet shown
+        self.done = threading.Event()
+        self.background = False  # Set once the caller stopped waiting for it
+        self.on_update = None    # Called after each progress line or on finishing
+        self._cancel = threading.Event()
+
+    @property
+    def cancelled(self):
+        """True once cancel() has been requested"""
+        return self._cancel.is_set()
+
+    def cancel(self):
+        """Ask the job to stop at its next checkpoint"""
+        self._cancel.set()
+
+    def report(self, line):
+        """Stream a progress line to the player"""
+        self.updates.put(line)
+        if self.on_update is not None:
+            self.on_update(self)
+
+    def checkpoint(self):
+        """Raise JobCancelled if the job has been cancelled"""
+        if self._cancel.is_set():
+            raise JobCancelled()
+
+    def wait(self, timeout=None):
+        """Wait for the job to finish; returns True if it did"""
+        return self.done.wait(timeout)
+
+class JobManager:
+    """Starts, tracks and collects background jobs"""
+    def __init__(self):
+        self.jobs = {}  # id -> Job, until its result has been collected
+        self.output = None  # Called with each line of background jobs, from their threads
+        self._ids = itertools.count(1)
+        self._lock = threading.RLock()
+
+    def submit(self, name, fn):
+        """
+        Run fn(job) in a worker thread
+
+        Args:
+            name (str): Label shown in progress and job listings
+            fn (callable): Work to run; receives the Job for progress and cancellation
+
+        Returns:
+            Job: The started job
+        """
+        with self._lock:
+            job = Job(next(self._ids), name)
+            job.on_update = self._stream
+            self.jobs[job.id] = job
+
+        def run():
+            try:
+                result = fn(job)
+                # Render lazy text in the worker so the game loop never pays for
+                # it; strings, including ErrorText, are kept as they are
+                job.result = result if isinstance(result, str) else str(result)
+                job.state = "cancelled" if job.cancelled else "done"
+            except JobCancelled:
+                job.state = "cancelled"
+            except Exception as e:
+                job.state = "failed"
+                job.result = ErrorText(f"{name} failed: {e}")
+            finally:
+                job.done.set()
+                self._stream(job)
+
+        threading.Thread(target=run, name=f"computerquest-job-{job.id}", daemon=True).start()
+        return job
+
+    def to_background(self, job):
+        """
+        Stop waiting for a job; its output is streamed from now on
+
+        Returns:
+            bool: False if the job already finished and should be collected
+        """
+        with self._lock:
+            if job.done.is_set():
+                return False
+            job.background = True
+        self._stream(job)
+        return True
+
+    def _stream(self, job):
+        """Pass a background job's new lines, and its result once done, to output"""
+        if self.output is None or not job.background:
+            return
+        with self._lock:
+            for line in self._take_lines(job):
+                self.output(line)
+
+    def _take_lines(self, job):
+        """A job's progress lines not yet shown, and its result if it finished"""
+        lines = []
+        finished = job.done.is_set()
+        while True:
+            try:
+                lines.append(f"[job #{job.id}] {job.updates.get_nowait()}")
+            except queue.Empty:
+                break
+        if finished and job.id in self.jobs:
+            lines.append(f"[job #{job.id}] {job.name} finished:\n{self.collect(job)}")
+        return lines
+
+    def running(self):
+        """Jobs that have not finished yet"""
+        return [job for job in self.jobs.values() if not job.done.is_set()]
+
+    def cancel(self, job_id=None):
+        """
+        Cancel a job, or the most recent running one
+
+        Returns:
+            Job: The cancelled job, or None if there was nothing to cancel
+        """
+        with self._lock:
+            if job_id is None:
+                candidates = self.running()
+                job = candidates[-1] if candidates else None
+            else:
+                job = self.jobs.get(job_id)
+        if job is None or job.done.is_set():
+            return None
+        job.cancel()
+        return job
+
+    def collect(self, job):
+        """Take a finished job's result and forget the job"""
+        with self._lock:
+            self.jobs.pop(job.id, None)
+        if job.state == "cancelled":
+            return ErrorText(f"Job #{job.id} ({job.name}) was cancelled.")
+        return job.result
+
+    def drain(self):
+        """
+        Progress lines and results that arrived since the last call
+
+        Returns:
+            list: Lines to show the player, oldest first
+        """
+        lines = []
+        with self._lock:
+            for job in list(self.jobs.values()):
+                lines.extend(self._take_lines(job))
+        return lines
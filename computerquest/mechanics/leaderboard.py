@@ -0,0 +1,255 @@
+"""
+Leaderboard
+
+Keeps finished runs in a local SQLite database in WAL mode, so reads
+are not blocked by a write in progress. Runs are indexed by score overall,
+per world pack and per cohort (by default the ISO week the run finished),
+so top-k queries read k index entries whatever the size of the table.
+
+Recording a run never blocks the game loop: runs are queued and a
+background writer thread stores them in batches, one transaction each.
+Games share one Leaderboard per database (see get_leaderboard), so runs
+from every game in the process go through a single writer. A batch that
+fails to insert is retried run by run; runs that still fail are reported
+on stderr and dropped, and the writer carries on.
+"""
+
+import atexit
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import time
+from collections import namedtuple
+from typing import Dict
+from computerquest.config import (SAVE_DIR, LEADERBOARD_FILE, LEADERBOARD_PATH_ENV, LEADERBOARD_BATCH_SIZE,
+                                  LEADERBOARD_FLUSH_INTERVAL, LEADERBOARD_SIZE)
+
+# player: who played the run
+# score: ProgressSystem.calculate_score() at the end of the run
+# turns: turns taken
+# achievements: achievements unlocked
+# world: world pack name, or "generated" for generated machines
+# seed: generator seed for generated machines, otherwise None
+# duration: seconds from the start of the game to the end of the run
+# cohort: group the run is ranked in besides overall and per world
+# finished: Unix time the run finished
+Run = namedtuple('Run', ['player', 'score', 'turns', 'achievements', 'world', 'seed', 'duration', 'cohort',
+                         'finished'])
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    turns INTEGER NOT NULL,
+    achievements INTEGER NOT NULL,
+    world TEXT NOT NULL,
+    seed INTEGER,
+    duration REAL NOT NULL,
+    cohort TEXT NOT NULL,
+    finished REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_score ON runs (score DESC, turns);
+CREATE INDEX IF NOT EXISTS runs_by_world ON runs (world, score DESC, turns);
+CREATE INDEX IF NOT EXISTS runs_by_cohort ON runs (cohort, score DESC, turns);
+"""
+
+COLUMNS = ', '.join(Run._fields)
+INSERT = f"INSERT INTO runs ({COLUMNS}) VALUES ({', '.join('?' * len(Run._fields))})"
+
+# Markers the writer thread understands besides runs
+_FLUSH = object()  # Write what is queued now instead of waiting for a full batch
+_STOP = object()   # Write what is queued and exit
+
+def leaderboard_path():
+    """Path of the leaderboard database"""
+    override = os.environ.get(LEADERBOARD_PATH_ENV)
+    if override:
+        return override
+    return os.path.join(os.path.expanduser("~"), SAVE_DIR, LEADERBOARD_FILE)
+
+def cohort_of(finished):
+    """Default cohort of a run: the ISO week it finished in, e.g. "2026-W42" """
+    return time.strftime("%G-W%V", time.localtime(finished))
+
+class Leaderboard:
+    """Finished runs in a SQLite database, written in the background"""
+    def __init__(self, path=None, batch_size=LEADERBOARD_BATCH_SIZE, flush_interval=LEADERBOARD_FLUSH_INTERVAL):
+        self.path = path or leaderboard_path()
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._pending = queue.Queue()  # Runs and markers for the writer
+        self._writer = None
+        self._lock = threading.Lock()
+        self.failed = 0  # Runs the writer could not store
+        self._db = self._connect()  # Used for queries; the writer has its own connection
+        self._db.executescript(SCHEMA)
+
+    def _connect(self):
+        """Open a connection in WAL mode"""
+        db = sqlite3.connect(self.path, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")  # WAL stays consistent; only the last batches can be lost
+        return db
+
+    def record(self, run):
+        """Queue a finished run for the background writer"""
+        self._start_writer()
+        self._pending.put(run)
+
+    def _start_writer(self):
+        """Start the writer thread, or a new one if the previous one died"""
+        with self._lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(target=self._write_loop, name="computerquest-leaderboard",
+                                                daemon=True)
+                self._writer.start()
+
+    def _write_loop(self):
+        """Writer thread: store queued runs in batches until stopped"""
+        db = self._connect()
+        try:
+            while True:
+                runs = []
+                taken = 1
+                item = self._pending.get()
+                try:
+                    deadline = time.monotonic() + self.flush_interval
+                    # Fill a batch until it is full, the interval passes or a marker arrives
+                    while item is not _FLUSH and item is not _STOP:
+                        runs.append(item)
+                        if len(runs) >= self.batch_size:
+                            break
+                        try:
+                            item = self._pending.get_nowait()
+                        except queue.Empty:
+                            # Only wait when nothing is queued
+                            remaining = deadline - time.monotonic()
+                            if remaining <= 0:
+                                break
+                            try:
+                                item = self._pending.get(timeout=remaining)
+                            except queue.Empty:
+                                break
+                        taken += 1
+                    if runs:
+                        self._write(db, runs)
+                finally:
+                    # Always account for what was taken, or flush would wait forever
+                    for _ in range(taken):
+                        self._pending.task_done()
+                if item is _STOP:
+                    return
+        finally:
+            db.close()
+
+    def _write(self, db, runs):
+        """Insert a batch in one transaction; if it fails, insert the runs one by one"""
+        try:
+            with db:
+                db.executemany(INSERT, runs)
+        except sqlite3.Error as e:
+            if len(runs) == 1:
+                self._report(runs, e)
+                return
+            for run in runs:
+                try:
+                    with db:
+                        db.execute(INSERT, run)
+                except sqlite3.Error as run_error:
+                    self._report([run], run_error)
+
+    def _report(self, runs, error):
+        """Report runs that could not be written"""
+        self.failed += len(runs)
+        print(f"Leaderboard: could not store {len(runs)} run(s) in {self.path}: {error}", file=sys.stderr)
+
+    def flush(self):
+        """Wait until every queued run has been written"""
+        if self._writer is not None:
+            self._start_writer()
+            self._pending.put(_FLUSH)
+            self._pending.join()
+
+    def close(self):
+        """Write the queued runs, stop the writer and close the database"""
+        if self._writer is not None:
+            self._start_writer()  # Replaces a writer that died, so the queued runs are still written
+            self._pending.put(_STOP)
+            with self._lock:
+                writer, self._writer = self._writer, None
+            writer.join()
+        self._db.close()
+        key = os.path.abspath(self.path)
+        with _boards_lock:
+            if _boards.get(key) is self:
+                del _boards[key]
+
+    def top(self, k=LEADERBOARD_SIZE, world=None, cohort=None):
+        """
+        Best runs, highest score first and fewest turns on a tie
+
+        Args:
+            k (int): Number of runs
+            world (str): Only runs in this world pack
+            cohort (str): Only runs in this cohort
+
+        Returns:
+            list: Run records
+        """
+        conditions, values = [], []
+        if world is not None:
+            conditions.append("world = ?")
+            values.append(world)
+        if cohort is not None:
+            conditions.append("cohort = ?")
+            values.append(cohort)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self._lock:
+            rows = self._db.execute(f"SELECT {COLUMNS} FROM runs{where} ORDER BY score DESC, turns LIMIT ?",
+                                    values + [k]).fetchall()
+        return [Run(*row) for row in rows]
+
+    def __len__(self):
+        """Number of runs written so far"""
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+# Leaderboards shared by every game in the process, by absolute database path
+_boards: Dict[str, Leaderboard] = {}
+_boards_lock = threading.Lock()
+
+def get_leaderboard(path=None):
+    """
+    Shared leaderboard of a database, opened on first use
+
+    Every game in the process records through the same writer thread
+    instead of competing for the database with writers of its own. Shared
+    leaderboards are closed at process exit (see close_leaderboards).
+
+    Args:
+        path (str): Database path (defaults to leaderboard_path())
+
+    Returns:
+        Leaderboard: The shared leaderboard
+    """
+    key = os.path.abspath(path or leaderboard_path())
+    with _boards_lock:
+        board = _boards.get(key)
+        if board is None:
+            board = _boards[key] = Leaderboard(key)
+        return board
+
+def close_leaderboards():
+    """Write the queued runs of every shared leaderboard and close them"""
+    with _boards_lock:
+        boards = list(_boards.values())
+    for board in boards:
+        board.close()
+
+atexit.register(close_leaderboards)
@@ -0,0 +1,24 @@
+"""
+CPU pipeline minigame
+
+Simulates the fetch-decode-execute pipeline.
+"""
+
+class CPUPipelineMinigame:
+    def __init__(self, game):
+        self.game = game
+        
+    def explain(self):
+        return "CPU Pipeline Minigame placeholder"
+        
+    def get_status(self):
+        return "CPU Pipeline status"
+        
+    def step(self):
+        return "Advanced pipeline by one step"
+        
+    def toggle_pipeline(self):
+        return "Toggled pipeline mode"
+        
+    def reset(self):
+        return "Reset pipeline simulation"
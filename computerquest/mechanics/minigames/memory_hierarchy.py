@@ -0,0 +1,12 @@
+"""
+Memory hierarchy minigame
+
+Simulates data moving through the memory hierarchy.
+"""
+
+class MemoryHierarchyMinigame:
+    def __init__(self, game):
+        self.game = game
+        
+    def explain(self):
+        return "Memory Hierarchy Minigame placeholder"
@@ -1,14 +1,25 @@
 """
 Progress tracking system
 
-Handles player achievements and progress tracking
+Handles player achievements and progress tracking. Progress is read from
+a small set of metrics (rooms visited, viruses found and quarantined,
+knowledge per area, victory and turns) that cost the same to refresh
+whatever the size of the world: visits are counted as they happen by the
+world's VisitCounter (see ComputerArchitecture.track_visits), so setting
+Component.visited is all it takes to record one. Achievements are
+defined in a data file (see computerquest.mechanics.achievements); each
+depends on the metrics its tests read, and update re-evaluates only
+achievements whose metrics changed.
 """
 
+from functools import partial
 from computerquest.config import VIRUS_TYPES, MAX_KNOWLEDGE
+from computerquest.mechanics.achievements import load_achievements
+from computerquest.models.component import VisitCounter
 
 class Achievement:
     """Represents a game achievement that can be unlocked"""
-    def __init__(self, id, name, description, condition_fn, reward=None):
+    def __init__(self, id, name, description, condition_fn, reward=None, depends=None):
         self.id = id
         self.name = name
         self.description = description
@@ -16,6 +27,7 @@ class Achievement:
         self.unlocked = False
         self.unlock_time = None
         self.reward = reward  # Optional reward (item, knowledge, etc.)
+        self.depends = depends  # Metrics the condition reads; None to check on every update
 
 class ProgressSystem:
     """Tracks player progress and manages achievements"""
@@ -26,98 +38,30 @@ class ProgressSystem:
         self.knowledge_progress = 0    # Percentage of total knowledge gained
         self.virus_progress = 0        # Percentage of viruses found/quarantined
         self.total_score = 0
+        self.metrics = {}  # Metric values at the last update
         
         # Setup achievements
         self.setup_achievements()
         
     def setup_achievements(self):
-        """Define all achievements for the game"""
+        """Create this game's achievements from the shared compiled definitions"""
+        rules = load_achievements()
         self.achievements = [
-            Achievement(
-                "first_step",
-                "First Steps",
-                "Visit your first new component after the CPU Core",
-                lambda: len([r for r in self.game.game_map.rooms.values() if r.visited]) > 1
-            ),
-            Achievement(
-                "explorer",
-                "System Explorer",
-                "Visit at least 10 different components",
-                lambda: len([r for r in self.game.game_map.rooms.values() if r.visited]) >= 10
-            ),
-            Achievement(
-                "master_explorer",
-                "System Cartographer",
-                "Visit all system components",
-                lambda: all(r.visited for r in self.game.game_map.rooms.values())
-            ),
-            Achievement(
-                "first_virus",
-                "Threat Detector",
-                "Find your first virus",
-                lambda: len(self.game.player.found_viruses) >= 1
-            ),
-            Achievement(
-                "virus_hunter",
-                "Virus Hunter",
-                "Find all viruses in the system",
-                lambda: len(self.game.player.found_viruses) >= len(VIRUS_TYPES)
-            ),
-            Achievement(
-                "first_quarantine",
-                "Security Specialist",
-                "Successfully quarantine your first virus",
-                lambda: len(self.game.player.quarantined_viruses) >= 1
-            ),
-            Achievement(
-                "system_savior",
-                "System Savior",
-                "Quarantine all viruses and save the system",
-                lambda: len(self.game.player.quarantined_viruses) >= len(VIRUS_TYPES)
-            ),
-            Achievement(
-                "cpu_expert",
-                "CPU Architecture Expert",
-                "Reach maximum knowledge of CPU components",
-                lambda: self.game.player.knowledge['cpu'] >= MAX_KNOWLEDGE
-            ),
-            Achievement(
-                "memory_expert",
-                "Memory Systems Expert",
-                "Reach maximum knowledge of memory systems",
-                lambda: self.game.player.knowledge['memory'] >= MAX_KNOWLEDGE
-            ),
-            Achievement(
-                "storage_expert",
-                "Storage Expert",
-                "Reach maximum knowledge of storage systems",
-                lambda: self.game.player.knowledge['storage'] >= MAX_KNOWLEDGE
-            ),
-            Achievement(
-                "network_expert",
-                "Networking Expert",
-                "Reach maximum knowledge of network components",
-                lambda: self.game.player.knowledge['networking'] >= MAX_KNOWLEDGE
-            ),
-            Achievement(
-                "security_expert",
-                "Security Expert",
-                "Reach maximum knowledge of security concepts",
-                lambda: self.game.player.knowledge['security'] >= MAX_KNOWLEDGE
-            ),
-            Achievement(
-                "computer_scientist",
-                "Computer Scientist",
-                "Reach maximum knowledge in all areas",
-                lambda: all(level >= MAX_KNOWLEDGE for level in self.game.player.knowledge.values())
-            ),
-            Achievement(
-                "efficient",
-                "Efficient Operator",
-                "Complete the game in under 50 turns",
-                lambda: self.game.victory and self.game.turns < 50
-            ),
+            Achievement(rule.id, rule.name, rule.description, partial(self._check, rule), rule.reward,
+                        rule.depends)
+            for rule in rules
         ]
+        
+        # Index achievements by the metrics they depend on, checked cheapest first
+        self._rank = {rule.id: rank for rank, rule in enumerate(sorted(rules, key=lambda rule: rule.cost))}
+        self._dependents = {}
+        self._unconditional = []
+        for achievement in self.achievements:
+            if achievement.depends is None:
+                self._unconditional.append(achievement)
+                continue
+            for name in achievement.depends:
+                self._dependents.setdefault(name, []).append(achievement)
     
     def update(self):
         """
@@ -125,28 +69,29 @@ class ProgressSystem:
         Should be called after each player action
         Returns: List of newly unlocked achievements
         """
+        previous = self.metrics
+        metrics = self.metrics = self.read_metrics()
+        changed = {name for name, value in metrics.items() if previous.get(name) != value}
+        
         # Update exploration progress
-        visited_rooms = len([r for r in self.game.game_map.rooms.values() if r.visited])
-        total_rooms = len(self.game.game_map.rooms)
-        self.exploration_progress = int((visited_rooms / total_rooms) * 100)
+        self.exploration_progress = int((metrics["visited_count"] / metrics["room_count"]) * 100)
         
         # Update knowledge progress
-        current_knowledge = sum(self.game.player.knowledge.values())
         max_knowledge = len(self.game.player.knowledge) * MAX_KNOWLEDGE  # MAX_KNOWLEDGE is max level per area
-        self.knowledge_progress = int((current_knowledge / max_knowledge) * 100)
+        self.knowledge_progress = int((metrics["knowledge.total"] / max_knowledge) * 100)
         
         # Update virus progress - considered 50% for finding, 50% for quarantining
-        viruses_found_pct = len(self.game.player.found_viruses) / len(VIRUS_TYPES) * 50
-        viruses_quarantined_pct = len(self.game.player.quarantined_viruses) / len(VIRUS_TYPES) * 50
+        viruses_found_pct = metrics["found_count"] / len(VIRUS_TYPES) * 50
+        viruses_quarantined_pct = metrics["quarantined_count"] / len(VIRUS_TYPES) * 50
         self.virus_progress = int(viruses_found_pct + viruses_quarantined_pct)
         
         # Calculate total score
         self.total_score = self.calculate_score()
         
-        # Check for newly unlocked achievements
+        # Check achievements whose metrics changed for new unlocks
         newly_unlocked = []
-        for achievement in self.achievements:
-            if not achievement.unlocked and achievement.condition_fn():
+        for achievement in self._affected(changed):
+            if achievement.condition_fn():
                 achievement.unlocked = True
                 achievement.unlock_time = self.game.turns
                 newly_unlocked.append(achievement)
@@ -157,6 +102,52 @@ class ProgressSystem:
                     
         return newly_unlocked
     
+    @property
+    def visited_count(self):
+        """Rooms visited so far: the world's running count, or a scan of worlds that don't keep one"""
+        game_map = self.game.game_map
+        visits = getattr(game_map, 'visits', None)
+        if isinstance(visits, VisitCounter):
+            return visits.count
+        return sum(1 for room in game_map.rooms.values() if room.visited)
+    
+    def read_metrics(self):
+        """
+        Current values of the metrics achievements are defined over
+        Returns: dict of metric name -> value
+        """
+        player = self.game.player
+        knowledge = player.knowledge
+        metrics = {
+            "visited_count": self.visited_count,
+            "room_count": len(self.game.game_map.rooms),
+            "found_count": len(player.found_viruses),
+            "quarantined_count": len(player.quarantined_viruses),
+            "knowledge.total": sum(knowledge.values()),
+            "knowledge.min": min(knowledge.values(), default=0),
+            "victory": bool(self.game.victory),
+            "turns": self.game.turns,
+        }
+        for area, level in knowledge.items():
+            metrics["knowledge." + area] = level
+        return metrics
+    
+    def _check(self, rule):
+        """Test an achievement rule against the metrics of the last update"""
+        return rule.test(self.metrics)
+    
+    def _affected(self, changed):
+        """Locked achievements that depend on any of the changed metrics, cheapest first"""
+        affected = [achievement for achievement in self._unconditional if not achievement.unlocked]
+        seen = set()
+        for name in changed:
+            for achievement in self._dependents.get(name, ()):
+                if not achievement.unlocked and achievement.id not in seen:
+                    seen.add(achievement.id)
+                    affected.append(achievement)
+        affected.sort(key=lambda achievement: self._rank[achievement.id])
+        return affected
+    
     def apply_reward(self, reward):
         """Apply a reward to the player"""
         if isinstance(reward, dict):
@@ -175,8 +166,7 @@ class ProgressSystem:
         score = 0
         
         # Points for exploration
-        visited_rooms = len([r for r in self.game.game_map.rooms.values() if r.visited])
-        score += visited_rooms * 10  # 10 points per room visited
+        score += self.visited_count * 10  # 10 points per room visited
         
         # Points for viruses found and quarantined
         score += len(self.game.player.found_viruses) * 50       # 50 points per virus found
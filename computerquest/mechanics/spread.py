@@ -0,0 +1,169 @@
+"""
+Virus spread simulation
+
+Models how infection spreads between components over the door graph.
+Every component has an infection level between 0 and 1 and every door a
+transmission probability, lower into components with a high security
+level or reliability. Each turn the infection pressure on a component is
+a sparse matrix-vector product of those probabilities with the current
+levels: a SciPy CSR matrix when SciPy is installed, a NumPy bincount when
+only NumPy is, and a loop over the edges otherwise. Components holding a
+virus stay fully infected.
+
+The model is deterministic, so forecast can run thousands of turns ahead
+for difficulty tuning; apply surfaces infection in the world as
+Component.error() states.
+"""
+
+from computerquest.config import SPREAD_BASE_RATE, SPREAD_RECOVERY, SPREAD_ERROR_THRESHOLD
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from scipy import sparse
+except ImportError:
+    sparse = None
+
+MAX_SECURITY = 3      # Highest Component.security_level
+MAX_RELIABILITY = 10  # Highest performance reliability
+
+def transmission(component, base_rate=SPREAD_BASE_RATE):
+    """
+    Probability per turn that infection crosses a door into a component
+
+    Args:
+        component (Component): Component the door leads to
+        base_rate (float): Probability for an unprotected component
+
+    Returns:
+        float: The probability
+    """
+    security = min(component.security_level, MAX_SECURITY) / (MAX_SECURITY + 1)
+    reliability = min(component.performance["reliability"], MAX_RELIABILITY) / (2 * MAX_RELIABILITY)
+    return base_rate * (1 - security) * (1 - reliability)
+
+class SpreadModel:
+    """Infection levels of a world's components, advanced one turn at a time"""
+    def __init__(self, world, base_rate=SPREAD_BASE_RATE, recovery=SPREAD_RECOVERY,
+                 threshold=SPREAD_ERROR_THRESHOLD):
+        self.world = world
+        self.base_rate = base_rate
+        self.recovery = recovery    # Share of infection cleared per turn
+        self.threshold = threshold  # Level at which a component shows an error
+        self.turns = 0
+        self._errors = {}           # Room key -> error set by apply
+        self.keys = []              # index -> room key
+        self.levels = []            # index -> infection level
+        self.rebuild()
+
+    def rebuild(self):
+        """Rebuild the transmission matrix and sources from the world"""
+        graph = self.world.graph
+        graph.refresh()
+        previous = dict(zip(self.keys, self.levels))  # Levels carry over by room key
+        self.keys = list(graph.keys)
+        self.index = dict(graph.index)
+        rooms = [self.world.rooms[key] for key in self.keys]
+        size = len(rooms)
+        rates = [transmission(room, self.base_rate) for room in rooms]
+        sources, targets = [], []
+        for source, room_targets in enumerate(graph.targets):
+            for target in room_targets:
+                sources.append(source)
+                targets.append(target)
+        probabilities = [rates[target] for target in targets]
+
+        if np is not None:
+            self._sources = np.array(sources, dtype=np.int32)
+            self._targets = np.array(targets, dtype=np.int32)
+            self._probabilities = np.array(probabilities)
+            self._matrix = None
+            if sparse is not None:
+                self._matrix = sparse.csr_matrix((self._probabilities, (self._targets, self._sources)),
+                                                 shape=(size, size))
+            self.levels = np.zeros(size)
+        else:
+            self._edges = list(zip(sources, targets, probabilities))
+            self.levels = [0.0] * size
+        for i, key in enumerate(self.keys):
+            self.levels[i] = previous.get(key, 0.0)
+        self._generation = graph.generation
+        self.reseed()
+
+    def reseed(self):
+        """Hold components that currently contain a virus at full infection"""
+        self.seeded = [i for i, key in enumerate(self.keys) if self.world.rooms[key].viruses]
+        for i in self.seeded:
+            self.levels[i] = 1.0
+
+    def _step(self, levels):
+        """Levels after one turn"""
+        keep = 1 - self.recovery
+        if np is not None:
+            if self._matrix is not None:
+                pressure = self._matrix @ levels
+            else:
+                pressure = np.bincount(self._targets, weights=self._probabilities * levels[self._sources],
+                                       minlength=len(levels))
+            levels = levels * keep + (1 - levels) * np.minimum(pressure, 1.0)
+            levels[self.seeded] = 1.0
+            return levels
+
+        pressure = [0.0] * len(levels)
+        for source, target, probability in self._edges:
+            pressure[target] += probability * levels[source]
+        levels = [level * keep + (1 - level) * min(push, 1.0) for level, push in zip(levels, pressure)]
+        for i in self.seeded:
+            levels[i] = 1.0
+        return levels
+
+    def step(self, turns=1):
+        """Advance the infection by a number of turns"""
+        if self.world.graph.generation != self._generation or len(self.world.rooms) != len(self.keys):
+            self.rebuild()
+        levels = self.levels
+        for _ in range(turns):
+            levels = self._step(levels)
+        self.levels = levels
+        self.turns += turns
+
+    def forecast(self, turns):
+        """
+        Infection levels a number of turns ahead, leaving the model unchanged
+
+        Returns:
+            dict: Room key -> infection level
+        """
+        levels = self.levels.copy()
+        for _ in range(turns):
+            levels = self._step(levels)
+        return dict(zip(self.keys, (float(level) for level in levels)))
+
+    def level(self, room_key):
+        """Current infection level of a component"""
+        return float(self.levels[self.index[room_key]])
+
+    def infected_count(self, threshold=None):
+        """Number of components at or above a level (defaults to the error threshold)"""
+        threshold = self.threshold if threshold is None else threshold
+        return sum(1 for level in self.levels if level >= threshold)
+
+    def apply(self):
+        """
+        Show infection as component errors
+
+        Components reaching the threshold get an error; errors this model
+        set are cleared again once the infection falls back below it.
+        """
+        for key, level in zip(self.keys, self.levels):
+            room = self.world.rooms[key]
+            if level >= self.threshold:
+                if key not in self._errors and not room.error_state:
+                    self._errors[key] = f"Virus activity detected ({level:.0%} of processes infected)"
+                    room.error(self._errors[key])
+            elif key in self._errors:
+                if room.error_state == self._errors.pop(key):
+                    room.error(None)
@@ -4,9 +4,54 @@ Component class (formerly Room)
 Represents a computer component that can be visited by the player.
 """
 
-from computerquest.config import DIRECTION_NAMES
+from types import MappingProxyType
+from typing import FrozenSet
+from computerquest.config import DIRECTION_NAMES, PERFORMANCE_METRICS
+from computerquest.models.item import VIRUS, registry
+
+# Performance characteristics (each on a 1-10 scale) are stored in PERFORMANCE_METRICS order
+NO_PERFORMANCE = (0,) * len(PERFORMANCE_METRICS)
+# Shared by components without viruses until one is added
+NO_VIRUSES: FrozenSet[str] = frozenset()
+
+class EdgeVersion:
+    """Counter shared by the components of one world, bumped whenever one of their doors is created"""
+    __slots__ = ('value',)
+
+    def __init__(self):
+        self.value = 0
+
+class VisitCounter:
+    """Number of visited components of one world, kept current by Component.visited"""
+    __slots__ = ('count',)
+
+    def __init__(self):
+        self.count = 0
+
+def link(a, b, direction, back_direction):
+    """
+    Connect two components in both directions
+    a, b: the components to connect
+    direction: direction from a to b
+    back_direction: direction from b back to a
+    Raises ValueError on a conflicting direction; linking twice is a no-op
+    """
+    for room, other, way in ((a, b, direction), (b, a, back_direction)):
+        current = room.doors.get(way)
+        if current is not None and current is not other:
+            raise ValueError(f"{room.name}: direction '{way}' already leads to {current.name}")
+        if current is None and other.id in room.neighbor_ids:
+            raise ValueError(f"{room.name}: already connected to {other.name} in another direction")
+
+    a.connect_to(b, direction)
+    b.connect_to(a, back_direction)
 
 class Component:
+    # Fixed attributes instead of a per-instance __dict__, to keep large worlds small
+    __slots__ = ('name', '_description', 'text_store', '_desc_override', 'desc_notes', 'door', 'doors',
+                 'neighbor_ids', 'items', 'viruses', 'play', 'lit', 'save', 'id', 'security_level', 'data_types',
+                 '_performance', '_visited', 'power_state', 'error_state', 'edge_version', 'visit_counter')
+
     def __init__(self, name="", description="", lit=False, iden="000", save=False):
         """
         Constructor: create a new Component object representing a computer component
@@ -17,34 +62,97 @@ class Component:
         save: whether this component's state needs to be saved
         """
         self.name = name  # Component name
-        self.desc1 = description  # Original description (unchangeable)
-        self.desc = description   # Current description (changeable)
+        self._description = description  # Original text, or its index in text_store
+        self.text_store = None  # TextStore holding the original text, see use_text_store
+        self._desc_override = None  # Replacement description set through desc
+        self.desc_notes = ""  # Text appended to the original description (e.g. by add_door)
         self.door = {}  # Special connection points requiring actions to traverse
         self.doors = {} # Regular connections to other components
-        self.openDoors = []  # List of all connections with other components
+        self.neighbor_ids = set()  # Ids of connected components, for O(1) duplicate checks
         self.items = {}  # Items/data in this component
+        self.viruses = NO_VIRUSES  # Ids of the viruses among items, see add_items and remove_item
         self.play = []  # List of entities in this component
         self.lit = lit    # If component is accessible without special tools
         self.save = save  # If component state needs saving
         self.id = iden   # Component identifier
         self.security_level = 0  # Security restriction level (0=none, 1=user, 2=admin, 3=system)
         self.data_types = []  # Types of data typically found in this component
-        self.performance = {  # Performance characteristics 
-            "speed": 0,       # 1-10 scale
-            "capacity": 0,    # 1-10 scale
-            "reliability": 0  # 1-10 scale
-        }
-        self.visited = False  # Has player visited this component
+        self._performance = NO_PERFORMANCE  # Values in PERFORMANCE_METRICS order, see performance
+        self._visited = False  # Has player visited this component, see visited
         self.power_state = "on"  # Power state of the component (on/off/sleep)
         self.error_state = None  # Any error conditions present
+        self.edge_version = None  # EdgeVersion of the world this component belongs to, see WorldGraph
+        self.visit_counter = None  # VisitCounter of the world this component belongs to
         
+    @property
+    def visited(self):
+        """Has the player visited this component"""
+        return self._visited
+
+    @visited.setter
+    def visited(self, value):
+        # Keep the world's count of visited components current
+        if self.visit_counter is not None and bool(value) != bool(self._visited):
+            self.visit_counter.count += 1 if value else -1
+        self._visited = value
+
+    @property
+    def desc1(self):
+        """Original description (unchangeable), read from the text store if it has one"""
+        if self.text_store is not None:
+            return self.text_store.get(self._description)
+        return self._description
+
+    @desc1.setter
+    def desc1(self, value):
+        self._description = value
+        self.text_store = None
+
+    @property
+    def desc(self):
+        """
+        Current description: the original text with any notes, or its
+        replacement, behind the error overlay while the component is in error
+        """
+        text = self._desc_override
+        if text is None:
+            text = self.desc1 + self.desc_notes
+        if self.error_state:
+            return f"ERROR: {self.error_state}\n\n{text}"
+        return text
+
+    @desc.setter
+    def desc(self, value):
+        self._desc_override = value
+
+    @property
+    def performance(self):
+        """Performance characteristics as a read-only metric -> value mapping"""
+        return MappingProxyType(dict(zip(PERFORMANCE_METRICS, self._performance)))
+
+    @performance.setter
+    def performance(self, values):
+        self._performance = tuple(values.get(metric, 0) for metric in PERFORMANCE_METRICS)
+
+    @property
+    def openDoors(self):
+        """List of all connections with other components, as {component: direction} records"""
+        return [{other: direction} for direction, other in self.doors.items()]
+
+    def use_text_store(self, store, index):
+        """
+        Keep the original description in a text store instead of in memory
+        store: TextStore holding the description
+        index: position of the description in the store
+        """
+        self.text_store = store
+        self._description = index
+
     def set_specs(self, security=0, data_types=None, speed=0, capacity=0, reliability=0):
         """Set technical specifications for this computer component"""
         self.security_level = security
         self.data_types = data_types or []
-        self.performance["speed"] = speed
-        self.performance["capacity"] = capacity
-        self.performance["reliability"] = reliability
+        self._performance = (speed, capacity, reliability)
 
     def connect_to(self, other, direction):
         """
@@ -53,24 +161,46 @@ class Component:
         direction: direction identifier (n, s, e, w, etc.)
         """
         # Check if connection already exists
-        if other.id in [list(d.keys())[0].id for d in self.openDoors if d]:
+        if other.id in self.neighbor_ids:
             return
             
-        # Add directional connection
-        self.doors.update({direction: other})
-        
-        # Create connection record
-        connect = {other: direction}
-        self.openDoors.append(connect)
+        # Add directional connection, forgetting the neighbor it replaces
+        replaced = self.doors.get(direction)
+        if replaced is not None:
+            self.neighbor_ids.discard(replaced.id)
+        self.doors[direction] = other
+        self.neighbor_ids.add(other.id)
+        if self.edge_version is not None:
+            self.edge_version.value += 1
 
     def add_items(self, item):
         """
         Add items/data to this component
         item: dictionary with name/description pairs
+        Items must be added and removed through add_items and remove_item,
+        which keep the virus index in viruses current
         """
         # Add items to component
         self.items.update(item)
 
+        # Keep the virus index current
+        viruses = [item_id for item_id, desc in item.items() if registry.get(item_id, desc).flags & VIRUS]
+        if viruses:
+            if self.viruses is NO_VIRUSES:
+                self.viruses = set()
+            self.viruses.update(viruses)
+
+    def remove_item(self, item_id):
+        """
+        Remove an item/data from this component
+        item_id: the item to remove
+        Returns: the item's description
+        """
+        description = self.items.pop(item_id)
+        if item_id in self.viruses:
+            self.viruses.discard(item_id)
+        return description
+
     def add_door(self, name, d, od, door):
         """
         Add a special connection requiring action to use
@@ -83,7 +213,7 @@ class Component:
         
         # Update description
         if "connection" not in self.desc.lower():
-            self.desc += f" There's a {name} connection that appears to require authentication."
+            self.desc_notes += f" There's a {name} connection that appears to require authentication."
 
     def print_details(self):
         """
@@ -182,15 +312,20 @@ class Component:
         return s
         
     def mark_visited(self):
-        """Mark this component as visited to reveal more details on subsequent visits"""
+        """
+        Mark this component as visited to reveal more details on subsequent visits
+        Returns: True if this is the first visit
+        """
+        first = not self.visited
         self.visited = True
+        return first
         
     def error(self, error_description):
         """Set component to error state"""
-        self.error_state = error_description
-        self.desc = f"ERROR: {error_description}\n\n" + self.desc
+        self.error_state = error_description  # Shown over the description, see desc
         
     def repair(self):
         """Clear error state"""
         self.error_state = None
-        self.desc = self.desc1  # Reset to original description
\ No newline at end of file
+        self._desc_override = None  # Reset to original description
+        self.desc_notes = ""
\ No newline at end of file
@@ -0,0 +1,142 @@
+"""
+Item registry
+
+Classifies items and viruses once, when a world is loaded or an item is
+first seen, into Item records with precomputed flags, so scanning and
+analysis test bits instead of searching names and descriptions. Items of
+the world data stay registered; items first seen during play are kept in
+an LRU cache of ITEM_CACHE_SIZE records, so long sessions don't grow it.
+"""
+
+from collections import OrderedDict, namedtuple
+from computerquest.config import ITEM_CACHE_SIZE
+
+# Item flags
+VIRUS = 1          # A virus that scans report and quarantine removes
+SUSPICIOUS = 2     # Description mentions suspicious or malicious behaviour
+UNUSUAL = 4        # Description says "suspicious" or "unusual", checked by log/data/packet analysis
+ABNORMAL = 8       # Description contains any of ABNORMAL_TERMS, checked by generic analysis
+LOG = 16           # Analyzed as a log file
+CALCULATION = 32   # Analyzed as calculation or anomaly data
+PACKET = 64        # Analyzed as network packet data
+
+ABNORMAL_TERMS = ('suspicious', 'unusual', 'strange', 'abnormal', 'unexpected')
+
+# Prefix of the ids of neutralized viruses left behind by quarantine
+QUARANTINED_PREFIX = "quarantined_"
+
+# id: item id as used in rooms and inventories
+# name: display name
+# kind: item type from the data files ("tool", "document", "clue", "virus", ...)
+# virus_type: virus the item is or points to, or None
+# difficulty: virus difficulty, 0 for other items
+# flags: combination of the flags above
+# description: the item's description text
+Item = namedtuple('Item', ['id', 'name', 'kind', 'virus_type', 'difficulty', 'flags', 'description'])
+
+def detect_virus_type(item_id, description):
+    """Virus type suggested by an item's name or description, or None"""
+    name = item_id.lower()
+    text = description.lower()
+    if 'boot' in name or 'boot' in text:
+        return "boot_sector_virus"
+    elif 'root' in name or 'kernel' in text:
+        return "rootkit_virus"
+    elif 'memory' in name or 'ram' in text:
+        return "memory_resident_virus"
+    elif 'firm' in name or 'bios' in text:
+        return "firmware_virus"
+    elif 'packet' in name or 'network' in text:
+        return "packet_sniffer_virus"
+    return None
+
+def make_item(item_id, description, name=None, kind=None, difficulty=0, virus=None):
+    """
+    Classify an item
+
+    Args:
+        item_id (str): Item id
+        description (str): Item description
+        name (str): Display name (defaults to one derived from the id)
+        kind (str): Item type (defaults to "virus" or "item")
+        difficulty (int): Virus difficulty
+        virus (bool): True for entries of the virus file, False for other
+            entries of the data files, None to guess from the id
+
+    Returns:
+        Item: The classified item
+    """
+    if virus is None:
+        # Not from the data files: anything named like a virus, except quarantined ones
+        quarantined = item_id.startswith(QUARANTINED_PREFIX)
+        kind = kind or ("quarantined" if quarantined else None)
+        virus_like = not quarantined and 'virus' in item_id.lower()
+    else:
+        virus_like = virus
+
+    text = description.lower()
+    flags = 0
+    if virus_like:
+        flags |= VIRUS
+    if 'suspicious' in text or 'malicious' in text:
+        flags |= SUSPICIOUS
+    if 'suspicious' in description or 'unusual' in description:
+        flags |= UNUSUAL
+    if any(term in text for term in ABNORMAL_TERMS):
+        flags |= ABNORMAL
+    if 'log' in item_id:
+        flags |= LOG
+    if 'calculation' in item_id or 'anomaly' in item_id:
+        flags |= CALCULATION
+    if 'packet' in item_id:
+        flags |= PACKET
+
+    return Item(
+        item_id,
+        name or item_id.replace('_', ' ').title(),
+        kind or ("virus" if flags & VIRUS else "item"),
+        item_id if virus else detect_virus_type(item_id, description),
+        difficulty,
+        flags,
+        description,
+    )
+
+class ItemRegistry:
+    """Classified items by id and description"""
+    def __init__(self, cache_size=ITEM_CACHE_SIZE):
+        self.cache_size = cache_size
+        self._items = {}  # (id, description) -> Item, from world data
+        self._seen = OrderedDict()  # (id, description) -> Item, first seen during play
+
+    def __len__(self):
+        return len(self._items) + len(self._seen)
+
+    def add(self, items):
+        """Register items classified from world data"""
+        for item in items:
+            self._items[item.id, item.description] = item
+
+    def get(self, item_id, description):
+        """
+        Item record for an item, classifying it on first sight
+
+        Items created during play, such as quarantined viruses, are not in
+        any data file; they are classified from their id and description.
+        """
+        if not isinstance(description, str):
+            description = ""  # A container of other items rather than text
+        key = (item_id, description)
+        item = self._items.get(key)
+        if item is not None:
+            return item
+        item = self._seen.get(key)
+        if item is None:
+            item = self._seen[key] = make_item(item_id, description)
+            if len(self._seen) > self.cache_size:
+                self._seen.popitem(last=False)
+        else:
+            self._seen.move_to_end(key)
+        return item
+
+# Shared by every world in the process; worlds register their items when built
+registry = ItemRegistry()
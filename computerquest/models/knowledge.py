@@ -0,0 +1,56 @@
+"""
+Knowledge table
+
+Classifies components into the types of COMPONENT_TYPES once, when a
+world is built, and records the knowledge each one teaches. Each world
+owns its table (see ComputerArchitecture.setup); player actions look their
+location up in it instead of inspecting its name.
+"""
+
+from collections import namedtuple
+from computerquest.config import COMPONENT_TYPES, KNOWLEDGE_AREAS
+
+# type: key of COMPONENT_TYPES, or "other"
+# gains: (knowledge area, points) pairs for areas in KNOWLEDGE_AREAS
+ComponentKnowledge = namedtuple('ComponentKnowledge', ['type', 'gains'])
+
+def classify_component(name):
+    """
+    Type and knowledge gains of a component
+
+    Args:
+        name (str): Component name
+
+    Returns:
+        ComponentKnowledge: The classification
+    """
+    name = name.lower()
+    for component_type, (keywords, weights) in COMPONENT_TYPES.items():
+        if any(keyword in name for keyword in keywords):
+            gains = tuple((area, points) for area, points in weights.items() if area in KNOWLEDGE_AREAS)
+            return ComponentKnowledge(component_type, gains)
+    return ComponentKnowledge("other", ())
+
+class KnowledgeTable:
+    """Classifications of a world's components, by dense component index"""
+    def __init__(self, components=()):
+        self.components = list(components)  # index -> component
+        self.entries = [classify_component(component.name) for component in self.components]
+        self._index = {id(component): i for i, component in enumerate(self.components)}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def index_of(self, component):
+        """Dense index of a component, or None if it is not part of the table"""
+        index = self._index.get(id(component))
+        if index is None or self.components[index] is not component:
+            return None
+        return index
+
+    def get(self, component):
+        """Classification of a component; components added after the table was built are classified on the spot"""
+        index = self.index_of(component)
+        if index is None:
+            return classify_component(component.name)
+        return self.entries[index]
@@ -5,8 +5,16 @@ Represents the player character in the game.
 """
 
 from computerquest.config import KNOWLEDGE_AREAS, MAX_KNOWLEDGE
+from computerquest.models.item import (VIRUS, SUSPICIOUS, UNUSUAL, ABNORMAL, LOG, CALCULATION, PACKET,
+                                       QUARANTINED_PREFIX, detect_virus_type, registry)
+from computerquest.models.knowledge import classify_component
+from computerquest.utils.helpers import ErrorText
 
 class Player:
+    # Fixed attributes instead of a per-instance __dict__, like Component
+    __slots__ = ('location', 'items', 'viruses', 'max_health', 'health', 'com', 'name', 'death',
+                 'found_viruses', 'quarantined_viruses', 'knowledge', 'knowledge_table')
+
     def __init__(self, location=None, items=None, NPC=False, name=None):
         """
         Player constructor
@@ -17,6 +25,7 @@ class Player:
         """
         self.location = location  # Current component location
         self.items = items or {}  # Player inventory
+        self.viruses = set(self._viruses_in(self.items))  # Ids of the viruses in the inventory
         self.max_health = 20  # Maximum health points
         self.health = 20  # Current health points
         self.com = NPC  # Is this an NPC?
@@ -24,20 +33,20 @@ class Player:
         self.death = False  # Is player dead?
         
         # System-specific attributes
-        self.found_viruses = []  # List of discovered viruses
-        self.quarantined_viruses = []  # List of neutralized viruses
-        self.knowledge = {
-            "cpu": 0,
-            "memory": 0,
-            "storage": 0,
-            "networking": 0,
-            "security": 0
-        }
+        self.found_viruses = set()  # Discovered viruses
+        self.quarantined_viruses = set()  # Neutralized viruses
+        self.knowledge = {area: 0 for area in KNOWLEDGE_AREAS}
+        self.knowledge_table = None  # KnowledgeTable of the world, set by ComputerArchitecture.setup
 
         # Add player to location's entities list if this is an NPC
         if self.com:
             self.location.play.append(self)
     
+    def _viruses_in(self, items):
+        """Ids of the viruses among a room's or inventory's items"""
+        get = registry.get
+        return [item_id for item_id, desc in items.items() if get(item_id, desc).flags & VIRUS]
+
     def __str__(self):
         """String representation of Player"""
         return self.name if self.name else "Security Program"
@@ -55,7 +64,8 @@ class Player:
             
             # Update NPC list if this is an NPC
             if self.com:
-                self.location.play.append(room.play.pop(self))
+                room.play.remove(self)
+                self.location.play.append(self)
                 
             return True
         else:
@@ -87,28 +97,9 @@ class Player:
                 
         # Looking around the room
         else:
-            # Generate technical details if the component has been visited
-            technical_details = None
-            if room.visited:
-                technical_details = []
-                if room.security_level > 0:
-                    technical_details.append(f"Security Level: {room.security_level}")
-                if room.data_types:
-                    technical_details.append(f"Data Types: {', '.join(room.data_types)}")
-                if any(room.performance.values()):
-                    technical_details.append("Performance Metrics:")
-                    for metric, value in room.performance.items():
-                        if value > 0:
-                            technical_details.append(f"  * {metric.capitalize()}: {value}/10")
-            
-            # Use the new formatted output
-            from computerquest.utils.helpers import format_look_output
-            return format_look_output(
-                location=room,
-                connections=room.doors,
-                items=list(room.items.keys()),
-                technical_details=technical_details
-            )
+            # Use the formatted output, built only when displayed
+            from computerquest.utils.helpers import LazyText, render_location
+            return LazyText(render_location, room)
 
     def take(self, item):
         """
@@ -118,12 +109,14 @@ class Player:
         """
         # Check for inventory limit
         if len(self.items) == 8:
-            return "Your inventory is full. Drop something first."
+            return ErrorText("Your inventory is full. Drop something first.")
             
         # Check if item is in the room
         if item in self.location.items:
             # Move item from room to inventory
-            self.items.update({item: self.location.items.pop(item)})
+            if item in self.location.viruses:
+                self.viruses.add(item)
+            self.items.update({item: self.location.remove_item(item)})
             return f"Taken: {item}"
             
         # Check if item is in a container in the room
@@ -134,7 +127,7 @@ class Player:
                         v.pop(l)
                         return f"Taken: {item}"
                         
-        return f"There is no {item} here to take."
+        return ErrorText(f"There is no {item} here to take.")
     
     def drop(self, item):
         """
@@ -148,11 +141,12 @@ class Player:
             
             # Remove from inventory and add to room
             self.items.pop(item)
-            self.location.items.update({item: desc})
+            self.viruses.discard(item)
+            self.location.add_items({item: desc})
             
             return f"Dropped: {item}"
         else:
-            return f"You don't have {item} in your inventory."
+            return ErrorText(f"You don't have {item} in your inventory.")
 
     def scan(self, target=None):
         """
@@ -168,8 +162,7 @@ class Player:
         if target:
             # Check if item is in room
             if target in self.location.items:
-                item_desc = self.location.items[target]
-                if 'virus' in target.lower():
+                if target in self.location.viruses:
                     self._record_virus_found(target)
                     return f"ALERT! {target} detected. This is a malicious program that should be quarantined immediately."
                 else:
@@ -177,7 +170,7 @@ class Player:
                     
             # Check if item is in inventory
             elif target in self.items:
-                if 'virus' in target.lower():
+                if target in self.viruses:
                     self._record_virus_found(target)
                     return f"ALERT! {target} detected. This is a malicious program in your inventory that should be quarantined immediately."
                 else:
@@ -188,7 +181,7 @@ class Player:
         # Scanning the entire location
         else:
             # Check for viruses
-            viruses_here = [item for item in self.location.items if 'virus' in item.lower()]
+            viruses_here = sorted(self.location.viruses)
             
             if viruses_here:
                 result = "SECURITY ALERT! Virus scan detected the following threats:\n"
@@ -261,13 +254,13 @@ class Player:
     def _advanced_scan_location(self):
         """Helper method for advanced scanning current location"""
         # Find obvious viruses
-        viruses_here = [item for item in self.location.items if 'virus' in item.lower()]
+        viruses_here = sorted(self.location.viruses)
         
         # Find suspicious items
         hidden_threats = []
-        for item, desc in self.location.items.items():
-            if 'virus' not in item.lower() and ('suspicious' in desc.lower() or 'malicious' in desc.lower()):
-                hidden_threats.append(item)
+        for item_id, desc in self.location.items.items():
+            if item_id not in self.location.viruses and registry.get(item_id, desc).flags & SUSPICIOUS:
+                hidden_threats.append(item_id)
         
         if viruses_here or hidden_threats:
             result = "ADVANCED SECURITY SCAN RESULTS:\n\n"
@@ -295,8 +288,9 @@ class Player:
         location = "in your inventory" if in_inventory else ""
         
         # Check for virus indicators
-        if 'virus' in item_name.lower() or 'malicious' in item_desc.lower() or 'suspicious' in item_desc.lower():
-            virus_type = self._detect_virus_type(item_name, item_desc)
+        item = registry.get(item_name, item_desc)
+        if item.flags & (VIRUS | SUSPICIOUS):
+            virus_type = item.virus_type
             
             if virus_type:
                 self._record_virus_found(virus_type)
@@ -311,38 +305,22 @@ class Player:
     
     def _detect_virus_type(self, item_name, item_desc):
         """Determine virus type from item characteristics"""
-        if 'boot' in item_name.lower() or 'boot' in item_desc.lower():
-            return "boot_sector_virus"
-        elif 'root' in item_name.lower() or 'kernel' in item_desc.lower():
-            return "rootkit_virus"
-        elif 'memory' in item_name.lower() or 'ram' in item_desc.lower():
-            return "memory_resident_virus"
-        elif 'firm' in item_name.lower() or 'bios' in item_desc.lower():
-            return "firmware_virus"
-        elif 'packet' in item_name.lower() or 'network' in item_desc.lower():
-            return "packet_sniffer_virus"
-        return None
+        return detect_virus_type(item_name, item_desc)
     
+    def _classify_location(self):
+        """Classification of the current component, from the world's knowledge table if there is one"""
+        if self.knowledge_table is None:
+            return classify_component(self.location.name)
+        return self.knowledge_table.get(self.location)
+
     def _determine_component_type(self):
         """Determine the type of the current component"""
-        loc_name = self.location.name.lower()
-        
-        if any(x in loc_name for x in ['cpu', 'alu', 'control', 'register']):
-            return 'cpu'
-        elif any(x in loc_name for x in ['memory', 'ram', 'cache']):
-            return 'memory'
-        elif any(x in loc_name for x in ['ssd', 'hdd', 'drive', 'disk', 'storage']):
-            return 'storage'
-        elif any(x in loc_name for x in ['network', 'interface']):
-            return 'network'
-        elif any(x in loc_name for x in ['bios', 'firmware', 'uefi']):
-            return 'firmware'
-        return 'other'
+        return self._classify_location().type
     
     def _record_virus_found(self, virus):
         """Record a found virus and update knowledge"""
         if virus not in self.found_viruses:
-            self.found_viruses.append(virus)
+            self.found_viruses.add(virus)
             self.knowledge['security'] = min(MAX_KNOWLEDGE, self.knowledge['security'] + 1)
     
     def quarantine(self, virus_name):
@@ -353,26 +331,26 @@ class Player:
         """
         # Check for required tool
         if 'antivirus_tool' not in self.items:
-            return "You need an antivirus tool to quarantine viruses."
+            return ErrorText("You need an antivirus tool to quarantine viruses.")
             
         # Check if virus has been found
         if virus_name not in self.found_viruses:
-            return f"You haven't detected a virus named '{virus_name}' yet. Try scanning first."
+            return ErrorText(f"You haven't detected a virus named '{virus_name}' yet. Try scanning first.")
             
         # Check if already quarantined
         if virus_name in self.quarantined_viruses:
-            return f"The {virus_name} has already been quarantined."
+            return ErrorText(f"The {virus_name} has already been quarantined.")
             
         # Check if virus is in current location
         if virus_name in self.location.items:
             # Remove the virus
-            description = self.location.items.pop(virus_name)
+            description = self.location.remove_item(virus_name)
             
-            # Add to quarantined list
-            self.quarantined_viruses.append(virus_name)
+            # Add to quarantined set
+            self.quarantined_viruses.add(virus_name)
             
             # Add neutralized version
-            self.location.items[f"quarantined_{virus_name}"] = f"A neutralized version of {virus_name}, safely contained and no longer a threat."
+            self.location.add_items({QUARANTINED_PREFIX + virus_name: f"A neutralized version of {virus_name}, safely contained and no longer a threat."})
             
             # Increase security knowledge
             self.knowledge['security'] = min(MAX_KNOWLEDGE, self.knowledge['security'] + 2)
@@ -383,12 +361,13 @@ class Player:
         elif virus_name in self.items:
             # Remove the virus
             description = self.items.pop(virus_name)
+            self.viruses.discard(virus_name)
             
-            # Add to quarantined list
-            self.quarantined_viruses.append(virus_name)
+            # Add to quarantined set
+            self.quarantined_viruses.add(virus_name)
             
             # Add neutralized version
-            self.items[f"quarantined_{virus_name}"] = f"A neutralized version of {virus_name}, safely contained and no longer a threat."
+            self.items[QUARANTINED_PREFIX + virus_name] = f"A neutralized version of {virus_name}, safely contained and no longer a threat."
             
             # Increase security knowledge
             self.knowledge['security'] = min(MAX_KNOWLEDGE, self.knowledge['security'] + 2)
@@ -396,7 +375,7 @@ class Player:
             return f"Success! The {virus_name} has been quarantined from your inventory and can no longer harm the system."
             
         else:
-            return f"The {virus_name} is not in this location. You need to find where it's hiding."
+            return ErrorText(f"The {virus_name} is not in this location. You need to find where it's hiding.")
     
     def analyze(self, target):
         """
@@ -418,13 +397,14 @@ class Player:
     def _analyze_item(self, item_name, item_desc, in_inventory=False):
         """Helper method to analyze an item"""
         location = " in your inventory" if in_inventory else ""
+        flags = registry.get(item_name, item_desc).flags
         
         # Special analysis for different item types
-        if 'log' in item_name:
+        if flags & LOG:
             return self._analyze_log(item_name, item_desc)
-        elif 'calculation' in item_name or 'anomaly' in item_name:
+        elif flags & CALCULATION:
             return self._analyze_calculation(item_name, item_desc)
-        elif 'packet' in item_name:
+        elif flags & PACKET:
             return self._analyze_packet(item_name, item_desc)
         else:
             # Generic analysis
@@ -432,7 +412,7 @@ class Player:
     
     def _analyze_log(self, name, desc):
         """Analyze a log file"""
-        suspicious = 'suspicious' in desc or 'unusual' in desc
+        suspicious = registry.get(name, desc).flags & UNUSUAL
         activity_type = 'suspicious' if suspicious else 'normal'
         
         return f"Analysis of {name}:\n\n" + \
@@ -441,7 +421,7 @@ class Player:
     
     def _analyze_calculation(self, name, desc):
         """Analyze calculation or anomaly data"""
-        suspicious = 'suspicious' in desc or 'unusual' in desc
+        suspicious = registry.get(name, desc).flags & UNUSUAL
         finding = 'virus attempting to hide its operations' if suspicious else 'normal system process'
         
         return f"Analysis of {name}:\n\n" + \
@@ -450,7 +430,7 @@ class Player:
     
     def _analyze_packet(self, name, desc):
         """Analyze network packet data"""
-        suspicious = 'suspicious' in desc or 'unusual' in desc
+        suspicious = registry.get(name, desc).flags & UNUSUAL
         traffic_type = 'data exfiltration' if suspicious else 'normal network traffic'
         
         return f"Analysis of {name}:\n\n" + \
@@ -459,8 +439,7 @@ class Player:
     
     def _analyze_generic(self, name, desc, location=""):
         """Generic item analysis"""
-        suspicious_terms = ['suspicious', 'unusual', 'strange', 'abnormal', 'unexpected']
-        is_suspicious = any(term in desc.lower() for term in suspicious_terms)
+        is_suspicious = registry.get(name, desc).flags & ABNORMAL
         
         if is_suspicious:
             virus_hint = self._get_virus_hint(desc)
@@ -501,13 +480,13 @@ class Player:
         
         if self.found_viruses:
             result += "  Detected Viruses:\n"
-            for virus in self.found_viruses:
+            for virus in sorted(self.found_viruses):
                 result += f"    • {virus}\n"
             
         result += f"\n  Viruses Quarantined: {quarantined_bar} {len(self.quarantined_viruses)}/{len(VIRUS_TYPES)}\n"
         if self.quarantined_viruses:
             result += "  Neutralized Viruses:\n"
-            for virus in self.quarantined_viruses:
+            for virus in sorted(self.quarantined_viruses):
                 result += f"    • {virus}\n"
                 
         # Breadcrumb path - Show current location context
@@ -544,13 +523,6 @@ class Player:
     
     def _increase_component_knowledge(self):
         """Increase knowledge based on current component type"""
-        component_type = self._determine_component_type()
-        
-        if component_type == 'cpu':
-            self.knowledge['cpu'] = min(MAX_KNOWLEDGE, self.knowledge['cpu'] + 1)
-        elif component_type == 'memory':
-            self.knowledge['memory'] = min(MAX_KNOWLEDGE, self.knowledge['memory'] + 1)
-        elif component_type == 'storage':
-            self.knowledge['storage'] = min(MAX_KNOWLEDGE, self.knowledge['storage'] + 1)
-        elif component_type == 'network':
-            self.knowledge['networking'] = min(MAX_KNOWLEDGE, self.knowledge['networking'] + 1)
\ No newline at end of file
+        knowledge = self.knowledge
+        for area, points in self._classify_location().gains:
+            knowledge[area] = min(MAX_KNOWLEDGE, knowledge[area] + points)
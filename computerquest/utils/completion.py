@@ -0,0 +1,114 @@
+"""
+Tab completion engine
+
+Context-aware completion for the readline prompt. Each command declares
+which vocabulary its argument completes from (see Command.completes);
+candidates come from sorted vocabularies via bisect prefix ranges, and
+the options for a prefix are computed once per completion cycle.
+"""
+
+from bisect import bisect_left
+from computerquest.config import DIRECTION_NAMES
+
+def prefix_range(words, prefix):
+    """
+    Words starting with prefix
+
+    Args:
+        words (list): Sorted words
+        prefix (str): Prefix to look for
+
+    Returns:
+        list: The matching slice of words
+    """
+    start = bisect_left(words, prefix)
+    end = bisect_left(words, prefix + '\U0010ffff', start)
+    return words[start:end]
+
+class CompletionEngine:
+    """Completes command names and command arguments for the current game state"""
+    def __init__(self, game):
+        self.game = game
+        self._commands = None      # Sorted command names and macros
+        self._commands_key = None
+        self._topics = None
+        self._cycle_key = None     # (text before the word, word) of the current Tab cycle
+        self._cycle_options = []
+
+    def complete(self, line, begidx, text, state):
+        """
+        readline-style completion
+
+        Args:
+            line (str): Whole input line
+            begidx (int): Index where the word being completed starts
+            text (str): The word being completed
+            state (int): Index of the option wanted
+
+        Returns:
+            str: The state-th option, or None when there are no more
+        """
+        key = (line[:begidx], text)
+        if state == 0 or key != self._cycle_key:
+            self._cycle_key = key
+            self._cycle_options = self.options(line[:begidx], text)
+        if state < len(self._cycle_options):
+            return self._cycle_options[state]
+        return None
+
+    def options(self, before, text):
+        """All completions of text, given the line before it"""
+        # Only the command after the last ';' matters
+        words = before.rsplit(';', 1)[-1].split()
+        if not words:
+            return prefix_range(self.command_words(), text)
+
+        processor = self.game.command_processor
+        command = processor.commands.get(processor.resolve_command(words[0].lower()).name)
+        source = getattr(command, 'completes', None)
+        if source is None:
+            return []
+        return prefix_range(self.vocabulary(source), text)
+
+    def command_words(self):
+        """Sorted command names, aliases and macros"""
+        processor = self.game.command_processor
+        key = (id(processor.commands), len(processor.commands), len(processor.macros))
+        if self._commands is None or self._commands_key != key:
+            self._commands = sorted(set(processor.commands) | set(processor.macros))
+            self._commands_key = key
+        return self._commands
+
+    def vocabulary(self, source):
+        """
+        Sorted words for a completion source
+
+        Args:
+            source (str): 'room_items', 'inventory', 'items', 'exits',
+                'visited', 'topics' or 'macros'
+        """
+        player = self.game.player
+        if source == 'topics':
+            if self._topics is None:
+                from computerquest.utils.help_text import ABOUT_TOPICS
+                self._topics = sorted(ABOUT_TOPICS)
+            return self._topics
+        if source == 'macros':
+            return sorted(self.game.command_processor.macros)
+        if source == 'visited':
+            return sorted(key for key, room in self.game.game_map.rooms.items() if room.visited)
+        if player is None:
+            return []
+
+        # Rooms and inventories are small and change often; sort them per cycle
+        words = set()
+        if source in ('room_items', 'items') and player.location:
+            words.update(player.location.items)
+        if source in ('inventory', 'items'):
+            words.update(player.items)
+        if source == 'exits' and player.location:
+            for code in player.location.doors:
+                words.add(code)
+                if code in DIRECTION_NAMES:
+                    words.add(DIRECTION_NAMES[code].lower())
+        return sorted(word for word in words if isinstance(word, str))
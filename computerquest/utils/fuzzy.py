@@ -0,0 +1,133 @@
+"""
+Fuzzy matching index
+
+BK-tree over edit distance, used to suggest the nearest valid command,
+item or topic for a misspelled word.
+"""
+
+def edit_distance(a, b):
+    """
+    Levenshtein distance between two strings
+
+    Args:
+        a (str): First string
+        b (str): Second string
+
+    Returns:
+        int: Minimum number of insertions, deletions and substitutions
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,                       # Deletion
+                current[j - 1] + 1,                    # Insertion
+                previous[j - 1] + (char_a != char_b),  # Substitution
+            ))
+        previous = current
+    return previous[-1]
+
+class BKTree:
+    """Burkhard-Keller tree of words keyed by edit distance"""
+    def __init__(self, words=()):
+        self.root = None  # (word, {distance: child})
+        self.words = set()
+        for word in words:
+            self.add(word)
+
+    def add(self, word):
+        """Add a word to the tree"""
+        if word in self.words:
+            return
+        self.words.add(word)
+        if self.root is None:
+            self.root = (word, {})
+            return
+
+        node = self.root
+        while True:
+            distance = edit_distance(word, node[0])
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = (word, {})
+                return
+            node = child
+
+    def search(self, word, max_distance):
+        """
+        Find words within max_distance of word
+
+        Returns:
+            list: (distance, word) pairs, nearest first
+        """
+        if self.root is None:
+            return []
+
+        matches = []
+        stack = [self.root]
+        while stack:
+            candidate, children = stack.pop()
+            distance = edit_distance(word, candidate)
+            if distance <= max_distance:
+                matches.append((distance, candidate))
+            # Triangle inequality: only these subtrees can hold matches
+            for edge in range(distance - max_distance, distance + max_distance + 1):
+                child = children.get(edge)
+                if child is not None:
+                    stack.append(child)
+        matches.sort()
+        return matches
+
+class FuzzyIndex:
+    """Suggests the nearest known words for a misspelled one"""
+    def __init__(self, words=(), min_length=3):
+        self.tree = BKTree(words)
+        self.min_length = min_length  # Shorter words are too ambiguous to correct
+
+    def add(self, word):
+        """Add a word to the index"""
+        self.tree.add(word)
+
+    def tolerance(self, word):
+        """Edits allowed for a word of this length"""
+        return 1 if len(word) <= 4 else 2
+
+    def _matches(self, word, candidates):
+        """(distance, word) pairs within tolerance, restricted to candidates"""
+        if len(word) < self.min_length:
+            return []
+
+        allowed = None
+        if candidates is not None:
+            allowed = set(candidates)
+            # Words such as newly placed items are indexed the first time they are seen
+            for candidate in allowed - self.tree.words:
+                self.tree.add(candidate)
+
+        return [(distance, match) for distance, match in self.tree.search(word, self.tolerance(word))
+                if allowed is None or match in allowed]
+
+    def suggest(self, word, candidates=None, limit=3):
+        """
+        Suggest the nearest known words
+
+        Args:
+            word (str): The misspelled word
+            candidates (iterable): Restrict suggestions to these words (e.g. the
+                items in the current room)
+            limit (int): Maximum number of suggestions
+
+        Returns:
+            list: Suggested words, nearest first
+        """
+        return [match for _, match in self._matches(word, candidates)][:limit]
+
+    def correct(self, word, candidates=None):
+        """Return the single nearest word, or None if there is no clear winner"""
+        matches = self._matches(word, candidates)
+        if not matches or (len(matches) > 1 and matches[1][0] == matches[0][0]):
+            return None
+        return matches[0][1]
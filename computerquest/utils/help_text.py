@@ -0,0 +1,214 @@
+"""
+Help and reference text
+
+Long help screens and educational topics, imported on first use so they
+don't weigh on startup.
+"""
+
+from computerquest.utils.helpers import Colors
+
+def full_help():
+    """Full command reference shown by the help command"""
+    return f"""┏━━━━━━━━━━━━━━━━━━ {Colors.YELLOW}{Colors.BOLD}KODEKLOUD COMPUTER QUEST COMMANDS{Colors.RESET} ━━━━━━━━━━━━━━━━━━┓
+│                                                                          │
+│  {Colors.BOLD}Movement:{Colors.RESET}                                                               │
+│    go [direction]   - Move between components (n, s, e, w, ne, sw, etc.) │
+│    [direction]      - You can also just type the direction (n, s, e, w)  │
+│    {Colors.GREEN}goto [place]{Colors.RESET}     - Travel to a visited component by shortest route    │
+│                                                                          │
+│  {Colors.BOLD}Exploration:{Colors.RESET}                                                            │
+│    {Colors.GREEN}look, l{Colors.RESET}          - Examine your current location                      │
+│    {Colors.GREEN}look [item]{Colors.RESET}      - Examine a specific item                            │
+│    {Colors.GREEN}read [item], r{Colors.RESET}   - Read text content of an item                       │
+│    {Colors.GREEN}map, m{Colors.RESET}           - Display a map of visited computer components       │
+│    {Colors.GREEN}motherboard, mb{Colors.RESET}  - Show the motherboard layout of the computer system │
+│                                                                          │
+│  {Colors.BOLD}Inventory:{Colors.RESET}                                                              │
+│    {Colors.GREEN}inventory, i{Colors.RESET}     - List items in your storage                         │
+│    {Colors.GREEN}take [item], t{Colors.RESET}   - Add an item to your inventory                      │
+│    {Colors.GREEN}drop [item]{Colors.RESET}      - Remove an item from your inventory                 │
+│                                                                          │
+│  {Colors.BOLD}Security Functions:{Colors.RESET}                                                     │
+│    {Colors.GREEN}scan, s{Colors.RESET}          - Search for viruses in current location             │
+│    {Colors.GREEN}scan [item]{Colors.RESET}      - Check if a specific item contains a virus          │
+│    {Colors.GREEN}advscan{Colors.RESET}          - Perform advanced scan (requires decoder_tool)      │
+│    {Colors.GREEN}advscan [item]{Colors.RESET}   - Perform advanced scan on specific item             │
+│    {Colors.GREEN}analyze [item]{Colors.RESET}   - Deeply analyze an item for hidden properties       │
+│    {Colors.GREEN}quarantine [virus]{Colors.RESET} - Contain a discovered virus                       │
+│                                                                          │
+│  {Colors.BOLD}Information:{Colors.RESET}                                                            │
+│    {Colors.GREEN}status{Colors.RESET}           - Check your virus discovery progress                │
+│    {Colors.GREEN}knowledge{Colors.RESET}        - View your computer architecture knowledge          │
+│    {Colors.GREEN}about [topic]{Colors.RESET}    - Get information about a computer component         │
+│                                                                          │
+│  {Colors.BOLD}Progress Tracking:{Colors.RESET}                                                      │
+│    {Colors.GREEN}achievements{Colors.RESET}     - View your achievements and progress report         │
+│    {Colors.GREEN}stats{Colors.RESET}            - Alternative command for achievements               │
+│    {Colors.GREEN}leaderboard{Colors.RESET}      - Best finished runs (world <pack>, cohort <week>)   │
+│                                                                          │
+│  {Colors.BOLD}Educational Features:{Colors.RESET}                                                   │
+│    {Colors.GREEN}visualize [comp]{Colors.RESET} - Show visualization of a component                  │
+│    {Colors.GREEN}viz [comp]{Colors.RESET}       - Shorthand for visualize                            │
+│    {Colors.GREEN}simulate cpu{Colors.RESET}     - Start CPU pipeline simulation minigame             │
+│    {Colors.GREEN}simulate memory{Colors.RESET}  - Start memory hierarchy simulation                  │
+│    {Colors.GREEN}simulate step{Colors.RESET}    - Advance simulation by one step                     │
+│    {Colors.GREEN}simulate toggle{Colors.RESET}  - Toggle between simulation modes                    │
+│    {Colors.GREEN}simulate reset{Colors.RESET}   - Reset the simulation                               │
+│                                                                          │
+│  {Colors.BOLD}Save/Load:{Colors.RESET}                                                              │
+│    {Colors.GREEN}save [name]{Colors.RESET}      - Save your game progress (optional name)            │
+│    {Colors.GREEN}load [name]{Colors.RESET}      - Load a saved game                                  │
+│    {Colors.GREEN}saves{Colors.RESET}            - List all available save files                      │
+│    {Colors.GREEN}deletesave [name]{Colors.RESET} - Delete a saved game                               │
+│                                                                          │
+│  {Colors.BOLD}System:{Colors.RESET}                                                                 │
+│    {Colors.GREEN}help, h{Colors.RESET}          - Show this help message                             │
+│    {Colors.GREEN}?{Colors.RESET}                - Show quick help overlay                            │
+│    {Colors.GREEN}clear, cls, c{Colors.RESET}    - Clear the screen and refresh display               │
+│    {Colors.GREEN}quit, q, exit{Colors.RESET}    - Exit the game                                      │
+│    {Colors.GREEN}cmd; cmd; ...{Colors.RESET}    - Run several commands, showing the last result      │
+│    {Colors.GREEN}macro [name] = ...{Colors.RESET} - Define a macro (macro alone lists them)          │
+│    {Colors.GREEN}jobs{Colors.RESET}             - List simulations running in the background         │
+│    {Colors.GREEN}cancel [n]{Colors.RESET}       - Stop a background job (the latest by default)      │
+│                                                                          │
+┗━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┛
+
+{Colors.BOLD}Main Shortcuts:{Colors.RESET}
+  Movement: {Colors.GREEN}[N]{Colors.RESET}orth {Colors.GREEN}[S]{Colors.RESET}outh {Colors.GREEN}[E]{Colors.RESET}ast {Colors.GREEN}[W]{Colors.RESET}est {Colors.GREEN}[NE]{Colors.RESET} {Colors.GREEN}[SE]{Colors.RESET} {Colors.GREEN}[SW]{Colors.RESET} {Colors.GREEN}[NW]{Colors.RESET} {Colors.CYAN}[U]{Colors.RESET}p {Colors.CYAN}[D]{Colors.RESET}own
+  Commands: {Colors.GREEN}[L]{Colors.RESET}ook {Colors.GREEN}[I]{Colors.RESET}nventory {Colors.GREEN}[T]{Colors.RESET}ake {Colors.GREEN}[H]{Colors.RESET}elp {Colors.GREEN}[M]{Colors.RESET}ap {Colors.GREEN}[C]{Colors.RESET}lear {Colors.GREEN}[Q]{Colors.RESET}uit {Colors.GREEN}[S]{Colors.RESET}can
+  
+Use '{Colors.GREEN}?{Colors.RESET}' for a quick command reference at any time.
+"""
+
+def quick_help():
+    """Compact command overlay shown by the ? command"""
+    return f"""┏━━━━━━━━━━━━━━━━━━━━━ {Colors.YELLOW}{Colors.BOLD}COMMAND REFERENCE{Colors.RESET} ━━━━━━━━━━━━━━━━━━━━━┓
+│                                                                      │
+│  {Colors.BOLD}Movement:{Colors.RESET}                                                           │
+│    {Colors.GREEN}n, s, e, w{Colors.RESET} - Go North, South, East, West                         │
+│    {Colors.GREEN}ne, nw, se, sw{Colors.RESET} - Go Northeast, Northwest, Southeast, Southwest   │
+│    {Colors.CYAN}u, d{Colors.RESET} - Go Up, Down                                               │
+│                                                                      │
+│  {Colors.BOLD}Basic Commands:{Colors.RESET}                                                     │
+│    {Colors.GREEN}l, look{Colors.RESET} - Examine your surroundings or an item                    │
+│    {Colors.GREEN}look [item]{Colors.RESET} - Examine a specific item                             │
+│    {Colors.GREEN}i{Colors.RESET} - Check your inventory                                          │
+│    {Colors.GREEN}t [item]{Colors.RESET} - Take an item                                           │
+│    {Colors.GREEN}drop [item]{Colors.RESET} - Remove an item from your inventory                  │
+│    {Colors.GREEN}m{Colors.RESET} - Show map                                                      │
+│    {Colors.GREEN}mb{Colors.RESET} - Show motherboard layout                                      │
+│    {Colors.GREEN}c{Colors.RESET} - Clear screen                                                  │
+│                                                                      │
+│  {Colors.BOLD}Security Functions:{Colors.RESET}                                                 │
+│    {Colors.GREEN}s, scan{Colors.RESET} - Scan for viruses in current location                    │
+│    {Colors.GREEN}scan [item]{Colors.RESET} - Check if an item contains a virus                   │
+│    {Colors.GREEN}quarantine [virus]{Colors.RESET} - Contain a discovered virus                   │
+│    {Colors.GREEN}advscan{Colors.RESET} - Perform advanced scan (requires decoder_tool)           │
+│                                                                      │
+│  {Colors.BOLD}Information & Progress:{Colors.RESET}                                             │
+│    {Colors.GREEN}status{Colors.RESET} - Check your virus discovery progress                      │
+│    {Colors.GREEN}knowledge{Colors.RESET} - View your computer architecture knowledge             │
+│    {Colors.GREEN}about [topic]{Colors.RESET} - Get information about a computer component        │
+│    {Colors.GREEN}achievements{Colors.RESET} - View your achievements and progress                │
+│                                                                      │
+│  {Colors.BOLD}Educational Features:{Colors.RESET}                                               │
+│    {Colors.GREEN}viz [comp]{Colors.RESET} - Show visualization of a component                    │
+│    {Colors.GREEN}simulate cpu{Colors.RESET} - Start CPU pipeline simulation                      │
+│    {Colors.GREEN}simulate memory{Colors.RESET} - Start memory hierarchy simulation               │
+│                                                                      │
+│  {Colors.BOLD}System Commands:{Colors.RESET}                                                    │
+│    {Colors.GREEN}help, h{Colors.RESET} - Show full help message                                  │
+│    {Colors.GREEN}save [name]{Colors.RESET} - Save your game progress                             │
+│    {Colors.GREEN}load [name]{Colors.RESET} - Load a saved game                                   │
+│    {Colors.GREEN}saves{Colors.RESET} - List available save files                                 │
+│    {Colors.GREEN}q{Colors.RESET} - Quit game                                                     │
+│                                                                      │
+┗━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┛
+
+{Colors.BOLD}TIP:{Colors.RESET} Use {Colors.BOLD}Tab{Colors.RESET} key for command completion and {Colors.BOLD}Up/Down arrows{Colors.RESET} for command history!"""
+
+# Educational topics for the about command
+ABOUT_TOPICS = {
+    "cpu": """CPU (Central Processing Unit):
+The CPU is the primary component that executes instructions and processes data. It consists of:
+- Control Unit: Coordinates CPU operations and decodes instructions
+- ALU (Arithmetic Logic Unit): Performs mathematical calculations
+- Registers: Ultra-fast storage locations for immediate data
+- Cache: Fast memory that stores frequently used data
+The CPU operates using a cycle of fetch, decode, execute, and writeback phases.""",
+
+    "memory": """Computer Memory Hierarchy:
+Computer systems use multiple types of memory arranged in a hierarchy:
+1. Registers: Tiny, ultra-fast storage inside the CPU
+2. Cache Memory: Small, very fast memory close to the CPU (L1, L2, L3)
+3. RAM: Main system memory, volatile (erased when powered off)
+4. Virtual Memory: Uses hard drive space as an extension of RAM
+5. Storage: HDD/SSD for permanent data storage
+As you move down the hierarchy, capacity increases but speed decreases.""",
+
+    "cache": """Cache Memory:
+Cache memory serves as a high-speed buffer between the CPU and main memory.
+- L1 Cache: Smallest, fastest cache, located in the CPU
+- L2 Cache: Larger but slightly slower than L1
+- L3 Cache: Largest but slowest cache, often shared between CPU cores
+Caches use principles of temporal locality (recently used data will be used again soon) and spatial locality (data near recently used data will be used soon).""",
+
+    "storage": """Storage Systems:
+Storage provides permanent data retention, unlike volatile RAM:
+- SSD (Solid State Drive): Uses flash memory, no moving parts, fast
+- HDD (Hard Disk Drive): Uses magnetic storage on spinning platters
+- Storage Controller: Manages data flow between system and storage
+- File Systems: Organize data into files and directories
+Storage operations are much slower than memory but retain data without power.""",
+
+    "bus": """System Bus Architecture:
+Buses are communication pathways that transfer data between components:
+- System Bus: Main pathway connecting CPU, memory, and I/O
+- Address Bus: Carries memory addresses
+- Data Bus: Carries the actual data being transferred
+- Control Bus: Carries command signals
+- PCI/PCIe: High-speed buses for connecting expansion cards
+Bus width (16, 32, 64-bit) determines how much data can be transferred at once.""",
+
+    "network": """Network Interface:
+The network component connects the computer to other systems:
+- Network Interface Card: Hardware that enables network connectivity
+- Protocol Stack: Software layers that format and process network data
+- Packets: Units of data transferred over networks
+- Protocols: Rules that govern how data is transmitted (e.g., TCP/IP)
+Network interfaces handle encoding/decoding data and managing connections.""",
+
+    "firmware": """Firmware/BIOS:
+Firmware is software permanently programmed into hardware:
+- BIOS/UEFI: Initialize hardware components during boot
+- ROM (Read-Only Memory): Stores permanent firmware
+- Boot Sequence: Process of starting up computer hardware
+- Hardware Configuration: Settings for system components
+Firmware operates at a lower level than the operating system.""",
+
+    "gpu": """Graphics Processing Unit (GPU):
+The GPU specializes in parallel processing for graphics and computation:
+- Shader Cores: Small processors that handle graphical calculations
+- VRAM: Specialized memory for storing graphical data
+- Render Pipeline: Stages for transforming 3D data to 2D images
+- GPGPU: General-purpose computing on GPUs for non-graphics tasks
+GPUs excel at tasks that can be broken into many parallel operations.""",
+
+    "kernel": """Operating System Kernel:
+The kernel is the core of the operating system:
+- Process Management: Creates and schedules processes
+- Memory Management: Allocates and tracks system memory
+- Device Drivers: Interfaces with hardware components
+- File Systems: Manages data storage and retrieval
+- System Calls: Provides services to applications
+The kernel operates in a privileged mode with direct hardware access.""",
+
+    "virus": """Computer Viruses:
+Viruses are malicious programs that can damage systems:
+- Boot Sector Virus: Infects system startup areas
+- Rootkit: Hides in the operating system kernel
+- Memory-Resident Virus: Operates entirely in RAM
+- Firmware Virus: Infects system firmware/BIOS
+- Network Virus: Spreads via network connections
+Viruses typically attempt to hide their presence and propagate to other systems."""
+}
@@ -19,6 +19,84 @@ class Colors:
     UNDERLINE = "\033[4m"
     REVERSED = "\033[7m"
 
+class LazyText:
+    """
+    Deferred command output
+
+    Wraps a render function and its arguments and only builds the text the
+    first time the result is displayed (str(), print, f-strings, ``in``).
+    Callers that discard command results (bots, replays, scripted grading)
+    never pay for the formatting. The text reflects the game state at the
+    moment it is rendered; after that it is cached.
+    """
+    __slots__ = ('_render', '_args', '_text')
+
+    def __init__(self, render, *args):
+        self._render = render
+        self._args = args
+        self._text = None
+
+    @property
+    def rendered(self):
+        """True once the text has been built"""
+        return self._text is not None
+
+    def __str__(self):
+        if self._text is None:
+            self._text = self._render(*self._args)
+            # Drop references to game objects once we have the text
+            self._render = None
+            self._args = ()
+        return self._text
+
+    def __repr__(self):
+        state = "rendered" if self._text is not None else "pending"
+        return f"<LazyText {state}>"
+
+    def __format__(self, spec):
+        return format(str(self), spec)
+
+    def __add__(self, other):
+        # Concatenation stays lazy so appended achievement notices are free too
+        return LazyText(_concat_text, self, other)
+
+    def __radd__(self, other):
+        return LazyText(_concat_text, other, self)
+
+    def __contains__(self, value):
+        return value in str(self)
+
+    def __eq__(self, other):
+        return str(self) == str(other)
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def __len__(self):
+        return len(str(self))
+
+    def __getitem__(self, index):
+        return str(self)[index]
+
+    def __getattr__(self, name):
+        # Expose the usual str API (lower, split, startswith, ...)
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(str(self), name)
+
+class ErrorText(str):
+    """
+    Message from a command that failed
+
+    Behaves exactly like the plain message; the type lets command chains
+    and macros stop at the first failing step.
+    """
+    __slots__ = ()
+
+def _concat_text(first, second):
+    """Render and join two text fragments (used by LazyText concatenation)"""
+    return str(first) + str(second)
+
 def prefix_match(prefix, candidates):
     """
     Match a prefix with candidates, return the full string if unique match is found
@@ -130,6 +208,48 @@ def format_list(items, prefix="- "):
         
     return "\n".join(f"{prefix}{item}" for item in items)
 
+def technical_details(location):
+    """
+    Build the technical details lines shown for visited components
+
+    Args:
+        location: Component object
+
+    Returns:
+        list: Detail lines, or None if the component hasn't been visited
+    """
+    if not location.visited:
+        return None
+
+    details = []
+    if location.security_level > 0:
+        details.append(f"Security Level: {location.security_level}")
+    if location.data_types:
+        details.append(f"Data Types: {', '.join(location.data_types)}")
+    if any(location.performance.values()):
+        details.append("Performance Metrics:")
+        for metric, value in location.performance.items():
+            if value > 0:
+                details.append(f"  * {metric.capitalize()}: {value}/10")
+    return details
+
+def render_location(location):
+    """
+    Render the full look output for a component from its current state
+
+    Args:
+        location: Component object
+
+    Returns:
+        str: Formatted look output
+    """
+    return format_look_output(
+        location=location,
+        connections=location.doors,
+        items=list(location.items.keys()),
+        technical_details=technical_details(location)
+    )
+
 def format_look_output(location, connections, items, technical_details=None):
     """
     Format the look command output for better readability.
@@ -0,0 +1,166 @@
+"""
+Command latency instrumentation
+
+Times every dispatched command with perf_counter_ns into per-command
+histograms and can sample peak allocations with tracemalloc. The report
+is shown by the hidden 'perf' command and by main.py --perf-report.
+"""
+
+import math
+import time
+
+# Sub-buckets per power of two; 8 keeps percentiles within ~12%
+SUB_BUCKETS = 8
+
+def bucket_index(ns):
+    """Histogram bucket for a duration: exact below 16 ns, then log-linear"""
+    bits = ns.bit_length()
+    if bits <= 4:
+        return ns
+    shift = bits - 4
+    return shift * SUB_BUCKETS + (ns >> shift)
+
+def bucket_bounds(index):
+    """Smallest and largest duration falling in a bucket"""
+    if index < 2 * SUB_BUCKETS:
+        return index, index
+    shift = index // SUB_BUCKETS - 1
+    mantissa = index % SUB_BUCKETS + SUB_BUCKETS
+    return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+def format_ns(ns):
+    """Human readable duration"""
+    if ns < 1000:
+        return f"{ns:.0f} ns"
+    if ns < 1000000:
+        return f"{ns / 1000:.1f} us"
+    return f"{ns / 1000000:.1f} ms"
+
+class LatencyHistogram:
+    """Log-linear histogram of durations in nanoseconds"""
+    __slots__ = ('buckets', 'count', 'total', 'max')
+
+    def __init__(self):
+        self.buckets = {}
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, ns):
+        """Add one duration"""
+        index = bucket_index(ns)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += ns
+        if ns > self.max:
+            self.max = ns
+
+    def percentile(self, pct):
+        """
+        Approximate percentile
+
+        Args:
+            pct (float): Percentile between 0 and 100
+
+        Returns:
+            int: Duration in ns (bucket midpoint, never above the maximum)
+        """
+        if not self.count:
+            return 0
+        rank = max(1, math.ceil(self.count * pct / 100))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                low, high = bucket_bounds(index)
+                return min((low + high) // 2, self.max)
+        return self.max
+
+class PerfRecorder:
+    """Per-command latency and allocation statistics"""
+    def __init__(self, sample_allocations=0):
+        self.histograms = {}
+        self.allocations = {}  # name -> [samples, total peak bytes, max peak bytes]
+        self.sample_allocations = 0
+        self.set_allocation_sampling(sample_allocations)
+
+    def set_allocation_sampling(self, every):
+        """
+        Sample peak allocation size on every Nth call of each command with
+        tracemalloc (0 disables)
+        """
+        self.sample_allocations = every
+        if every:
+            import tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+
+    def measure(self, name, fn, *args):
+        """Call fn(*args), recording its duration (and sometimes allocations) under name"""
+        if self.sample_allocations:
+            histogram = self.histograms.get(name)
+            if histogram is None or histogram.count % self.sample_allocations == 0:
+                return self._measure_allocations(name, fn, args)
+
+        start = time.perf_counter_ns()
+        try:
+            return fn(*args)
+        finally:
+            self.record(name, time.perf_counter_ns() - start)
+
+    def _measure_allocations(self, name, fn, args):
+        """Timed call that also records the peak memory allocated during it"""
+        import tracemalloc
+
+        if hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+        else:
+            # Python 3.8 has no reset_peak; clearing the traces also resets the peak
+            tracemalloc.clear_traces()
+        baseline = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter_ns()
+        try:
+            return fn(*args)
+        finally:
+            self.record(name, time.perf_counter_ns() - start)
+            peak = tracemalloc.get_traced_memory()[1] - baseline
+            stats = self.allocations.setdefault(name, [0, 0, 0])
+            stats[0] += 1
+            stats[1] += peak
+            stats[2] = max(stats[2], peak)
+
+    def record(self, name, ns):
+        """Record a duration measured elsewhere"""
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = LatencyHistogram()
+        histogram.record(ns)
+
+    def reset(self):
+        """Forget all measurements"""
+        self.histograms.clear()
+        self.allocations.clear()
+
+    def report(self):
+        """Table of p50/p99/max per command, slowest p99 first"""
+        if not self.histograms:
+            return "No commands timed yet."
+
+        lines = ["PERFORMANCE REPORT", "==================", ""]
+        lines.append(f"{'Command':<24}{'calls':>7}{'p50':>11}{'p99':>11}{'max':>11}{'total':>11}")
+        rows = sorted(self.histograms.items(), key=lambda item: item[1].percentile(99), reverse=True)
+        for name, histogram in rows:
+            lines.append(
+                f"{name:<24}{histogram.count:>7}"
+                f"{format_ns(histogram.percentile(50)):>11}"
+                f"{format_ns(histogram.percentile(99)):>11}"
+                f"{format_ns(histogram.max):>11}"
+                f"{format_ns(histogram.total):>11}"
+            )
+
+        if self.allocations:
+            lines += ["", f"{'Peak allocation':<24}{'samples':>7}{'mean':>11}{'max':>11}"]
+            for name, (samples, total, largest) in sorted(self.allocations.items()):
+                lines.append(f"{name:<24}{samples:>7}{total / samples / 1024:>9.1f}KB{largest / 1024:>9.1f}KB")
+
+        return "\n".join(lines)
@@ -0,0 +1,111 @@
+"""
+Command name trie
+
+Resolves exact command names, aliases, unique prefixes and known typos
+with a single walk down a prefix tree.
+"""
+
+from collections import namedtuple
+
+# Outcome of resolving a word: the name to use, how it was found and,
+# for ambiguous prefixes, the names it could stand for
+Resolution = namedtuple('Resolution', ['name', 'kind', 'candidates'])
+
+EXACT = 'exact'
+TYPO = 'typo'
+PREFIX = 'prefix'
+AMBIGUOUS = 'ambiguous'
+UNKNOWN = 'unknown'
+
+class _Node:
+    """A single trie node"""
+    __slots__ = ('children', 'word', 'correction', 'count', 'sample')
+
+    def __init__(self):
+        self.children = {}
+        self.word = None        # Name ending at this node
+        self.correction = None  # Name this node is a known typo of
+        self.count = 0          # Names (not typos) ending in this subtree
+        self.sample = None      # One of those names, the only one when count == 1
+
+class CommandTrie:
+    """Prefix tree over command names and their known typos"""
+    def __init__(self, names=(), typos=None, min_prefix=2):
+        self.root = _Node()
+        self.min_prefix = min_prefix  # Shorter prefixes only resolve exactly
+        for name in names:
+            self.add(name)
+        for typo, name in (typos or {}).items():
+            self.add_typo(typo, name)
+
+    def _node_for(self, word):
+        """Walk to the node for word, creating nodes as needed"""
+        node = self.root
+        path = [node]
+        for char in word:
+            node = node.children.setdefault(char, _Node())
+            path.append(node)
+        return node, path
+
+    def add(self, name):
+        """Add a command name"""
+        node, path = self._node_for(name)
+        if node.word is not None:
+            return
+        node.word = name
+        for step in path:
+            step.count += 1
+            if step.sample is None:
+                step.sample = name
+
+    def add_typo(self, typo, name):
+        """Add a known misspelling that resolves to name"""
+        node, _ = self._node_for(typo)
+        node.correction = name
+
+    def _find(self, word):
+        """Return the node for word, or None if no name or typo starts with it"""
+        node = self.root
+        for char in word:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def names_under(self, node):
+        """All names in the subtree rooted at node, sorted"""
+        names = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current.word is not None:
+                names.append(current.word)
+            stack.extend(current.children.values())
+        return sorted(names)
+
+    def resolve(self, word):
+        """
+        Resolve a typed word to a command name
+
+        Args:
+            word (str): The word as typed (already lowercased)
+
+        Returns:
+            Resolution: name is the resolved command, or word itself when
+            the word is unknown or ambiguous
+        """
+        node = self._find(word)
+        if node is None:
+            return Resolution(word, UNKNOWN, ())
+
+        # Known typos win, as they did before prefix matching
+        if node.correction is not None:
+            return Resolution(node.correction, TYPO, ())
+        if node.word is not None:
+            return Resolution(word, EXACT, ())
+
+        if len(word) < self.min_prefix or node.count == 0:
+            return Resolution(word, UNKNOWN, ())
+        if node.count == 1:
+            return Resolution(node.sample, PREFIX, ())
+        return Resolution(word, AMBIGUOUS, tuple(self.names_under(node)))
@@ -0,0 +1,256 @@
+"""
+Procedural world generator
+
+Builds parameterized machines (sockets of cores, memory channels of DIMMs,
+PCIe devices, storage arrays and NICs) as WorldData, so worlds far larger
+than the built-in one can drive load tests and benchmarks. Every connection
+is generated in both directions; viruses are placed in components of a
+fitting kind, chosen by a seeded random generator.
+"""
+
+import random
+from collections import namedtuple
+from computerquest.world.architecture import ComputerArchitecture
+from computerquest.world.loader import WorldData
+
+MachineSpec = namedtuple('MachineSpec', [
+    'sockets', 'cores', 'channels', 'dimms_per_channel',
+    'pcie_devices', 'storage_arrays', 'drives_per_array', 'nics', 'seed',
+], defaults=(1, 2, 2, 2, 3, 1, 2, 1, 0))
+
+# Components of one core: the core itself and its five units
+CORE_PARTS = (
+    ("cu", "Control Unit", "coordinates fetching and decoding instructions"),
+    ("alu", "ALU", "performs arithmetic and logical operations"),
+    ("registers", "Registers", "holds the values being actively processed"),
+    ("l1", "L1 Cache", "serves the core's most recently used instructions and data"),
+    ("l2", "L2 Cache", "caches data for this core only, between L1 and the shared L3"),
+)
+
+# Kind of component each virus hides in
+VIRUS_HOSTS = {
+    'boot_sector_virus': 'drive',
+    'rootkit_virus': 'registers',
+    'memory_resident_virus': 'dimm',
+    'firmware_virus': 'bios',
+    'packet_sniffer_virus': 'nic',
+}
+
+# Documents placed in the first socket, as in the built-in world
+DOCUMENT_HOSTS = {
+    'decoder_tool': 's0_core0_cu',
+    'register_log': 's0_core0_registers',
+    'strange_calculation': 's0_core0_alu',
+    'parallel_instructions': 's0_core1_cu',
+    'vector_operations': 's0_core1_alu',
+    'thread_state': 's0_core1_registers',
+    'memory_leak': 's0_l3',
+}
+
+def component_count(spec):
+    """
+    Number of components a spec generates
+
+    Args:
+        spec (MachineSpec): Machine parameters
+
+    Returns:
+        int: Component count
+    """
+    per_socket = 3 + spec.cores * (1 + len(CORE_PARTS)) + spec.channels * (1 + spec.dimms_per_channel)
+    io = 6 + spec.pcie_devices + spec.storage_arrays * (1 + spec.drives_per_array) + spec.nics
+    return spec.sockets * per_socket + io
+
+def spec_for_size(components, **parameters):
+    """
+    A spec generating at least the given number of components
+
+    Args:
+        components (int): Target component count
+        **parameters: MachineSpec fields to fix; sockets is scaled to fit
+
+    Returns:
+        MachineSpec: The scaled spec
+    """
+    defaults = dict(cores=16, channels=8, dimms_per_channel=4, pcie_devices=64,
+                    storage_arrays=8, drives_per_array=16, nics=8)
+    defaults.update(parameters)
+    spec = MachineSpec(sockets=1, **defaults)
+    per_socket = component_count(spec._replace(sockets=2)) - component_count(spec)
+    missing = max(0, components - component_count(spec))
+    return spec._replace(sockets=1 + -(-missing // per_socket))
+
+class _Builder:
+    """Accumulates generated components and their connections"""
+    def __init__(self):
+        self.entries = {}  # key -> [name, description, id, exits dict, items list]
+        self.kinds = {}    # kind -> [keys]
+
+    def add(self, key, kind, name, description):
+        """Add a component and return its key"""
+        self.entries[key] = [name, description, f"G{len(self.entries):06d}", {}, []]
+        self.kinds.setdefault(kind, []).append(key)
+        return key
+
+    def link(self, a, b, direction, back_direction):
+        """Connect two components in both directions"""
+        self.entries[a][3][direction] = b
+        self.entries[b][3][back_direction] = a
+
+    def attach(self, parent, children):
+        """
+        Hang children below a parent: down to the first child, then east
+        along the row, with up and west leading back
+        """
+        if not children:
+            return
+        self.link(parent, children[0], 'd', 'u')
+        for left, right in zip(children, children[1:]):
+            self.link(left, right, 'e', 'w')
+
+def _build_socket(builder, s, spec):
+    """Add one CPU socket with its cores, caches and memory"""
+    package = builder.add(f"s{s}_package", 'package', f"CPU Socket {s}",
+                          f"The CPU package in socket {s}, holding {spec.cores} cores, "
+                          f"a shared L3 cache and the memory controller.")
+    row = [
+        builder.add(f"s{s}_l3", 'l3', f"Socket {s} L3 Cache",
+                    f"The L3 cache shared by all cores in socket {s}."),
+        builder.add(f"s{s}_mc", 'memory_controller', f"Socket {s} Memory Controller",
+                    f"The memory controller of socket {s}, driving {spec.channels} channels of RAM."),
+    ]
+
+    for c in range(spec.cores):
+        core = builder.add(f"s{s}_core{c}", 'core', f"Socket {s} Core {c}",
+                           f"Core {c} of socket {s}, with its own control unit, ALU, registers and caches.")
+        builder.attach(core, [
+            builder.add(f"{core}_{part}", part, f"Socket {s} Core {c} {label}",
+                        f"This unit of core {c} in socket {s} {role}.")
+            for part, label, role in CORE_PARTS
+        ])
+        row.append(core)
+    builder.attach(package, row)
+
+    channels = []
+    for ch in range(spec.channels):
+        channel = builder.add(f"s{s}_ch{ch}", 'channel', f"Socket {s} Memory Channel {ch}",
+                              f"Memory channel {ch} of socket {s}, shared by {spec.dimms_per_channel} DIMMs.")
+        builder.attach(channel, [
+            builder.add(f"{channel}_dimm{d}", 'dimm', f"Socket {s} Channel {ch} DIMM {d}",
+                        "A RAM module of volatile memory cells, refreshed thousands of times a second.")
+            for d in range(spec.dimms_per_channel)
+        ])
+        channels.append(channel)
+    builder.attach(row[1], channels)
+    return package
+
+def _build_io(builder, spec):
+    """Add the chipset with its firmware, PCIe, storage and network devices"""
+    pch = builder.add("pch", 'pch', "Platform Controller Hub",
+                      "The chipset connecting the CPUs to firmware, expansion cards, storage and network.")
+    bios = builder.add("bios", 'bios', "BIOS/UEFI", "The firmware that initializes the hardware at boot.")
+    pcie = builder.add("pcie_controller", 'pcie_controller', "PCIe Controller",
+                       f"The PCIe root complex, with {spec.pcie_devices} devices attached.")
+    storage = builder.add("storage_controller", 'storage_controller', "Storage Controller",
+                          f"The storage controller, managing {spec.storage_arrays} drive arrays.")
+    network = builder.add("network_controller", 'network_controller', "Network Controller",
+                          f"The network controller, with {spec.nics} interfaces.")
+    builder.attach(pch, [bios, pcie, storage, network])
+
+    builder.attach(pcie, [
+        builder.add(f"pcie{p}", 'pcie_device', f"PCIe Device {p}",
+                    f"An expansion card in PCIe slot {p}.")
+        for p in range(spec.pcie_devices)
+    ])
+
+    arrays = []
+    for a in range(spec.storage_arrays):
+        array = builder.add(f"array{a}", 'array', f"Storage Array {a}",
+                            f"A RAID array of {spec.drives_per_array} drives.")
+        builder.attach(array, [
+            builder.add(f"{array}_drive{d}", 'drive', f"Array {a} Drive {d}",
+                        "A drive storing data persistently, even when the power is off.")
+            for d in range(spec.drives_per_array)
+        ])
+        arrays.append(array)
+    builder.attach(storage, arrays)
+
+    builder.attach(network, [
+        builder.add(f"nic{n}", 'nic', f"Network Interface {n}",
+                    "A network interface sending and receiving packets on the wire.")
+        for n in range(spec.nics)
+    ])
+    return pch
+
+def generate_world_data(spec, base=None):
+    """
+    Generate a machine
+
+    Args:
+        spec (MachineSpec): Machine parameters
+        base (WorldData): World whose item and virus descriptions and starting
+            inventory are reused (defaults to the built-in world)
+
+    Returns:
+        WorldData: The generated world
+    """
+    if base is None:
+        from computerquest.world.loader import load_world_data
+        base = load_world_data()
+
+    builder = _Builder()
+    board = builder.add("motherboard", 'motherboard', "Motherboard",
+                        f"The motherboard of a {spec.sockets}-socket machine with "
+                        f"{component_count(spec)} components.")
+    pch = _build_io(builder, spec)
+    builder.attach(board, [pch] + [_build_socket(builder, s, spec) for s in range(spec.sockets)])
+
+    entries = builder.entries
+    entries[board][4].append('instruction_manual')
+    for item_id, key in DOCUMENT_HOSTS.items():
+        if key in entries:
+            entries[key][4].append(item_id)
+
+    rng = random.Random(spec.seed)
+    keys = list(entries)
+    viruses = tuple(
+        (virus_id, rng.choice(builder.kinds.get(VIRUS_HOSTS.get(virus_id), keys)))
+        for virus_id, _ in base.viruses
+    )
+
+    components = tuple(
+        (key, name, description, iden, True, tuple(exits.items()), tuple(items))
+        for key, (name, description, iden, exits, items) in entries.items()
+    )
+    return WorldData(components, base.items, base.inventory, viruses, board, base.catalog)
+
+class GeneratedArchitecture(ComputerArchitecture):
+    """A ComputerArchitecture built from a MachineSpec instead of the data files"""
+    def __init__(self, spec=None, use_cache=False, data_dir=None):
+        super().__init__(use_cache=use_cache, data_dir=data_dir)
+        self.spec = spec or MachineSpec()
+        self.name = f"Generated Machine ({component_count(self.spec)} components)"
+
+    @property
+    def snapshot_name(self):
+        """One snapshot per spec"""
+        return "generated-" + "-".join(str(value) for value in self.spec)
+
+    @property
+    def world_name(self):
+        """Generated machines are all ranked as one world"""
+        return "generated"
+
+    @property
+    def data(self):
+        """Generated world definition"""
+        if self._data is None:
+            from computerquest.world.loader import load_world_data
+            from computerquest.config import WORLD_DATA_CACHE_ENABLED
+            base = load_world_data(self.data_dir, use_cache=WORLD_DATA_CACHE_ENABLED)
+            self._data = generate_world_data(self.spec, base)
+        return self._data
+
+    def definition_files(self):
+        """Source files whose contents define the built world"""
+        return super().definition_files() + [__file__]
@@ -0,0 +1,282 @@
+"""
+Component graph analytics
+
+Breadth-first distances and next hops over the doors of a
+ComputerArchitecture, plus reachability, eccentricity and articulation
+points. Worlds up to DENSE_GRAPH_LIMIT components get all-pairs tables,
+precomputed on first use and held in NumPy int arrays when NumPy is
+installed; larger worlds run one BFS per source on demand and keep the
+most recently used rows in an LRU cache.
+
+The tables are rebuilt when components are added or replaced, or when any
+door is created with Component.connect_to: each rebuild attaches the
+world's EdgeVersion to its components, which bump it on every new door.
+Code that edits doors directly must call invalidate().
+"""
+
+from array import array
+from collections import OrderedDict, deque
+from computerquest.config import DENSE_GRAPH_LIMIT, GRAPH_CACHE_SIZE
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class WorldGraph:
+    """Shortest paths and structure of a world's door graph"""
+    def __init__(self, world, dense_limit=DENSE_GRAPH_LIMIT, cache_size=GRAPH_CACHE_SIZE):
+        self.world = world
+        self.dense_limit = dense_limit
+        self.cache_size = cache_size
+        self.generation = 0  # Bumped on every rebuild, so dependants can drop derived data
+        self._signature = None
+        self.keys = []        # index -> room key
+        self.index = {}       # room key -> index
+        self.edges = []       # index -> ((direction, target index), ...)
+        self.targets = []     # index -> distinct target indices
+        self.reverse = []     # index -> [(source index, direction), ...]
+        self._dense = None    # (distances, first hops) for every source, or None
+        self._rows = OrderedDict()  # source index -> (distances, first hops)
+        self._articulation = None
+
+    @property
+    def dense(self):
+        """True if all-pairs tables are used"""
+        self.refresh()
+        return len(self.keys) <= self.dense_limit
+
+    def invalidate(self):
+        """Forget all tables; they are rebuilt on the next query"""
+        self._signature = None
+
+    def refresh(self):
+        """Rebuild the index when the rooms or doors changed"""
+        rooms = self.world.rooms
+        edge_version = self.world.edge_version
+        signature = (id(rooms), len(rooms), edge_version.value)
+        if signature == self._signature:
+            return
+
+        for room in rooms.values():
+            room.edge_version = edge_version
+
+        self.keys = list(rooms)
+        self.index = {key: i for i, key in enumerate(self.keys)}
+        by_id = {id(room): i for i, room in enumerate(rooms.values())}
+        self.edges = []
+        self.reverse = [[] for _ in self.keys]
+        for i, room in enumerate(rooms.values()):
+            edges = tuple((direction, by_id[id(other)]) for direction, other in room.doors.items()
+                          if id(other) in by_id)
+            self.edges.append(edges)
+            for direction, target in edges:
+                self.reverse[target].append((i, direction))
+        self.targets = [tuple(dict.fromkeys(target for _, target in edges)) for edges in self.edges]
+
+        self._dense = None
+        self._rows.clear()
+        self._articulation = None
+        self._signature = signature
+        self.generation += 1
+
+    def _bfs(self, source):
+        """
+        Distances and first hops from one source
+
+        Returns:
+            tuple: (distances, first hops) indexed by target; -1 where unreachable
+        """
+        size = len(self.keys)
+        distances = array('i', [-1]) * size
+        first = array('i', [-1]) * size
+        distances[source] = 0
+        first[source] = source
+
+        targets = self.targets
+        frontier = []
+        for target in targets[source]:
+            if distances[target] < 0:
+                distances[target] = 1
+                first[target] = target
+                frontier.append(target)
+
+        level = 1
+        while frontier:
+            level += 1
+            following = []
+            for node in frontier:
+                hop = first[node]
+                for target in targets[node]:
+                    if distances[target] < 0:
+                        distances[target] = level
+                        first[target] = hop
+                        following.append(target)
+            frontier = following
+        return distances, first
+
+    def _all_pairs(self):
+        """All-pairs tables, computed once per rebuild"""
+        if self._dense is None:
+            rows = [self._bfs(source) for source in range(len(self.keys))]
+            if np is not None:
+                self._dense = (np.array([row[0] for row in rows], dtype=np.int32),
+                               np.array([row[1] for row in rows], dtype=np.int32))
+            else:
+                self._dense = ([row[0] for row in rows], [row[1] for row in rows])
+        return self._dense
+
+    def _row(self, source):
+        """(distances, first hops) from a source index"""
+        self.refresh()
+        if len(self.keys) <= self.dense_limit:
+            distances, first = self._all_pairs()
+            return distances[source], first[source]
+
+        row = self._rows.get(source)
+        if row is None:
+            row = self._rows[source] = self._bfs(source)
+            if len(self._rows) > self.cache_size:
+                self._rows.popitem(last=False)
+        else:
+            self._rows.move_to_end(source)
+        return row
+
+    def _indexes(self, *keys):
+        """Indexes of room keys; raises KeyError for unknown keys"""
+        self.refresh()
+        return [self.index[key] for key in keys]
+
+    def distance(self, source, destination):
+        """
+        Number of moves between two components
+
+        Returns:
+            int: Shortest distance, or None if the destination is unreachable
+        """
+        source, destination = self._indexes(source, destination)
+        distance = int(self._row(source)[0][destination])
+        return distance if distance >= 0 else None
+
+    def next_hop(self, source, destination):
+        """
+        First move on a shortest route
+
+        Returns:
+            tuple: (direction, room key), or None if already there or unreachable
+        """
+        source, destination = self._indexes(source, destination)
+        hop = int(self._row(source)[1][destination])
+        if hop < 0 or hop == source:
+            return None
+        direction = next(direction for direction, target in self.edges[source] if target == hop)
+        return direction, self.keys[hop]
+
+    def path(self, source, destination):
+        """
+        A shortest route between two components
+
+        Returns:
+            list: (direction, room key) steps, empty if already there,
+            or None if the destination is unreachable
+        """
+        if self.distance(source, destination) is None:
+            return None
+        if not self.dense:
+            return self._path_bfs(*self._indexes(source, destination))
+
+        steps = []
+        while source != destination:
+            step = self.next_hop(source, destination)
+            steps.append(step)
+            source = step[1]
+        return steps
+
+    def _path_bfs(self, source, destination):
+        """Shortest route by a single BFS with parent links, for sparse mode"""
+        parents = {source: None}
+        queue = deque([source])
+        while queue and destination not in parents:
+            node = queue.popleft()
+            for direction, target in self.edges[node]:
+                if target not in parents:
+                    parents[target] = (node, direction)
+                    queue.append(target)
+
+        steps = []
+        node = destination
+        while parents[node] is not None:
+            previous, direction = parents[node]
+            steps.append((direction, self.keys[node]))
+            node = previous
+        steps.reverse()
+        return steps
+
+    def reachable(self, source):
+        """Keys of every component reachable from a source, itself included"""
+        distances = self._row(*self._indexes(source))[0]
+        return {self.keys[i] for i, distance in enumerate(distances) if distance >= 0}
+
+    def eccentricity(self, source):
+        """Largest distance from a source to any component it can reach"""
+        distances = self._row(*self._indexes(source))[0]
+        return int(max(distances)) if len(distances) else 0
+
+    def articulation_points(self):
+        """
+        Components whose removal disconnects others, treating doors as two-way
+
+        Returns:
+            set: Room keys of the articulation points
+        """
+        self.refresh()
+        if self._articulation is not None:
+            return self._articulation
+
+        size = len(self.keys)
+        neighbors = [set(targets) for targets in self.targets]
+        for node, targets in enumerate(self.targets):
+            for target in targets:
+                neighbors[target].add(node)
+        neighbors = [tuple(node_neighbors - {node}) for node, node_neighbors in enumerate(neighbors)]
+
+        # Iterative Tarjan: discovery order and lowest reachable discovery order
+        discovered = [-1] * size
+        low = [0] * size
+        points = set()
+        counter = 0
+        for root in range(size):
+            if discovered[root] >= 0:
+                continue
+            discovered[root] = low[root] = counter
+            counter += 1
+            children = 0
+            stack = [(root, -1, iter(neighbors[root]))]
+            while stack:
+                node, parent, pending = stack[-1]
+                advanced = False
+                for target in pending:
+                    if discovered[target] < 0:
+                        discovered[target] = low[target] = counter
+                        counter += 1
+                        stack.append((target, node, iter(neighbors[target])))
+                        advanced = True
+                        break
+                    if target != parent:
+                        low[node] = min(low[node], discovered[target])
+                if advanced:
+                    continue
+
+                stack.pop()
+                if parent < 0:
+                    continue
+                low[parent] = min(low[parent], low[node])
+                if parent == root:
+                    children += 1
+                elif low[node] >= discovered[parent]:
+                    points.add(self.keys[parent])
+            if children > 1:
+                points.add(self.keys[root])
+
+        self._articulation = points
+        return points
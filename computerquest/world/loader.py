@@ -0,0 +1,259 @@
+"""
+World data loader
+
+Reads the component, item and virus definitions in the data directory,
+validates them against the world schema and returns them as compact
+tuples ready for ComputerArchitecture to build from. Besides the built-in
+world in DATA_DIR, world packs live in subdirectories of WORLDS_DIR; a pack
+that leaves out a file uses the built-in one. Validated results are kept
+in the snapshot cache under a hash of the data files' contents, so
+unchanged worlds skip JSON parsing and validation entirely and packs with
+identical files share one entry.
+"""
+
+import json
+import os
+from collections import namedtuple
+from typing import Dict
+from computerquest.config import DATA_DIR, WORLDS_DIR, DEFAULT_WORLD, DIRECTION_NAMES, SNAPSHOT_VERSION
+from computerquest.models.item import make_item
+
+COMPONENT_FILE = "component_data.json"
+ITEM_FILE = "items_data.json"
+VIRUS_FILE = "virus_data.json"
+
+class WorldDataError(ValueError):
+    """A world data file is missing, unreadable or does not match the schema"""
+
+# components: (key, name, description, id, lit, exits, items) tuples, where
+#     exits is a tuple of (direction, target key) and items a tuple of item ids
+# items: item id -> description, for every item and virus
+# inventory: item ids the player starts with
+# viruses: (virus id, location key) tuples
+# start: key of the starting component
+# catalog: classified Item records for every item and virus
+WorldData = namedtuple('WorldData', ['components', 'items', 'inventory', 'viruses', 'start', 'catalog'])
+
+def data_files(data_dir=None):
+    """
+    Paths of the files that define a world
+
+    Args:
+        data_dir (str): Directory holding the data files (defaults to DATA_DIR);
+            files it does not provide are taken from DATA_DIR
+
+    Returns:
+        list: Component, item and virus file paths
+    """
+    paths = []
+    for name in (COMPONENT_FILE, ITEM_FILE, VIRUS_FILE):
+        path = os.path.join(data_dir or DATA_DIR, name)
+        if data_dir and not os.path.exists(path):
+            path = os.path.join(DATA_DIR, name)
+        paths.append(path)
+    return paths
+
+def world_packs():
+    """
+    Available world packs
+
+    Returns:
+        dict: Pack name -> data directory, the built-in world first
+    """
+    packs = {DEFAULT_WORLD: DATA_DIR}
+    if os.path.isdir(WORLDS_DIR):
+        for name in sorted(os.listdir(WORLDS_DIR)):
+            if os.path.exists(os.path.join(WORLDS_DIR, name, COMPONENT_FILE)):
+                packs[name] = os.path.join(WORLDS_DIR, name)
+    return packs
+
+def pack_dir(name):
+    """
+    Data directory of a world pack
+
+    Raises:
+        WorldDataError: If there is no such pack
+    """
+    packs = world_packs()
+    if name not in packs:
+        raise WorldDataError(f"Unknown world '{name}'. Available worlds: {', '.join(packs)}")
+    return packs[name]
+
+def _require(condition, source, key, message):
+    """Raise WorldDataError for an entry unless condition holds"""
+    if not condition:
+        raise WorldDataError(f"{source}: {key}: {message}")
+
+def _string(entry, field, source, key, required=True):
+    """A string field of an entry"""
+    value = entry.get(field)
+    if value is None and not required:
+        return None
+    _require(isinstance(value, str) and value, source, key, f"'{field}' must be a non-empty string")
+    return value
+
+def parse_world_data(components, items, viruses):
+    """
+    Validate parsed data files and convert them to WorldData
+
+    Args:
+        components (dict): Contents of the component file
+        items (dict): Contents of the item file
+        viruses (dict): Contents of the virus file
+
+    Returns:
+        WorldData: The validated world
+
+    Raises:
+        WorldDataError: If any entry does not match the schema
+    """
+    item_descriptions = {}
+    inventory = []
+    catalog = []
+    for item_id, entry in items.items():
+        _require(isinstance(entry, dict), ITEM_FILE, item_id, "entry must be an object")
+        description = item_descriptions[item_id] = _string(entry, 'description', ITEM_FILE, item_id)
+        if entry.get('inventory', False):
+            inventory.append(item_id)
+        catalog.append(make_item(item_id, description, _string(entry, 'name', ITEM_FILE, item_id, False),
+                                 _string(entry, 'type', ITEM_FILE, item_id, False), virus=False))
+
+    virus_entries = []
+    for virus_id, entry in viruses.items():
+        _require(isinstance(entry, dict), VIRUS_FILE, virus_id, "entry must be an object")
+        _require(virus_id not in item_descriptions, VIRUS_FILE, virus_id, "id is already used by an item")
+        description = item_descriptions[virus_id] = _string(entry, 'description', VIRUS_FILE, virus_id)
+        location = _string(entry, 'location', VIRUS_FILE, virus_id)
+        _require(location in components, VIRUS_FILE, virus_id, f"unknown location '{location}'")
+        difficulty = entry.get('difficulty', 0)
+        _require(isinstance(difficulty, int) and not isinstance(difficulty, bool), VIRUS_FILE, virus_id,
+                 "'difficulty' must be an integer")
+        virus_entries.append((virus_id, location))
+        catalog.append(make_item(virus_id, description, _string(entry, 'name', VIRUS_FILE, virus_id, False),
+                                 "virus", difficulty, virus=True))
+
+    parsed = []
+    starts = []
+    ids = {}
+    placed = {}
+    for key, entry in components.items():
+        _require(isinstance(entry, dict), COMPONENT_FILE, key, "entry must be an object")
+        name = _string(entry, 'name', COMPONENT_FILE, key)
+        description = _string(entry, 'description', COMPONENT_FILE, key)
+        iden = _string(entry, 'id', COMPONENT_FILE, key)
+        _require(iden not in ids, COMPONENT_FILE, key, f"id '{iden}' is already used by '{ids.get(iden)}'")
+        ids[iden] = key
+
+        lit = entry.get('lit', True)
+        _require(isinstance(lit, bool), COMPONENT_FILE, key, "'lit' must be true or false")
+        if entry.get('start', False):
+            starts.append(key)
+
+        exits = entry.get('exits', {})
+        _require(isinstance(exits, dict), COMPONENT_FILE, key, "'exits' must be an object")
+        for direction, target in exits.items():
+            _require(direction in DIRECTION_NAMES, COMPONENT_FILE, key, f"unknown direction '{direction}'")
+            _require(target in components, COMPONENT_FILE, key,
+                     f"exit '{direction}' leads to unknown component '{target}'")
+
+        room_items = entry.get('items', [])
+        _require(isinstance(room_items, list), COMPONENT_FILE, key, "'items' must be a list")
+        for item_id in room_items:
+            _require(item_id in items, COMPONENT_FILE, key, f"unknown item '{item_id}'")
+            _require(item_id not in placed, COMPONENT_FILE, key,
+                     f"item '{item_id}' is already placed in '{placed.get(item_id)}'")
+            placed[item_id] = key
+
+        parsed.append((key, name, description, iden, lit, tuple(exits.items()), tuple(room_items)))
+
+    _require(len(starts) == 1, COMPONENT_FILE, "start",
+             f"exactly one component must have \"start\": true (found {len(starts)})")
+
+    return WorldData(tuple(parsed), item_descriptions, tuple(inventory), tuple(virus_entries), starts[0],
+                     tuple(catalog))
+
+def read_world_data(data_dir=None):
+    """Parse and validate the data files, bypassing the cache"""
+    sources = data_files(data_dir)
+    return _parse_contents(sources, [_read_bytes(path) for path in sources])
+
+def _read_bytes(path):
+    """Raw contents of a data file"""
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except OSError as e:
+        raise WorldDataError(f"{os.path.basename(path)}: cannot read file ({e.strerror})")
+
+def _parse_contents(sources, contents):
+    """Parse and validate data files that were already read"""
+    parsed = []
+    for path, data in zip(sources, contents):
+        try:
+            value = json.loads(data)
+        except ValueError as e:
+            raise WorldDataError(f"{os.path.basename(path)}: invalid JSON ({e})")
+        if not isinstance(value, dict):
+            raise WorldDataError(f"{os.path.basename(path)}: expected an object at the top level")
+        parsed.append(value)
+    return parse_world_data(*parsed)
+
+def _share_strings(world):
+    """The same world with its text replaced by copies shared across loaded worlds"""
+    shared = _strings.setdefault
+    components = tuple(
+        (key, shared(name, name), shared(description, description), iden, lit, exits, items)
+        for key, name, description, iden, lit, exits, items in world.components
+    )
+    items = {item_id: shared(text, text) for item_id, text in world.items.items()}
+    catalog = tuple(item._replace(description=items[item.id]) for item in world.catalog)
+    return world._replace(components=components, items=items, catalog=catalog)
+
+# Worlds loaded by this process, by content hash of their data files
+_loaded: Dict[str, WorldData] = {}
+# Description strings shared by every loaded world
+_strings: Dict[str, str] = {}
+
+def load_world_data(data_dir=None, use_cache=True):
+    """
+    Load a world's data, from the compiled cache when possible
+
+    The cache is content-addressed: worlds whose data files are identical
+    share one entry wherever they live, and a world already loaded by this
+    process is returned without reading its cache entry again.
+
+    Args:
+        data_dir (str): Directory holding the data files (defaults to DATA_DIR)
+        use_cache (bool): Read and refresh the compiled cache
+
+    Returns:
+        WorldData: The validated world
+
+    Raises:
+        WorldDataError: If the data files are missing or invalid
+    """
+    if not use_cache:
+        return read_world_data(data_dir)
+
+    import hashlib
+    from computerquest.world.snapshot import load_snapshot, save_snapshot
+
+    sources = data_files(data_dir)
+    contents = [_read_bytes(path) for path in sources]
+    digest = hashlib.sha256(str(SNAPSHOT_VERSION).encode())
+    for data in contents:
+        digest.update(hashlib.sha256(data).digest())
+    digest = digest.hexdigest()
+
+    world = _loaded.get(digest)
+    if world is not None:
+        return world
+
+    name = f"data-{digest[:24]}"
+    world = load_snapshot(name, sources)
+    if not isinstance(world, WorldData):
+        world = _parse_contents(sources, contents)
+        save_snapshot(name, sources, world)
+
+    world = _loaded[digest] = _share_strings(world)
+    return world
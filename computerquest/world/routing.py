@@ -0,0 +1,100 @@
+"""
+Shortest-path routing between components
+
+Routes only pass through components the player has already visited. For
+each destination a next-hop table is built once with a breadth-first
+search over the reversed doors of the world graph (see
+computerquest.world.graph); after that any route to it is read off the
+table in O(path length).
+"""
+
+from collections import deque
+
+class Router:
+    """Next-hop routing over a ComputerArchitecture"""
+    def __init__(self, world):
+        self.world = world
+        self._tables = {}          # destination key -> {key: (direction, next key)}
+        self._generation = None    # Graph generation the tables were built for
+
+    def invalidate(self, structure=False):
+        """
+        Drop cached next-hop tables
+
+        Args:
+            structure (bool): Doors changed too, so rebuild the world graph
+        """
+        self._tables.clear()
+        if structure:
+            self.world.graph.invalidate()
+
+    def next_hops(self, destination):
+        """
+        Next-hop table towards a destination
+
+        Returns:
+            dict: key -> (direction, next key) for every component that can
+            reach the destination through visited components
+        """
+        graph = self.world.graph
+        graph.refresh()
+        if graph.generation != self._generation:
+            # Rooms or doors changed since the tables were built
+            self._tables.clear()
+            self._generation = graph.generation
+
+        table = self._tables.get(destination)
+        if table is not None:
+            return table
+
+        rooms = self.world.rooms
+        keys = graph.keys
+        reverse = graph.reverse
+        table = {destination: None}
+        queue = deque([graph.index[destination]])
+        while queue:
+            node = queue.popleft()
+            key = keys[node]
+            for previous, direction in reverse[node]:
+                previous_key = keys[previous]
+                if previous_key in table:
+                    continue
+                table[previous_key] = (direction, key)
+                # Unvisited components may start a route but not lie on one
+                if rooms[previous_key].visited:
+                    queue.append(previous)
+
+        self._tables[destination] = table
+        return table
+
+    def route(self, source, destination):
+        """
+        Shortest route between two components
+
+        Args:
+            source (str): Key of the starting component
+            destination (str): Key of the target component
+
+        Returns:
+            list: (direction, component key) steps, empty if already there,
+            or None if no route through visited components exists
+        """
+        steps = self._walk(source, destination)
+        if steps is None and destination in self._tables:
+            # A component may have been visited without a move (e.g. look); retry fresh
+            del self._tables[destination]
+            steps = self._walk(source, destination)
+        return steps
+
+    def _walk(self, source, destination):
+        """Follow the next-hop table from source to destination"""
+        table = self.next_hops(destination)
+        if source not in table:
+            return None
+
+        steps = []
+        key = source
+        while key != destination:
+            direction, key = table[key]
+            steps.append((direction, key))
+        return steps
@@ -0,0 +1,241 @@
+"""
+World snapshot cache
+
+Stores a fully built world in a versioned binary file so later starts can
+load it with a single read instead of rebuilding it. Each snapshot records
+the size/mtime and a content hash of the files that define the world; a
+change to any of them makes the snapshot stale and the caller rebuilds.
+
+The cache directory is bounded: loading a cached file marks it as used,
+and every write evicts files unused for CACHE_MAX_AGE_DAYS, then the
+least recently used ones until the directory fits in CACHE_MAX_BYTES.
+
+Graph nodes (components) are stored flat: each node's state is written on
+its own and references between nodes become persistent ids, so the depth
+of the world graph never limits the pickler's recursion.
+"""
+
+import io
+import os
+import pickle
+import time
+from computerquest.config import SAVE_DIR, CACHE_DIR_ENV, SNAPSHOT_VERSION, CACHE_MAX_BYTES, CACHE_MAX_AGE_DAYS
+
+MAGIC = b"CQWS"
+
+def cache_dir():
+    """Directory holding cached snapshots"""
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return override
+    return os.path.join(os.path.expanduser("~"), SAVE_DIR, "cache")
+
+def mark_used(path):
+    """Record that a cache file was just used, so eviction keeps it longest"""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+def evict_cache(keep=None, max_bytes=CACHE_MAX_BYTES, max_age=CACHE_MAX_AGE_DAYS * 86400):
+    """
+    Delete stale cache files
+
+    Files unused for max_age seconds go first, then the least recently
+    used ones until the cache fits in max_bytes.
+
+    Args:
+        keep (str): File that must stay, such as the one just written
+        max_bytes (int): Size limit of the cache directory
+        max_age (float): Seconds after which an unused file is deleted
+    """
+    files = []
+    try:
+        with os.scandir(cache_dir()) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    info = entry.stat()
+                    files.append((info.st_mtime, info.st_size, entry.path))
+    except OSError:
+        return
+
+    total = sum(size for _, size, _ in files)
+    now = time.time()
+    for used, size, path in sorted(files):
+        if path == keep or (now - used <= max_age and total <= max_bytes):
+            continue
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+def snapshot_path(name):
+    """Path of the snapshot file for a world name"""
+    return os.path.join(cache_dir(), f"{name}.snapshot")
+
+def stat_signature(paths):
+    """Cheap signature of the source files (size and mtime)"""
+    signature = []
+    for path in paths:
+        info = os.stat(path)
+        signature.append((path, info.st_size, info.st_mtime_ns))
+    return tuple(signature)
+
+def content_hash(paths):
+    """Hash of the source files' contents"""
+    import hashlib
+
+    digest = hashlib.sha256(str(SNAPSHOT_VERSION).encode())
+    for path in paths:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+class _NodePickler(pickle.Pickler):
+    """Pickler writing references to graph nodes as their keys"""
+    def __init__(self, f, nodes):
+        super().__init__(f, protocol=pickle.HIGHEST_PROTOCOL)
+        self.node_keys = {id(node): key for key, node in nodes.items()}
+
+    def persistent_id(self, obj):
+        return self.node_keys.get(id(obj))
+
+class _NodeUnpickler(pickle.Unpickler):
+    """Unpickler resolving node keys to the nodes being restored"""
+    def __init__(self, f, nodes):
+        super().__init__(f)
+        self.nodes = nodes
+
+    def persistent_load(self, pid):
+        return self.nodes[pid]
+
+def _node_state(node):
+    """
+    State of a node as (instance dict or None, slot values)
+
+    Built from __slots__ directly: object.__getstate__, which does the
+    same, only exists on Python 3.11 and later.
+    """
+    slots = {}
+    for cls in type(node).__mro__:
+        names = getattr(cls, '__slots__', ())
+        for name in (names,) if isinstance(names, str) else names:
+            if name not in ('__dict__', '__weakref__') and hasattr(node, name):
+                slots[name] = getattr(node, name)
+    return getattr(node, '__dict__', None) or None, slots
+
+def _restore(node, state):
+    """Apply a state returned by _node_state to a bare instance"""
+    if isinstance(state, tuple):
+        state, slots = state
+        for attr, value in (slots or {}).items():
+            setattr(node, attr, value)
+    if state:
+        node.__dict__.update(state)
+
+def load_snapshot(name, sources):
+    """
+    Load a cached world snapshot
+
+    Args:
+        name (str): World name
+        sources (list): Files that define the world
+
+    Returns:
+        The cached object, or None if missing, stale or unreadable
+    """
+    path = snapshot_path(name)
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    if data[:len(MAGIC)] != MAGIC:
+        return None
+
+    try:
+        stream = io.BytesIO(data)
+        stream.seek(len(MAGIC))
+        version, signature, digest = pickle.load(stream)
+        if version != SNAPSHOT_VERSION:
+            return None
+
+        # Untouched sources are trusted without re-hashing them
+        current = stat_signature(sources)
+        if signature != current:
+            if digest != content_hash(sources):
+                return None
+            # Same contents with a new size/mtime (a checkout, a copy): store
+            # the new signature so later starts skip hashing again
+            body = data[stream.tell():]
+
+            def write(f):
+                f.write(MAGIC)
+                pickle.dump((version, current, digest), f, protocol=pickle.HIGHEST_PROTOCOL)
+                f.write(body)
+            _write_file(path, write)
+
+        # Bare nodes first, so references to them can be resolved
+        nodes = {key: cls.__new__(cls) for key, cls in pickle.load(stream)}
+        states, obj = _NodeUnpickler(stream, nodes).load()
+        for node, state in zip(nodes.values(), states):
+            _restore(node, state)
+        mark_used(path)
+        return obj
+    except Exception:
+        # Any corrupt or incompatible snapshot just means a rebuild
+        return None
+
+def save_snapshot(name, sources, obj, nodes=None):
+    """
+    Write a world snapshot, replacing any previous one atomically
+
+    Args:
+        name (str): World name
+        sources (list): Files that define the world
+        obj: Object to store
+        nodes (dict): Graph nodes referenced by obj, keyed by a unique name;
+            they are stored flat rather than by recursing through their links
+
+    Returns:
+        bool: True if the snapshot was written
+    """
+    header = (SNAPSHOT_VERSION, stat_signature(sources), content_hash(sources))
+    nodes = nodes or {}
+
+    def write(f):
+        f.write(MAGIC)
+        pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle.dump([(key, type(node)) for key, node in nodes.items()], f,
+                    protocol=pickle.HIGHEST_PROTOCOL)
+        _NodePickler(f, nodes).dump(([_node_state(node) for node in nodes.values()], obj))
+    return _write_file(snapshot_path(name), write)
+
+def _write_file(path, write):
+    """
+    Replace a cache file atomically
+
+    Args:
+        path (str): File to replace
+        write (callable): Writes the contents to the open temporary file
+
+    Returns:
+        bool: True if the file was written
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except (OSError, pickle.PicklingError, RecursionError):
+        # Caching is best-effort; the game works without it
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return False
+    evict_cache(keep=path)
+    return True
@@ -0,0 +1,130 @@
+"""
+Memory-mapped text store
+
+Keeps long texts such as component descriptions in one file: a small
+header, a table of byte offsets and the UTF-8 text. The file is memory
+mapped and a text is decoded only when asked for, with the most recently
+used ones kept in a small LRU cache. Stores live in the cache directory
+under a hash of their contents, so identical worlds share one file.
+"""
+
+import mmap
+import os
+import struct
+from collections import OrderedDict
+from computerquest.config import TEXT_CACHE_SIZE
+
+MAGIC = b"CQTS"
+HEADER = struct.Struct("<4sI")  # Magic, number of texts
+OFFSET = struct.Struct("<QQ")   # Start and end of one text
+
+def write_text_store(path, texts):
+    """
+    Write texts to a store file, replacing any previous one atomically
+
+    Args:
+        path (str): Store file to write
+        texts (list): Texts, later looked up by their position
+    """
+    encoded = [text.encode('utf-8') for text in texts]
+    offsets = [0]
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, len(encoded)))
+            f.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+            f.writelines(encoded)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+class TextStore:
+    """Read-only, memory-mapped texts looked up by index"""
+    def __init__(self, path, cache_size=TEXT_CACHE_SIZE):
+        self.path = path
+        self.cache_size = cache_size
+        self._cache = OrderedDict()  # index -> decoded text
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self._map.close()
+            raise ValueError(f"{path} is not a text store")
+        self._base = HEADER.size + 8 * (self.count + 1)  # Where the text starts
+
+    def __len__(self):
+        return self.count
+
+    def __reduce__(self):
+        # Pickled as its path; the file is mapped again when unpickled
+        return TextStore, (self.path, self.cache_size)
+
+    def get(self, index):
+        """
+        Text at an index
+
+        Args:
+            index (int): Position of the text when the store was written
+
+        Returns:
+            str: The text
+        """
+        text = self._cache.get(index)
+        if text is not None:
+            self._cache.move_to_end(index)
+            return text
+
+        if not 0 <= index < self.count:
+            raise IndexError(f"text index {index} out of range")
+        start, end = OFFSET.unpack_from(self._map, HEADER.size + 8 * index)
+        text = self._map[self._base + start:self._base + end].decode('utf-8')
+        self._cache[index] = text
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return text
+
+    def clear_cache(self):
+        """Drop the decoded texts; they are read from the file again when needed"""
+        self._cache.clear()
+
+    def close(self):
+        """Unmap the file"""
+        self.clear_cache()
+        self._map.close()
+
+def text_store_for(texts):
+    """
+    Store for a list of texts, reusing an identical one from the cache
+
+    Args:
+        texts (list): Texts to store
+
+    Returns:
+        TextStore: The store, or None if the cache directory is not writable
+    """
+    import hashlib
+    from computerquest.world.snapshot import cache_dir, evict_cache, mark_used
+
+    digest = hashlib.sha256()
+    for text in texts:
+        data = text.encode('utf-8')
+        digest.update(struct.pack("<Q", len(data)))
+        digest.update(data)
+    path = os.path.join(cache_dir(), f"text-{digest.hexdigest()[:32]}.store")
+
+    try:
+        if os.path.exists(path):
+            mark_used(path)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            write_text_store(path, texts)
+            evict_cache(keep=path)
+        return TextStore(path)
+    except (OSError, ValueError):
+        # The store is an optimization; callers keep the texts in memory instead
+        return None
@@ -7,9 +7,6 @@ Main entry point for the game.
 
 import argparse
 import sys
-import os
-import traceback
-from computerquest.game import Game
 from computerquest import __version__
 
 def parse_args():
@@ -19,6 +16,16 @@ def parse_args():
     )
     parser.add_argument("--version", action="store_true", help="Show version information")
     parser.add_argument("--debug", action="store_true", help="Enable debug mode")
+    parser.add_argument("--perf-report", action="store_true",
+                        help="Print per-command latency percentiles on exit")
+    parser.add_argument("--world", default="default", metavar="PACK",
+                        help="World pack to play: 'default' or a pack directory under data/worlds")
+    parser.add_argument("--perf-allocs", type=int, default=0, metavar="N",
+                        help="Sample peak allocations with tracemalloc every N commands")
+    parser.add_argument("--agents", type=int, default=None, metavar="N",
+                        help="Put N roaming viruses, helper daemons and security scanners each in the world")
+    parser.add_argument("--spread", action="store_true",
+                        help="Let infection spread from the viruses to neighboring components each turn")
     return parser.parse_args()
 
 def main():
@@ -30,16 +37,39 @@ def main():
         return
     
     try:
+        # Import the game only once we know we need it (keeps --version instant)
+        from computerquest.game import Game
+
+        # Load the chosen world pack; unknown packs report the available ones
+        game_map = None
+        if args.world != "default":
+            from computerquest.config import WORLD_CACHE_ENABLED
+            from computerquest.world.architecture import ComputerArchitecture
+            from computerquest.world.loader import pack_dir
+            game_map = ComputerArchitecture(use_cache=WORLD_CACHE_ENABLED, data_dir=pack_dir(args.world))
+
         # Start the game
-        game = Game()
+        options = {}
+        if args.agents is not None:
+            options["agents"] = args.agents
+        if args.spread:
+            options["spread"] = True
+        game = Game(game_map, **options)
+        if args.perf_allocs:
+            game.command_processor.perf.set_allocation_sampling(args.perf_allocs)
         
         # Run the main game loop
-        game.start()
+        try:
+            game.start()
+        finally:
+            if args.perf_report:
+                print("\n" + game.command_processor.perf.report())
     except KeyboardInterrupt:
         print("\nGame interrupted. Exiting...")
     except Exception as e:
         print(f"\nError: {e}")
         if args.debug:
+            import traceback
             traceback.print_exc()
         else:
             print("Run with --debug for more information")
@@ -45,6 +45,11 @@ setup(
             "flake8>=6.0.0",
             "mypy>=1.0.0",
         ],
+        # Array-based graph tables, agent ticks and virus spread for large worlds
+        "fast": [
+            "numpy>=1.20.0",
+            "scipy>=1.6.0",
+        ],
     },
     classifiers=[
         "Development Status :: 4 - Beta",
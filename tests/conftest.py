@@ -0,0 +1,26 @@
+"""
+Shared pytest configuration
+
+Points the world cache and the leaderboard at a temporary directory for
+the whole session, so running the suite never writes into the home
+directory. Tests that need their own cache directory still patch
+COMPUTERQUEST_CACHE_DIR themselves.
+"""
+
+import os
+import pytest
+from computerquest.config import CACHE_DIR_ENV, LEADERBOARD_PATH_ENV
+
+@pytest.fixture(scope="session", autouse=True)
+def private_cache(tmp_path_factory):
+    """Use a temporary cache directory and leaderboard for every test"""
+    root = tmp_path_factory.mktemp("computerquest")
+    saved = {name: os.environ.get(name) for name in (CACHE_DIR_ENV, LEADERBOARD_PATH_ENV)}
+    os.environ[CACHE_DIR_ENV] = str(root / "cache")
+    os.environ[LEADERBOARD_PATH_ENV] = str(root / "leaderboard.db")
+    yield root
+    for name, value in saved.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
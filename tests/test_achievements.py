@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Unit tests for achievement definitions
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from computerquest.mechanics import achievements
+from computerquest.mechanics.achievements import AchievementDataError, compile_achievements, load_achievements
+
+METRICS = {
+    "visited_count": 3, "room_count": 10, "found_count": 1, "quarantined_count": 0,
+    "turns": 12, "victory": False, "knowledge.total": 5, "knowledge.min": 0, "knowledge.cpu": 5,
+}
+
+class TestAchievements(unittest.TestCase):
+    """Test cases for compiling and testing achievement rules"""
+
+    def compile(self, *when):
+        """Compile a single achievement with the given expressions"""
+        return compile_achievements({"test": {"name": "Test", "description": "A test.", "when": list(when)}})[0]
+
+    def assert_invalid(self, message, *when):
+        """Check that compiling fails with an error mentioning message"""
+        with self.assertRaises(AchievementDataError) as caught:
+            self.compile(*when)
+        self.assertIn(message, str(caught.exception))
+
+    def test_thresholds(self):
+        """Test expressions against constants, numbers and other metrics"""
+        self.assertTrue(self.compile("visited_count > 1").test(METRICS))
+        self.assertFalse(self.compile("visited_count >= room_count").test(METRICS))
+        self.assertTrue(self.compile("knowledge.cpu >= max_knowledge").test(METRICS))
+        self.assertFalse(self.compile("victory == true", "turns < 50").test(METRICS))
+        self.assertTrue(self.compile("victory == false", "turns < 50").test(METRICS))
+
+    def test_order_and_depends(self):
+        """Test tests run cheapest first and dependencies cover both sides"""
+        rule = self.compile("visited_count >= room_count", "turns < 50")
+        self.assertEqual([test.metric for test in rule.tests], ["turns", "visited_count"])
+        self.assertEqual(rule.depends, {"turns", "visited_count", "room_count"})
+        self.assertEqual(rule.cost, achievements.CONSTANT_COST + achievements.METRIC_COST)
+
+    def test_invalid(self):
+        """Test malformed expressions are rejected with the achievement named"""
+        self.assert_invalid("test: unknown metric 'score'", "score > 1")
+        self.assert_invalid("unknown comparison '=>'", "turns => 1")
+        self.assert_invalid("'many' is not a number", "turns > many")
+        self.assert_invalid("expected '<metric> <comparison> <value>'", "turns>1")
+        with self.assertRaises(AchievementDataError):
+            compile_achievements({"test": {"name": "Test", "description": "A test.", "when": []}})
+
+    def test_shared(self):
+        """Test the built-in file compiles once and is shared"""
+        rules = load_achievements()
+        self.assertIs(load_achievements(), rules)
+        self.assertEqual(len(rules), 14)
+        self.assertEqual(rules[0].id, "first_step")
+
+    def test_file_errors(self):
+        """Test unreadable and invalid files raise AchievementDataError"""
+        root = tempfile.mkdtemp()
+        try:
+            path = os.path.join(root, achievements.ACHIEVEMENT_FILE)
+            with self.assertRaises(AchievementDataError):
+                load_achievements(path)
+            with open(path, 'w') as f:
+                json.dump({"test": {"name": "Test", "description": "A test.", "when": "turns > 1"}}, f)
+            with self.assertRaises(AchievementDataError):
+                load_achievements(path)
+        finally:
+            shutil.rmtree(root)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -339,6 +339,20 @@ class TestQuarantineCommand(TestCommandBase):
         self.assertIn("Success! Virus quarantined.", result)
         self.assertIn("Victory message!", result)
 
+    def test_victory_records_run_once(self):
+        """Test only the quarantine that completes the set records the run"""
+        player = self.game.player = MagicMock()
+        player.quarantined_viruses = set(VIRUS_TYPES[:-1])
+        player.quarantine.side_effect = lambda name: player.quarantined_viruses.add(name) or "Success!"
+        self.game.victory_message.return_value = "Victory message!"
+        
+        QuarantineCommand(self.game, [VIRUS_TYPES[-1]]).execute()
+        self.game.record_run.assert_called_once()
+        
+        # Quarantining again after victory does not record a second run
+        QuarantineCommand(self.game, [VIRUS_TYPES[-1]]).execute()
+        self.game.record_run.assert_called_once()
+
 class TestHelpCommand(TestCommandBase):
     """Test the HelpCommand class"""
     
@@ -566,6 +580,72 @@ class TestCommandProcessor(TestCommandBase):
         self.assertIn("First achievement", result)
         self.assertIn("Achievement 2", result)
         self.assertIn("Second achievement", result)
+    
+    def test_process_chain(self):
+        """Test a ';' chain runs every command and shows the last result"""
+        results = iter(["first", "second"])
+        mock_cmd = MagicMock()
+        mock_cmd.can_execute.return_value = (True, None)
+        mock_cmd.execute.side_effect = lambda: next(results)
+        self.command_processor.commands['test'] = MagicMock(return_value=mock_cmd)
+        self.game.game_over = False
+        
+        result = self.command_processor.process("test a; test b")
+        
+        self.assertEqual(mock_cmd.execute.call_count, 2)
+        self.assertEqual(result, "second")
+    
+    def test_process_chain_stops_on_error(self):
+        """Test a chain stops at the first failing command"""
+        mock_cmd = MagicMock()
+        mock_cmd.can_execute.return_value = (True, None)
+        mock_cmd.execute.return_value = "ran"
+        self.command_processor.commands['test'] = MagicMock(return_value=mock_cmd)
+        self.game.game_over = False
+        
+        result = self.command_processor.process("test; nonexistent; test")
+        
+        mock_cmd.execute.assert_called_once()
+        self.assertIn("not recognized", result)
+        self.assertIn("Stopped at 'nonexistent'", result)
+    
+    def test_macro(self):
+        """Test defining and running a macro"""
+        mock_cmd = MagicMock()
+        mock_cmd.can_execute.return_value = (True, None)
+        mock_cmd.execute.return_value = "ran"
+        self.command_processor.commands['test'] = MagicMock(return_value=mock_cmd)
+        self.game.command_processor = self.command_processor
+        self.game.game_over = False
+        
+        result = self.command_processor.process("macro twice = test; test")
+        self.assertIn("defined", result)
+        self.assertEqual(self.command_processor.macros, {'twice': 'test; test'})
+        
+        self.assertEqual(self.command_processor.process("twice"), "ran")
+        self.assertEqual(mock_cmd.execute.call_count, 2)
+        
+        # Self-referencing macros stop instead of recursing forever
+        self.command_processor.process("macro loop = loop")
+        self.assertIn("nests too deeply", self.command_processor.process("loop"))
+
+class TestChainsInGame(unittest.TestCase):
+    """Test command chains against a real game"""
+    
+    def test_failed_take_stops_chain(self):
+        """Test a take that finds nothing stops the moves after it"""
+        import contextlib
+        import io
+        from computerquest.game import Game
+        with contextlib.redirect_stdout(io.StringIO()):
+            game = Game()
+        start = game.player.location
+        
+        result = game.command_processor.process("take unicorn; n; n")
+        
+        self.assertIs(game.player.location, start)
+        self.assertIn("There is no unicorn here", result)
+        self.assertIn("Stopped at 'take unicorn'", result)
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the tab completion engine
+"""
+
+import contextlib
+import io
+import unittest
+from computerquest.config import DIRECTION_MAPPING
+from computerquest.game import Game
+from computerquest.utils.completion import CompletionEngine, prefix_range
+
+class TestCompletion(unittest.TestCase):
+    """Test cases for the CompletionEngine class"""
+
+    def setUp(self):
+        """Set up a real game without printing the welcome screen"""
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.game = Game()
+        self.engine = CompletionEngine(self.game)
+
+    def all_options(self, line, text):
+        """Collect every option readline would cycle through"""
+        begidx = len(line) - len(text)
+        options = []
+        while True:
+            option = self.engine.complete(line, begidx, text, len(options))
+            if option is None:
+                return options
+            options.append(option)
+
+    def test_prefix_range(self):
+        """Test bisect prefix ranges"""
+        words = ['load', 'location', 'look', 'map']
+        self.assertEqual(prefix_range(words, 'lo'), ['load', 'location', 'look'])
+        self.assertEqual(prefix_range(words, 'loo'), ['look'])
+        self.assertEqual(prefix_range(words, 'x'), [])
+        self.assertEqual(prefix_range(words, ''), words)
+
+    def test_command_names(self):
+        """Test the first word completes command names"""
+        self.assertEqual(self.all_options('qua', 'qua'), ['quarantine'])
+        self.assertIn('look', self.all_options('lo', 'lo'))
+
+    def test_take_completes_room_items(self):
+        """Test take only offers items in the room"""
+        self.game.player.location.items = {'manual': 'A manual'}
+        self.game.player.items = {'map_tool': 'A tool'}
+        self.assertEqual(self.all_options('take ma', 'ma'), ['manual'])
+
+    def test_drop_completes_inventory(self):
+        """Test drop only offers inventory items"""
+        self.game.player.location.items = {'manual': 'A manual'}
+        self.game.player.items = {'map_tool': 'A tool'}
+        self.assertEqual(self.all_options('drop ma', 'ma'), ['map_tool'])
+
+    def test_go_completes_exits(self):
+        """Test go only offers exits from the current location"""
+        exits = self.all_options('go ', '')
+        self.assertTrue(exits)
+        for option in exits:
+            self.assertIn(DIRECTION_MAPPING[option], self.game.player.location.doors)
+
+    def test_chain(self):
+        """Test completion after ';' uses the last command"""
+        self.game.player.location.items = {'manual': 'A manual'}
+        self.assertEqual(self.all_options('n; take m', 'm'), ['manual'])
+        self.assertIn('scan', self.all_options('n; sc', 'sc'))
+
+    def test_direction_has_no_arguments(self):
+        """Test commands without a vocabulary offer nothing"""
+        self.assertEqual(self.all_options('north x', 'x'), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,7 +4,7 @@ Unit tests for the Component class
 """
 
 import unittest
-from computerquest.models.component import Component
+from computerquest.models.component import Component, VisitCounter, link
 from computerquest.config import DIRECTION_NAMES
 
 class TestComponent(unittest.TestCase):
@@ -97,7 +97,56 @@ class TestComponent(unittest.TestCase):
         # Test connecting to the same component again (should not duplicate)
         self.comp.connect_to(self.north_comp, "n")
         self.assertEqual(len(self.comp.openDoors), 2)  # Should not add a duplicate
+        self.assertEqual(self.comp.neighbor_ids, {"NORTH001", "EAST001"})
+
+    def test_connect_to_replaces_neighbor(self):
+        """Test reassigning a direction forgets the neighbor it replaced"""
+        self.comp.connect_to(self.north_comp, "n")
+        self.comp.connect_to(self.east_comp, "n")
+        self.assertIs(self.comp.doors["n"], self.east_comp)
+        self.assertEqual(self.comp.neighbor_ids, {"EAST001"})
+
+        # The replaced neighbor can be connected again
+        self.comp.connect_to(self.north_comp, "u")
+        self.assertIs(self.comp.doors["u"], self.north_comp)
+
+    def test_link(self):
+        """Test linking components in both directions"""
+        link(self.comp, self.north_comp, "n", "s")
+        self.assertEqual(self.comp.doors["n"], self.north_comp)
+        self.assertEqual(self.north_comp.doors["s"], self.comp)
+
+        # Linking the same pair again is a no-op
+        link(self.comp, self.north_comp, "n", "s")
+        self.assertEqual(len(self.comp.openDoors), 1)
+
+        # A direction already in use elsewhere is a conflict
+        with self.assertRaises(ValueError):
+            link(self.comp, self.east_comp, "n", "w")
+        with self.assertRaises(ValueError):
+            link(self.east_comp, self.north_comp, "w", "s")
+
+        # So is connecting the same pair through other directions
+        with self.assertRaises(ValueError):
+            link(self.comp, self.north_comp, "e", "w")
+        self.assertNotIn("e", self.comp.doors)
+        self.assertNotIn("w", self.east_comp.doors)
     
+    def test_performance(self):
+        """Test performance metrics are a read-only view of compact storage"""
+        self.comp.set_specs(speed=8, capacity=5, reliability=7)
+        self.assertEqual(dict(self.comp.performance), {"speed": 8, "capacity": 5, "reliability": 7})
+        with self.assertRaises(TypeError):
+            self.comp.performance["speed"] = 1
+
+        self.comp.performance = {"speed": 3}
+        self.assertEqual(list(self.comp.performance.values()), [3, 0, 0])
+
+        # Slotted: no per-instance dict and no stray attributes
+        self.assertFalse(hasattr(self.comp, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.comp.colour = "green"
+
     def test_add_items(self):
         """Test adding items to the component"""
         items = {
@@ -134,6 +183,18 @@ class TestComponent(unittest.TestCase):
         self.assertIn("connection", self.comp.desc.lower())
         self.assertIn("Secure", self.comp.desc)
     
+    def test_error_and_repair_updates_text_store(self):
+        """Test the error overlay leaves the description intact"""
+        self.comp.add_door("Secure", "s", "n", self.special_comp)
+        self.comp.error("Parity error")
+        self.assertTrue(self.comp.desc.startswith("ERROR: Parity error\n\nA test component"))
+        self.assertIn("Secure", self.comp.desc)
+        self.assertEqual(self.comp.desc1, "A test component")
+
+        self.comp.repair()
+        self.assertIsNone(self.comp.error_state)
+        self.assertEqual(self.comp.desc, "A test component")
+
     def test_print_details(self):
         """Test generating component details"""
         # Connect two directions for compass display
@@ -169,6 +230,16 @@ class TestComponent(unittest.TestCase):
         self.comp.mark_visited()
         self.assertTrue(self.comp.visited)
     
+    def test_visit_counter(self):
+        """Test the world's visit count follows the visited flag"""
+        counter = VisitCounter()
+        self.comp.visit_counter = counter
+        self.assertTrue(self.comp.mark_visited())
+        self.assertFalse(self.comp.mark_visited())
+        self.assertEqual(counter.count, 1)
+        self.comp.visited = False
+        self.assertEqual(counter.count, 0)
+    
     def test_error_and_repair(self):
         """Test error state and repair functionality"""
         original_desc = self.comp.desc
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the entity engine
+"""
+
+import unittest
+from unittest.mock import patch
+from computerquest.config import ENTITY_KINDS
+from computerquest.mechanics import entities as entities_module
+from computerquest.mechanics.entities import Agent, EntityEngine
+from computerquest.models.component import Component, link
+from computerquest.world.architecture import ComputerArchitecture
+
+class TestEntityEngine(unittest.TestCase):
+    """Test cases for the EntityEngine class"""
+
+    def setUp(self):
+        """Build a world a - b - c with a dead end d reached one way from c"""
+        with patch.object(ComputerArchitecture, 'setup'):
+            self.world = ComputerArchitecture()
+        for key in ['a', 'b', 'c', 'd']:
+            self.world.rooms[key] = Component(key.upper(), "", True, key)
+        rooms = self.world.rooms
+        link(rooms['a'], rooms['b'], 'e', 'w')
+        link(rooms['b'], rooms['c'], 'e', 'w')
+        rooms['c'].connect_to(rooms['d'], 'd')
+        self.engine = EntityEngine(self.world, seed=1)
+
+    def test_spawn(self):
+        """Test spawned agents start where they were placed"""
+        agents = self.engine.spawn("roaming_virus", 'b', 3)
+        self.assertEqual(list(agents), [0, 1, 2])
+        self.assertEqual(len(self.engine), 3)
+        self.assertEqual(self.engine.at('b'), [0, 1, 2])
+        self.assertEqual(self.engine.location_of(1), 'b')
+        self.assertEqual(self.engine.kind_of(2), "roaming_virus")
+
+    def test_moves_follow_doors(self):
+        """Test agents only step to neighbors, at their kind's pace"""
+        period = ENTITY_KINDS["helper_daemon"]
+        self.engine.spawn("helper_daemon", 'a', 50)
+        self.engine.tick(period - 1)
+        self.assertEqual(len(self.engine.at('a')), 50)
+
+        self.engine.tick()
+        self.assertEqual(len(self.engine.at('b')), 50)
+
+        # From b agents go either way, and nobody leaves the dead end
+        self.engine.tick(period)
+        self.assertEqual(len(self.engine.at('a')) + len(self.engine.at('c')), 50)
+        self.engine.tick(period * 100)
+        self.assertEqual(len(self.engine.at('d')), 50)
+
+    def test_remove_and_topology_changes(self):
+        """Test removed agents and agents in removed rooms stop counting"""
+        first, second = self.engine.spawn("security_scanner", 'a', 2)
+        self.engine.remove(first)
+        self.assertIsNone(self.engine.location_of(first))
+        self.assertEqual(self.engine.at('a'), [second])
+
+        self.engine.spawn("security_scanner", 'd')
+        del self.world.rooms['a']
+        self.engine.tick()
+        self.assertEqual(len(self.engine), 1)
+        self.assertEqual(self.engine.at('d'), [2])
+
+    def test_sync_play(self):
+        """Test play lists show agents next to other entities"""
+        npc = object()
+        self.world.rooms['a'].play.append(npc)
+        self.engine.spawn("roaming_virus", 'a', 2)
+        self.engine.sync_play(self.world.rooms['a'])
+        play = self.world.rooms['a'].play
+        self.assertEqual(play, [npc, Agent(self.engine, 0), Agent(self.engine, 1)])
+        self.assertEqual(str(play[1]), "Roaming Virus")
+
+        self.engine.tick(ENTITY_KINDS["roaming_virus"])
+        self.engine.sync_play(self.world.rooms['a'])
+        self.assertEqual(self.world.rooms['a'].play, [npc])
+
+    @unittest.skipIf(entities_module.np is None, "needs NumPy (pip install computerquest[fast])")
+    def test_numpy_matches_loop(self):
+        """Test the NumPy tick keeps agents on the same schedule as the pure-Python loop"""
+        with patch.object(entities_module, 'np', None):
+            plain = EntityEngine(self.world, seed=1)
+            plain.spawn("helper_daemon", 'a', 20)
+            plain.spawn("roaming_virus", 'c', 20)
+            plain.tick(50)
+            timers = list(plain.timer)
+            count = len(plain)
+        self.engine.spawn("helper_daemon", 'a', 20)
+        self.engine.spawn("roaming_virus", 'c', 20)
+        self.engine.tick(50)
+
+        self.assertIsInstance(self.engine.location, entities_module.np.ndarray)
+        self.assertEqual([int(timer) for timer in self.engine.timer], timers)
+        self.assertEqual(len(self.engine), count)
+        self.assertEqual(sum(len(self.engine.at(key)) for key in 'abcd'), count)
+
+if __name__ == "__main__":
+    unittest.main()
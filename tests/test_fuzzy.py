@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the fuzzy matching index
+"""
+
+import unittest
+from computerquest.utils.fuzzy import edit_distance, BKTree, FuzzyIndex
+
+class TestFuzzy(unittest.TestCase):
+    """Test cases for edit distance, BKTree and FuzzyIndex"""
+
+    def test_edit_distance(self):
+        """Test Levenshtein distance"""
+        self.assertEqual(edit_distance("look", "look"), 0)
+        self.assertEqual(edit_distance("antivirs_tool", "antivirus_tool"), 1)
+        self.assertEqual(edit_distance("kitten", "sitting"), 3)
+        self.assertEqual(edit_distance("", "map"), 3)
+
+    def test_bk_tree_search(self):
+        """Test BK-tree search returns everything within range, nearest first"""
+        words = ["look", "load", "book", "cook", "scan", "quarantine"]
+        tree = BKTree(words)
+        self.assertEqual(tree.search("lok", 1), [(1, "look")])
+        expected = sorted((edit_distance("loak", w), w) for w in words if edit_distance("loak", w) <= 2)
+        self.assertEqual(tree.search("loak", 2), expected)
+
+    def test_suggest_with_candidates(self):
+        """Test suggestions are limited to the live candidates"""
+        index = FuzzyIndex(["antivirus_tool", "decoder_tool"])
+        self.assertEqual(index.suggest("antivirs_tool"), ["antivirus_tool"])
+        self.assertEqual(index.suggest("antivirs_tool", ["decoder_tool"]), [])
+        # Unseen candidates are indexed on the fly
+        self.assertEqual(index.suggest("new_iten", ["new_item"]), ["new_item"])
+
+    def test_correct(self):
+        """Test correction only happens for a clear winner"""
+        index = FuzzyIndex(["desk", "disk", "document"])
+        self.assertEqual(index.correct("documnt"), "document")
+        self.assertIsNone(index.correct("dusk"))  # desk and disk tie
+        self.assertIsNone(index.correct("dk"))    # Too short to correct
+
+if __name__ == '__main__':
+    unittest.main()
@@ -30,6 +30,7 @@ class TestGame(unittest.TestCase):
             
             # Create mock map
             self.game.game_map = MagicMock()
+            self.game.game_map.world_name = "default"
             self.game.game_map.rooms = {
                 "room1": Component(name="Room 1", description="First room"),
                 "room2": Component(name="Room 2", description="Second room"),
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the procedural world generator
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+from computerquest.config import CACHE_DIR_ENV, ENTITY_KINDS
+from computerquest.game import Game
+from computerquest.world.generator import (GeneratedArchitecture, MachineSpec, component_count,
+                                          generate_world_data, spec_for_size)
+
+OPPOSITE = {'u': 'd', 'd': 'u', 'e': 'w', 'w': 'e'}
+
+class TestGenerator(unittest.TestCase):
+    """Test cases for generated worlds"""
+
+    def setUp(self):
+        """Build a small generated world"""
+        self.spec = MachineSpec(sockets=2, cores=3, seed=7)
+        self.world = GeneratedArchitecture(self.spec)
+        self.world.setup()
+
+    def test_component_count(self):
+        """Test the world has exactly the predicted number of components"""
+        self.assertEqual(len(self.world.rooms), component_count(self.spec))
+
+    def test_bidirectional(self):
+        """Test every door has a matching door back"""
+        for key, room in self.world.rooms.items():
+            for direction, other in room.doors.items():
+                self.assertIs(other.doors[OPPOSITE[direction]], room, f"{key} {direction}")
+
+    def test_connected(self):
+        """Test every component is reachable from the start"""
+        seen = {id(self.world.player.location)}
+        stack = [self.world.player.location]
+        while stack:
+            for other in stack.pop().doors.values():
+                if id(other) not in seen:
+                    seen.add(id(other))
+                    stack.append(other)
+        self.assertEqual(len(seen), len(self.world.rooms))
+
+    def test_viruses(self):
+        """Test viruses are placed in fitting components, deterministically"""
+        data = generate_world_data(self.spec)
+        self.assertEqual(data.viruses, self.world.data.viruses)
+        locations = dict(data.viruses)
+        self.assertEqual(locations['firmware_virus'], 'bios')
+        self.assertIn('_dimm', locations['memory_resident_virus'])
+        self.assertIn('firmware_virus', self.world.rooms['bios'].items)
+
+    def test_spec_for_size(self):
+        """Test scaled specs reach the requested size"""
+        spec = spec_for_size(5000)
+        self.assertGreaterEqual(component_count(spec), 5000)
+        self.assertLess(component_count(spec._replace(sockets=spec.sockets - 1)), 5000)
+
+    def test_game(self):
+        """Test a game can be played in a generated world"""
+        with contextlib.redirect_stdout(io.StringIO()):
+            game = Game(self.world)
+        self.assertIs(game.game_map, self.world)
+        self.assertIs(game.player.knowledge_table, self.world.knowledge)
+        self.assertEqual(len(self.world.knowledge), len(self.world.rooms))
+        self.assertEqual(game.player.location, self.world.rooms['motherboard'])
+        str(game.move('d'))
+        self.assertEqual(game.player.location, self.world.rooms['pch'])
+        self.assertEqual(game.progress.visited_count, 1)
+        self.assertEqual(self.world.world_name, "generated")
+        self.assertIn("No map is available", game.display_map())
+
+    def test_game_with_agents(self):
+        """Test agents spawned at game start move each turn and are reported on arrival"""
+        with contextlib.redirect_stdout(io.StringIO()):
+            game = Game(self.world, agents=2)
+        self.assertEqual(len(game.entities), 2 * len(ENTITY_KINDS))
+        ticks = game.entities.ticks
+        result = str(game.move('d'))
+        self.assertEqual(game.entities.ticks, ticks + 1)
+        pch = self.world.rooms['pch']
+        self.assertEqual(len(pch.play), len(game.entities.at('pch')))
+        self.assertIn(game.describe_encounter(pch), result)
+        for index in game.entities.at('pch'):
+            game.entities.remove(index)
+        game.entities.spawn("security_scanner", 'pch', 2)
+        game.entities.spawn("roaming_virus", 'pch')
+        game.entities.sync_play(pch)
+        self.assertEqual(game.describe_encounter(pch), "You encounter 2 Security Scanners and a Roaming Virus.")
+
+    def test_game_with_spread(self):
+        """Test infection spreads from the viruses once per turn when enabled"""
+        with contextlib.redirect_stdout(io.StringIO()):
+            game = Game(self.world, spread=True)
+            self.assertIsNone(Game(self.world).spread)
+        str(game.move('d'))
+        self.assertEqual(game.spread.turns, 1)
+        infected = [key for key, room in self.world.rooms.items() if room.viruses]
+        self.assertGreaterEqual(game.spread.infected_count(), len(infected))
+        self.assertEqual(game.spread.level(infected[0]), 1.0)
+        self.assertTrue(self.world.rooms[infected[0]].error_state)
+
+    def test_snapshot(self):
+        """Test a deep generated world survives a snapshot round trip"""
+        cache = tempfile.mkdtemp()
+        try:
+            with patch.dict(os.environ, {CACHE_DIR_ENV: cache}):
+                # A long row of DIMMs makes the door graph deeper than the recursion limit
+                spec = MachineSpec(dimms_per_channel=3000)
+                world = GeneratedArchitecture(spec)
+                world.setup()
+                self.assertTrue(world.save_snapshot())
+
+                loaded = GeneratedArchitecture(spec)
+                self.assertTrue(loaded.load_snapshot())
+        finally:
+            shutil.rmtree(cache)
+
+        self.assertEqual(len(loaded.rooms), len(world.rooms))
+        dimm = loaded.rooms['s0_ch0_dimm1']
+        self.assertIs(dimm.doors['w'], loaded.rooms['s0_ch0_dimm0'])
+        self.assertIs(loaded.player.location, loaded.rooms['motherboard'])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the component graph analytics
+"""
+
+import unittest
+from unittest.mock import patch
+from computerquest.models.component import Component, link
+from computerquest.world import graph as graph_module
+from computerquest.world.architecture import ComputerArchitecture
+from computerquest.world.graph import WorldGraph
+
+class TestWorldGraph(unittest.TestCase):
+    """Test cases for the WorldGraph class"""
+
+    def setUp(self):
+        """Build a small world: a - b - c - d in a line, a - x - d shortcut, and a one-way door d -> y"""
+        with patch.object(ComputerArchitecture, 'setup'):
+            self.world = ComputerArchitecture()
+        for key in ['a', 'b', 'c', 'd', 'x', 'y']:
+            self.world.rooms[key] = Component(key.upper(), "", True, key)
+        rooms = self.world.rooms
+        for first, second, there, back in [('a', 'b', 'e', 'w'), ('b', 'c', 'e', 'w'), ('c', 'd', 'e', 'w'),
+                                           ('a', 'x', 'n', 's'), ('x', 'd', 'e', 'n')]:
+            link(rooms[first], rooms[second], there, back)
+        rooms['d'].connect_to(rooms['y'], 'd')
+        self.dense = WorldGraph(self.world)
+        self.sparse = WorldGraph(self.world, dense_limit=0, cache_size=2)
+
+    def test_distances(self):
+        """Test shortest distances, including one-way doors"""
+        for graph in (self.dense, self.sparse):
+            self.assertEqual(graph.distance('a', 'd'), 2)
+            self.assertEqual(graph.distance('b', 'x'), 2)
+            self.assertEqual(graph.distance('c', 'c'), 0)
+            self.assertEqual(graph.distance('a', 'y'), 3)
+            self.assertIsNone(graph.distance('y', 'a'))
+
+    def test_next_hop_and_path(self):
+        """Test next hops and whole routes agree in both modes"""
+        for graph in (self.dense, self.sparse):
+            self.assertEqual(graph.next_hop('a', 'd'), ('n', 'x'))
+            self.assertIsNone(graph.next_hop('a', 'a'))
+            self.assertEqual(graph.path('a', 'y'), [('n', 'x'), ('e', 'd'), ('d', 'y')])
+            self.assertEqual(graph.path('b', 'b'), [])
+            self.assertIsNone(graph.path('y', 'b'))
+
+    def test_reachability_and_eccentricity(self):
+        """Test reachable sets and eccentricity"""
+        for graph in (self.dense, self.sparse):
+            self.assertEqual(graph.reachable('a'), {'a', 'b', 'c', 'd', 'x', 'y'})
+            self.assertEqual(graph.reachable('y'), {'y'})
+            self.assertEqual(graph.eccentricity('a'), 3)
+            self.assertEqual(graph.eccentricity('y'), 0)
+
+    def test_articulation_points(self):
+        """Test components whose removal disconnects the world"""
+        self.assertEqual(self.dense.articulation_points(), {'d'})
+        # Without the shortcut the whole line is fragile
+        del self.world.rooms['x']
+        self.assertEqual(self.dense.articulation_points(), {'b', 'c', 'd'})
+
+    def test_invalidation(self):
+        """Test tables are rebuilt when doors or rooms change"""
+        self.assertIsNone(self.dense.distance('y', 'a'))
+        self.world.rooms['y'].connect_to(self.world.rooms['a'], 'u')
+        self.assertEqual(self.dense.distance('y', 'a'), 1)
+
+        self.world.rooms['z'] = Component("Z", "", True, 'z')
+        self.assertEqual(self.dense.reachable('z'), {'z'})
+
+        # Doors edited directly need an explicit invalidate
+        del self.world.rooms['y'].doors['u']
+        self.dense.invalidate()
+        self.assertIsNone(self.dense.distance('y', 'a'))
+
+    def test_edge_version_per_world(self):
+        """Test doors created in another world leave this world's tables alone"""
+        self.dense.distance('a', 'd')
+        generation = self.dense.generation
+        with patch.object(ComputerArchitecture, 'setup'):
+            other = ComputerArchitecture()
+        other.rooms['p'] = Component("P", "", True, 'p')
+        other.rooms['q'] = Component("Q", "", True, 'q')
+        WorldGraph(other).refresh()
+        other.rooms['p'].connect_to(other.rooms['q'], 'n')
+        self.assertEqual(other.edge_version.value, 1)
+        self.dense.distance('a', 'd')
+        self.assertEqual(self.dense.generation, generation)
+
+    @unittest.skipIf(graph_module.np is None, "needs NumPy (pip install computerquest[fast])")
+    def test_numpy_tables(self):
+        """Test the NumPy all-pairs tables agree with the pure-Python ones"""
+        keys = list(self.world.rooms)
+        with patch.object(graph_module, 'np', None):
+            plain = WorldGraph(self.world)
+            expected = [(plain.distance(a, b), plain.next_hop(a, b)) for a in keys for b in keys]
+        self.assertEqual([(self.dense.distance(a, b), self.dense.next_hop(a, b)) for a in keys for b in keys],
+                         expected)
+        self.assertIsInstance(self.dense._dense[0], graph_module.np.ndarray)
+
+    def test_lru(self):
+        """Test sparse mode keeps only the most recent rows"""
+        for key in ['a', 'b', 'c']:
+            self.sparse.distance(key, 'd')
+        self.assertEqual(len(self.sparse._rows), 2)
+
+    def test_default_world(self):
+        """Test the built-in world's one-way components"""
+        world = ComputerArchitecture()
+        world.setup()
+        reachable = world.graph.reachable('cpu_package')
+        self.assertIn('ssd', reachable)
+        self.assertNotIn('ram_dimm4', reachable)
+        self.assertEqual(world.graph.distance('cpu_package', 'pch'), 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,7 +4,7 @@ Unit tests for helper utility functions
 """
 
 import unittest
-from computerquest.utils.helpers import prefix_match, format_box, truncate_desc, format_list
+from computerquest.utils.helpers import prefix_match, format_box, truncate_desc, format_list, LazyText
 
 class TestHelpers(unittest.TestCase):
     """Test cases for the helper utility functions"""
@@ -107,5 +107,30 @@ class TestHelpers(unittest.TestCase):
         # Test with None
         self.assertEqual(format_list(None), "")
 
+    def test_lazy_text(self):
+        """Test deferred rendering of command output"""
+        calls = []
+
+        def render(name):
+            calls.append(name)
+            return f"Moved to {name}."
+
+        text = LazyText(render, "Core 1")
+
+        # Nothing is built until the text is needed
+        self.assertFalse(text.rendered)
+        self.assertEqual(calls, [])
+
+        # Concatenation stays lazy
+        combined = text + "\nACHIEVEMENT UNLOCKED!"
+        self.assertEqual(calls, [])
+
+        # Displaying renders once and caches the result
+        self.assertEqual(str(combined), "Moved to Core 1.\nACHIEVEMENT UNLOCKED!")
+        self.assertIn("Core 1", text)
+        self.assertEqual(text.lower(), "moved to core 1.")
+        self.assertEqual(f"{text}", "Moved to Core 1.")
+        self.assertEqual(calls, ["Core 1"])
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the item registry
+"""
+
+import unittest
+from computerquest.models import item
+from computerquest.models.item import ItemRegistry, make_item
+from computerquest.world.loader import load_world_data
+
+class TestItem(unittest.TestCase):
+    """Test cases for item classification and the registry"""
+
+    def test_flags(self):
+        """Test flags are derived from the id and description"""
+        log = make_item("register_log", "Shows suspicious kernel writes.")
+        self.assertTrue(log.flags & item.LOG)
+        self.assertTrue(log.flags & item.SUSPICIOUS)
+        self.assertTrue(log.flags & item.UNUSUAL)
+        self.assertFalse(log.flags & item.VIRUS)
+        self.assertEqual(log.virus_type, "rootkit_virus")
+        self.assertEqual(log.name, "Register Log")
+
+        packet = make_item("odd_packet", "Strange traffic.")
+        self.assertTrue(packet.flags & item.PACKET)
+        self.assertTrue(packet.flags & item.ABNORMAL)
+        self.assertFalse(packet.flags & item.UNUSUAL)
+
+    def test_virus(self):
+        """Test virus file entries are viruses whatever their id"""
+        worm = make_item("worm", "Spreads.", "Worm", "virus", 4, virus=True)
+        self.assertTrue(worm.flags & item.VIRUS)
+        self.assertEqual((worm.virus_type, worm.difficulty), ("worm", 4))
+        self.assertTrue(make_item("worm_virus", "Spreads.").flags & item.VIRUS)
+
+        # Neutralized viruses and data file items are never viruses
+        quarantined = make_item("quarantined_worm_virus", "Contained.")
+        self.assertFalse(quarantined.flags & item.VIRUS)
+        self.assertEqual(quarantined.kind, "quarantined")
+        self.assertFalse(make_item("antivirus_tool", "Scans.", virus=False).flags & item.VIRUS)
+
+    def test_registry(self):
+        """Test registered items are returned and unknown ones classified once"""
+        registry = ItemRegistry()
+        worm = make_item("worm", "Spreads.", virus=True)
+        registry.add([worm])
+        self.assertIs(registry.get("worm", "Spreads."), worm)
+
+        # The same id with another description is a different item
+        self.assertFalse(registry.get("worm", "Harmless.").flags & item.VIRUS)
+        self.assertIs(registry.get("worm", "Harmless."), registry.get("worm", "Harmless."))
+        self.assertEqual(registry.get("box", {"key": "A key."}).description, "")
+        self.assertEqual(len(registry), 3)
+
+    def test_registry_bounded(self):
+        """Test items seen during play are kept in a bounded cache, world data items always"""
+        registry = ItemRegistry(cache_size=2)
+        worm = make_item("worm", "Spreads.", virus=True)
+        registry.add([worm])
+        for i in range(5):
+            registry.get(f"quarantined_{i}", "Contained.")
+        self.assertEqual(len(registry), 3)
+        self.assertIs(registry.get("worm", "Spreads."), worm)
+
+    def test_built_in_world(self):
+        """Test the built-in data classifies tools, documents and viruses"""
+        catalog = {entry.id: entry for entry in load_world_data(use_cache=False).catalog}
+        self.assertEqual(catalog["antivirus_tool"].kind, "tool")
+        self.assertEqual(catalog["rootkit_virus"].difficulty, 5)
+        viruses = {entry.id for entry in catalog.values() if entry.flags & item.VIRUS}
+        self.assertEqual(len(viruses), 5)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Unit tests for background jobs
+"""
+
+import threading
+import unittest
+from computerquest.mechanics.jobs import JobManager
+from computerquest.utils.helpers import ErrorText
+
+class TestJobManager(unittest.TestCase):
+    """Test cases for the JobManager class"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.jobs = JobManager()
+
+    def test_result_and_progress(self):
+        """Test progress lines and the result are drained once"""
+        def work(job):
+            job.report("halfway")
+            return "all done"
+
+        job = self.jobs.submit("simulate cpu", work)
+        self.assertTrue(job.wait(5))
+        lines = self.jobs.drain()
+        self.assertEqual(lines[0], "[job #1] halfway")
+        self.assertIn("simulate cpu finished", lines[1])
+        self.assertIn("all done", lines[1])
+        self.assertEqual(self.jobs.drain(), [])
+
+    def test_cancel(self):
+        """Test a running job stops at its next checkpoint"""
+        started = threading.Event()
+
+        def work(job):
+            started.set()
+            while True:
+                job.checkpoint()
+                job.done.wait(0.001)
+
+        job = self.jobs.submit("spin", work)
+        started.wait(5)
+        self.assertEqual(self.jobs.running(), [job])
+        self.assertIs(self.jobs.cancel(), job)
+        self.assertTrue(job.wait(5))
+        self.assertEqual(job.state, "cancelled")
+        self.assertEqual(self.jobs.collect(job), "Job #1 (spin) was cancelled.")
+        self.assertIsNone(self.jobs.cancel())
+
+    def test_failure(self):
+        """Test an exception inside a job becomes its result"""
+        def work(job):
+            raise ValueError("boom")
+
+        job = self.jobs.submit("broken", work)
+        job.wait(5)
+        self.assertEqual(job.state, "failed")
+        result = self.jobs.collect(job)
+        self.assertEqual(result, "broken failed: boom")
+        self.assertIsInstance(result, ErrorText)
+
+    def test_error_result_kept(self):
+        """Test an ErrorText result is not turned into a plain string"""
+        job = self.jobs.submit("fails", lambda job: ErrorText("no such simulation"))
+        job.wait(5)
+        self.assertIsInstance(self.jobs.collect(job), ErrorText)
+
+    def test_streaming(self):
+        """Test a background job's lines reach output as they are reported"""
+        shown = []
+        self.jobs.output = shown.append
+        proceed = threading.Event()
+        reported = threading.Event()
+
+        def work(job):
+            job.report("queued early")
+            proceed.wait(5)
+            job.report("halfway")
+            reported.set()
+            proceed.wait(5)
+            return "all done"
+
+        job = self.jobs.submit("simulate cpu", work)
+        self.assertTrue(self.jobs.to_background(job))
+        self.assertEqual(shown, ["[job #1] queued early"])
+        proceed.set()
+        reported.wait(5)
+        job.wait(5)
+        self.assertEqual(shown[1], "[job #1] halfway")
+        self.assertIn("all done", shown[2])
+        self.assertEqual(self.jobs.drain(), [])
+
+    def test_finished_before_background(self):
+        """Test a job that finished while waiting is collected, not streamed"""
+        shown = []
+        self.jobs.output = shown.append
+        job = self.jobs.submit("quick", lambda job: "done")
+        job.wait(5)
+        self.assertFalse(self.jobs.to_background(job))
+        self.assertEqual(self.jobs.collect(job), "done")
+        self.assertEqual(shown, [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the knowledge table
+"""
+
+import unittest
+from unittest.mock import patch
+from computerquest import config
+from computerquest.models import knowledge
+from computerquest.models.component import Component
+from computerquest.models.knowledge import KnowledgeTable, classify_component
+from computerquest.models.player import Player
+
+class TestKnowledgeTable(unittest.TestCase):
+    """Test cases for component classification and knowledge gains"""
+
+    def test_classify(self):
+        """Test names are matched against the component types in order"""
+        self.assertEqual(classify_component("L2 Cache"), ("memory", (("memory", 1),)))
+        self.assertEqual(classify_component("Network Interface"), ("network", (("networking", 1),)))
+        self.assertEqual(classify_component("BIOS Chip"), ("firmware", ()))
+        self.assertEqual(classify_component("Power Supply"), ("other", ()))
+
+    def test_table(self):
+        """Test a world's components are classified once and looked up by dense index"""
+        cache = Component("L1 Cache", "", True, "L1C")
+        ssd = Component("SSD", "", True, "SSD")
+        table = KnowledgeTable([cache, ssd])
+        self.assertEqual(table.index_of(ssd), 1)
+        with patch.object(knowledge, 'classify_component') as classify:
+            self.assertEqual(table.get(cache).type, "memory")
+            classify.assert_not_called()
+
+        # Components outside the world are classified without growing the table
+        stranger = Component("SSD", "", True, "L1C")
+        self.assertIsNone(table.index_of(stranger))
+        self.assertEqual(table.get(stranger).type, "storage")
+        self.assertEqual(len(table), 2)
+
+    def test_new_area(self):
+        """Test a new knowledge area needs only configuration"""
+        areas = dict(config.KNOWLEDGE_AREAS, power="Power Delivery")
+        types = dict(config.COMPONENT_TYPES, power=(("power", "vrm"), {"power": 2, "cpu": 1}))
+        with patch.dict(config.KNOWLEDGE_AREAS, areas), patch.dict(config.COMPONENT_TYPES, types):
+            player = Player(Component("Power Supply", "", True, "PSU-TEST"), {"antivirus_tool": "Scans."})
+            self.assertEqual(player.knowledge["power"], 0)
+            player.scan()
+            self.assertEqual(player.knowledge["power"], 2)
+            self.assertEqual(player.knowledge["cpu"], 1)
+
+if __name__ == "__main__":
+    unittest.main()
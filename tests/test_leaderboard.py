@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the leaderboard
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+from computerquest.commands import LeaderboardCommand
+from computerquest.config import LEADERBOARD_DEFAULT_PLAYER
+from computerquest.game import Game
+from computerquest.mechanics import leaderboard as leaderboard_module
+from computerquest.mechanics.leaderboard import Leaderboard, Run, get_leaderboard
+
+def make_run(score, turns=40, world="default", cohort="2026-W42", seed=None):
+    """A finished run with the given ranking fields"""
+    return Run("tester", score, turns, 3, world, seed, 120.0, cohort, 1792000000.0)
+
+class TestLeaderboard(unittest.TestCase):
+    """Test cases for recording and querying finished runs"""
+
+    def setUp(self):
+        """Open a leaderboard in a temporary directory"""
+        self.root = tempfile.mkdtemp()
+        self.board = Leaderboard(os.path.join(self.root, "scores", "leaderboard.db"), flush_interval=0.05)
+
+    def tearDown(self):
+        """Close the leaderboard and remove its directory"""
+        self.board.close()
+        shutil.rmtree(self.root)
+
+    def test_wal(self):
+        """Test the database is in WAL mode"""
+        self.assertEqual(self.board._db.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+
+    def test_top(self):
+        """Test runs rank by score, then by fewest turns, overall and filtered"""
+        self.board.record(make_run(500))
+        self.board.record(make_run(900, world="pi_board"))
+        self.board.record(make_run(700, turns=60, cohort="2026-W43"))
+        self.board.record(make_run(700, turns=30, world="generated", seed=7))
+        self.board.flush()
+
+        self.assertEqual(len(self.board), 4)
+        self.assertEqual([(run.score, run.turns) for run in self.board.top()],
+                         [(900, 40), (700, 30), (700, 60), (500, 40)])
+        self.assertEqual(self.board.top(1)[0].world, "pi_board")
+        self.assertEqual([run.score for run in self.board.top(world="default")], [700, 500])
+        self.assertEqual([run.score for run in self.board.top(cohort="2026-W43")], [700])
+        self.assertEqual(self.board.top(world="generated")[0].seed, 7)
+
+    def test_indexed(self):
+        """Test top-k queries read an index instead of sorting the table"""
+        for where in ("", " WHERE world = 'default'", " WHERE cohort = '2026-W42'"):
+            plan = self.board._db.execute(
+                f"EXPLAIN QUERY PLAN SELECT * FROM runs{where} ORDER BY score DESC, turns LIMIT 10").fetchall()
+            detail = " ".join(row[-1] for row in plan)
+            self.assertIn("USING INDEX", detail)
+            self.assertNotIn("TEMP B-TREE", detail)
+
+    def test_close_writes_pending(self):
+        """Test closing writes runs still waiting for a batch"""
+        path = self.board.path
+        board = Leaderboard(path, flush_interval=60)
+        for score in range(5):
+            board.record(make_run(score))
+        board.close()
+        self.assertEqual(len(self.board), 5)
+
+    def test_failed_batch(self):
+        """Test a run that cannot be stored is dropped without stopping the writer"""
+        bad = make_run(100)._replace(player=None)  # Violates NOT NULL
+        with contextlib.redirect_stderr(io.StringIO()) as errors:
+            self.board.record(bad)
+            self.board.flush()
+            # In one batch with a valid run, only the bad one is lost
+            self.board.record(make_run(200))
+            self.board.record(bad)
+            self.board.flush()
+        self.board.record(make_run(300))
+        self.board.flush()
+
+        self.assertTrue(self.board._writer.is_alive())
+        self.assertEqual([run.score for run in self.board.top()], [300, 200])
+        self.assertEqual(self.board.failed, 2)
+        self.assertIn("could not store 1 run(s)", errors.getvalue())
+
+    def test_shared(self):
+        """Test games share one leaderboard per database until it is closed"""
+        path = os.path.join(self.root, "shared.db")
+        board = get_leaderboard(path)
+        self.assertIs(get_leaderboard(path), board)
+        with patch.dict(os.environ, {leaderboard_module.LEADERBOARD_PATH_ENV: path}):
+            with contextlib.redirect_stdout(io.StringIO()):
+                first, second = Game(), Game()
+            self.assertIs(first.leaderboard, board)
+            self.assertIs(second.leaderboard, board)
+        board.close()
+        self.assertIsNot(get_leaderboard(path), board)
+        leaderboard_module.close_leaderboards()
+
+    def test_record_run(self):
+        """Test a finished game records its run"""
+        with contextlib.redirect_stdout(io.StringIO()):
+            game = Game()
+        game.leaderboard = self.board
+        game.turns = 25
+        game.record_run()
+        self.board.flush()
+        run = self.board.top()[0]
+        self.assertEqual((run.turns, run.world, run.seed), (25, "default", None))
+        self.assertEqual(run.score, game.progress.calculate_score())
+        self.assertGreaterEqual(run.duration, 0)
+
+    def test_record_run_without_user_name(self):
+        """Test runs are recorded under a default name when the user name is unknown"""
+        with contextlib.redirect_stdout(io.StringIO()):
+            game = Game()
+        game.leaderboard = self.board
+        with patch('getpass.getuser', side_effect=KeyError("uid not found")):
+            game.record_run()
+        self.board.flush()
+        self.assertEqual(self.board.top()[0].player, LEADERBOARD_DEFAULT_PLAYER)
+
+    def test_command(self):
+        """Test the leaderboard command lists runs and passes filters"""
+        game = MagicMock()
+        game.leaderboard = self.board
+        self.board.record(make_run(1200))
+        self.board.record(make_run(300, world="pi_board"))
+        self.board.flush()
+
+        result = LeaderboardCommand(game, []).execute()
+        self.assertIn("1,200", result)
+        self.assertLess(result.index("1,200"), result.index("300"))
+
+        result = LeaderboardCommand(game, ["world", "pi_board"]).execute()
+        self.assertNotIn("1,200", result)
+        self.assertIn("(world pi_board)", result)
+
+        result = LeaderboardCommand(game, ["cohort", "2026-w42", "1"]).execute()
+        self.assertIn("1,200", result)
+        self.assertNotIn(" 300 ", result)
+
+        self.assertIn("Usage", str(LeaderboardCommand(game, ["sideways"]).execute()))
+
+if __name__ == "__main__":
+    unittest.main()
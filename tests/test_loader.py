@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the world data loader
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+from computerquest.config import CACHE_DIR_ENV
+from computerquest.world import loader
+from computerquest.world.architecture import ComputerArchitecture
+
+COMPONENTS = {
+    "hub": {"name": "Hub", "description": "The central hub.", "id": "HUB0", "start": True,
+            "exits": {"n": "attic"}, "items": ["manual"]},
+    "attic": {"name": "Attic", "description": "Dusty rafters.", "id": "ATT0", "exits": {"s": "hub"}},
+}
+ITEMS = {
+    "manual": {"name": "Manual", "description": "How things work."},
+    "scanner": {"name": "Scanner", "description": "Finds things.", "inventory": True},
+}
+VIRUSES = {
+    "attic_virus": {"name": "Attic Virus", "description": "Lives upstairs.", "location": "attic"},
+}
+
+class TestLoader(unittest.TestCase):
+    """Test cases for loading and validating world data"""
+
+    def setUp(self):
+        """Write a small world into a private data directory"""
+        self.root = tempfile.mkdtemp()
+        self.data_dir = os.path.join(self.root, "data")
+        os.mkdir(self.data_dir)
+        self.env = patch.dict(os.environ, {CACHE_DIR_ENV: os.path.join(self.root, "cache")})
+        self.env.start()
+        # Start each test without worlds loaded by earlier ones
+        self.loaded = patch.dict(loader._loaded, clear=True)
+        self.loaded.start()
+        self.write(COMPONENTS, ITEMS, VIRUSES)
+
+    def tearDown(self):
+        """Remove the temporary directories"""
+        self.loaded.stop()
+        self.env.stop()
+        shutil.rmtree(self.root)
+
+    def write(self, components, items, viruses):
+        """Write the three data files"""
+        names = (loader.COMPONENT_FILE, loader.ITEM_FILE, loader.VIRUS_FILE)
+        for name, data in zip(names, (components, items, viruses)):
+            with open(os.path.join(self.data_dir, name), 'w') as f:
+                json.dump(data, f)
+
+    def assert_invalid(self, message, components=COMPONENTS, items=ITEMS, viruses=VIRUSES):
+        """Check that parsing fails with an error mentioning message"""
+        with self.assertRaises(loader.WorldDataError) as caught:
+            loader.parse_world_data(components, items, viruses)
+        self.assertIn(message, str(caught.exception))
+
+    def test_parse(self):
+        """Test a valid world parses into WorldData"""
+        world = loader.read_world_data(self.data_dir)
+        self.assertEqual(world.start, "hub")
+        self.assertEqual(world.inventory, ("scanner",))
+        self.assertEqual(world.viruses, (("attic_virus", "attic"),))
+        self.assertEqual(world.items["attic_virus"], "Lives upstairs.")
+        hub = world.components[0]
+        self.assertEqual(hub, ("hub", "Hub", "The central hub.", "HUB0", True, (("n", "attic"),), ("manual",)))
+        catalog = {item.id: item for item in world.catalog}
+        self.assertEqual(catalog["scanner"].kind, "item")
+        self.assertEqual(catalog["attic_virus"].kind, "virus")
+        self.assertEqual(catalog["attic_virus"].virus_type, "attic_virus")
+
+    def test_unknown_exit(self):
+        """Test exits must lead to known components"""
+        components = dict(COMPONENTS, attic=dict(COMPONENTS["attic"], exits={"s": "cellar"}))
+        self.assert_invalid("attic: exit 's' leads to unknown component 'cellar'", components)
+
+    def test_unknown_direction(self):
+        """Test exit directions must be known"""
+        components = dict(COMPONENTS, attic=dict(COMPONENTS["attic"], exits={"sideways": "hub"}))
+        self.assert_invalid("unknown direction 'sideways'", components)
+
+    def test_unknown_item(self):
+        """Test placed items must be defined"""
+        components = dict(COMPONENTS, attic=dict(COMPONENTS["attic"], items=["ghost"]))
+        self.assert_invalid("unknown item 'ghost'", components)
+
+    def test_start(self):
+        """Test exactly one component must be the start"""
+        components = dict(COMPONENTS, attic=dict(COMPONENTS["attic"], start=True))
+        self.assert_invalid("found 2", components)
+
+    def test_duplicate_id(self):
+        """Test component ids must be unique"""
+        components = dict(COMPONENTS, attic=dict(COMPONENTS["attic"], id="HUB0"))
+        self.assert_invalid("id 'HUB0' is already used by 'hub'", components)
+
+    def test_missing_field(self):
+        """Test required fields must be present"""
+        attic = {key: value for key, value in COMPONENTS["attic"].items() if key != "name"}
+        self.assert_invalid("'name' must be a non-empty string", dict(COMPONENTS, attic=attic))
+
+    def test_virus_location(self):
+        """Test viruses must be placed in known components"""
+        viruses = {"attic_virus": dict(VIRUSES["attic_virus"], location="roof")}
+        self.assert_invalid("unknown location 'roof'", viruses=viruses)
+
+    def test_invalid_json(self):
+        """Test a malformed file names the file"""
+        with open(os.path.join(self.data_dir, loader.ITEM_FILE), 'w') as f:
+            f.write("{")
+        with self.assertRaises(loader.WorldDataError) as caught:
+            loader.load_world_data(self.data_dir)
+        self.assertIn("items_data.json", str(caught.exception))
+
+    def test_cache(self):
+        """Test the compiled cache is used and refreshed when a file changes"""
+        first = loader.load_world_data(self.data_dir)
+        with patch.object(loader, 'parse_world_data') as parse:
+            self.assertEqual(loader.load_world_data(self.data_dir), first)
+            parse.assert_not_called()
+
+        self.write(COMPONENTS, dict(ITEMS, manual=dict(ITEMS["manual"], description="Read me.")), VIRUSES)
+        self.assertEqual(loader.load_world_data(self.data_dir).items["manual"], "Read me.")
+
+    def test_shared_by_content(self):
+        """Test a copy of a world elsewhere reuses the on-disk cache entry"""
+        loader.load_world_data(self.data_dir)
+        copy = os.path.join(self.root, "copy")
+        shutil.copytree(self.data_dir, copy)
+        loader._loaded.clear()
+        with patch.object(loader, 'parse_world_data') as parse:
+            self.assertEqual(loader.load_world_data(copy).start, "hub")
+            parse.assert_not_called()
+
+    def test_pack_fallback(self):
+        """Test a pack without an item file uses the built-in one"""
+        os.remove(os.path.join(self.data_dir, loader.ITEM_FILE))
+        self.assertEqual(loader.data_files(self.data_dir)[1], os.path.join(loader.DATA_DIR, loader.ITEM_FILE))
+
+    def test_world_packs(self):
+        """Test the shipped packs load, and unknown packs are rejected"""
+        packs = loader.world_packs()
+        self.assertEqual(list(packs)[0], "default")
+        for name in ("numa_server", "laptop_soc", "pi_board"):
+            world = ComputerArchitecture(data_dir=loader.pack_dir(name))
+            world.setup()
+            for virus_id, location in loader.load_world_data(packs[name]).viruses:
+                self.assertIn(virus_id, world.rooms[location].items)
+            self.assertIn("antivirus_tool", world.player.items)
+        with self.assertRaises(loader.WorldDataError):
+            loader.pack_dir("mainframe")
+
+    def test_architecture(self):
+        """Test a custom world builds through ComputerArchitecture"""
+        world = ComputerArchitecture(data_dir=self.data_dir)
+        world.setup()
+        self.assertEqual(world.player.location, world.rooms["hub"])
+        self.assertIs(world.rooms["hub"].doors["n"], world.rooms["attic"])
+        self.assertIn("attic_virus", world.rooms["attic"].items)
+        self.assertEqual(world.player.items, {"scanner": "Finds things."})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Unit tests for command latency instrumentation
+"""
+
+import unittest
+from computerquest.utils.perf import bucket_index, bucket_bounds, LatencyHistogram, PerfRecorder
+
+class TestPerf(unittest.TestCase):
+    """Test cases for LatencyHistogram and PerfRecorder"""
+
+    def test_buckets(self):
+        """Test every duration falls inside its bucket's bounds"""
+        for ns in list(range(0, 300)) + [1000, 12345, 999999, 10**9 + 7]:
+            low, high = bucket_bounds(bucket_index(ns))
+            self.assertLessEqual(low, ns)
+            self.assertGreaterEqual(high, ns)
+
+    def test_percentiles(self):
+        """Test percentiles are within bucket precision"""
+        histogram = LatencyHistogram()
+        for ns in range(1000, 101000, 1000):
+            histogram.record(ns)
+
+        self.assertEqual(histogram.count, 100)
+        self.assertEqual(histogram.max, 100000)
+        self.assertAlmostEqual(histogram.percentile(50), 50000, delta=50000 * 0.07)
+        self.assertAlmostEqual(histogram.percentile(99), 99000, delta=99000 * 0.07)
+        self.assertEqual(LatencyHistogram().percentile(50), 0)
+
+    def test_recorder(self):
+        """Test measured calls return their result and show up in the report"""
+        perf = PerfRecorder()
+        self.assertEqual(perf.measure("LookCommand", lambda: "result"), "result")
+        self.assertEqual(perf.histograms["LookCommand"].count, 1)
+        self.assertIn("LookCommand", perf.report())
+
+        perf.reset()
+        self.assertEqual(perf.report(), "No commands timed yet.")
+
+    def test_recorder_allocations(self):
+        """Test tracemalloc sampling records peak allocations"""
+        import tracemalloc
+
+        was_tracing = tracemalloc.is_tracing()
+        perf = PerfRecorder(sample_allocations=1)
+        try:
+            perf.measure("MapCommand", lambda: [0] * 100000)
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+        samples, total, largest = perf.allocations["MapCommand"]
+        self.assertEqual(samples, 1)
+        self.assertGreaterEqual(largest, 100000 * 8)
+        self.assertIn("Peak allocation", perf.report())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -60,8 +60,8 @@ class TestPlayer(unittest.TestCase):
         self.assertFalse(self.player.death)
         
         # Test default collections
-        self.assertEqual(self.player.found_viruses, [])
-        self.assertEqual(self.player.quarantined_viruses, [])
+        self.assertEqual(self.player.found_viruses, set())
+        self.assertEqual(self.player.quarantined_viruses, set())
         
         # Test knowledge areas
         self.assertEqual(self.player.knowledge["cpu"], 0)
@@ -184,6 +184,25 @@ class TestPlayer(unittest.TestCase):
         not_found = self.player.drop("nonexistent_item")
         self.assertIn("don't have", not_found.lower())
     
+    def test_virus_index(self):
+        """Test the virus index follows viruses through take, drop and quarantine"""
+        self.start_component.add_items({"boot_sector_virus": "A dangerous virus"})
+        self.assertIn("boot_sector_virus", self.start_component.viruses)
+
+        self.player.take("boot_sector_virus")
+        self.assertNotIn("boot_sector_virus", self.start_component.viruses)
+        self.assertIn("boot_sector_virus", self.player.viruses)
+
+        self.player.drop("boot_sector_virus")
+        self.assertIn("boot_sector_virus", self.start_component.viruses)
+        self.assertNotIn("boot_sector_virus", self.player.viruses)
+
+        self.player.scan("boot_sector_virus")
+        self.player.quarantine("boot_sector_virus")
+        self.assertNotIn("boot_sector_virus", self.start_component.viruses)
+        self.assertIn("quarantined_boot_sector_virus", self.start_component.items)
+        self.assertEqual(self.player.quarantined_viruses, {"boot_sector_virus"})
+    
     def test_scan(self):
         """Test scanning for viruses"""
         # Basic scan with no viruses
@@ -262,7 +281,7 @@ class TestPlayer(unittest.TestCase):
         """Test quarantining viruses"""
         # Add a virus to found_viruses and the room
         virus_name = "test_virus"
-        self.player.found_viruses.append(virus_name)
+        self.player.found_viruses.add(virus_name)
         self.player.location.add_items({virus_name: "A test virus"})
         
         # Quarantine the virus
@@ -284,7 +303,7 @@ class TestPlayer(unittest.TestCase):
         
         # Test quarantine without antivirus tool
         player_without_tool = Player(location=self.start_component)
-        player_without_tool.found_viruses.append("another_virus")
+        player_without_tool.found_viruses.add("another_virus")
         
         no_tool_result = player_without_tool.quarantine("another_virus")
         self.assertIn("need an antivirus tool", no_tool_result.lower())
@@ -211,6 +211,26 @@ class TestProgressSystem(unittest.TestCase):
         efficient = next((a for a in newly_unlocked if a.id == "efficient"), None)
         self.assertIsNotNone(efficient)
     
+    def test_dependencies(self):
+        """Test only achievements whose metrics changed are re-evaluated"""
+        self.progress.update()
+        explorer = next(a for a in self.progress.achievements if a.id == "explorer")
+        first_virus = next(a for a in self.progress.achievements if a.id == "first_virus")
+        explorer.condition_fn = MagicMock(return_value=False)
+        first_virus.condition_fn = MagicMock(return_value=False)
+        
+        # Nothing changed: nothing is checked
+        self.progress.update()
+        explorer.condition_fn.assert_not_called()
+        first_virus.condition_fn.assert_not_called()
+        
+        # A visit checks the exploration achievements only
+        self.room2.visited = True
+        self.progress.update()
+        explorer.condition_fn.assert_called_once()
+        first_virus.condition_fn.assert_not_called()
+        self.assertEqual(self.progress.exploration_progress, 66)
+    
     def test_apply_reward(self):
         """Test applying achievement rewards"""
         # Test item reward
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Unit tests for shortest-path routing
+"""
+
+import unittest
+from unittest.mock import patch
+from computerquest.models.component import Component
+from computerquest.world.architecture import ComputerArchitecture
+from computerquest.world.routing import Router
+
+class TestRouter(unittest.TestCase):
+    """Test cases for the Router class"""
+
+    def setUp(self):
+        """Build a small world: a - b - c - d in a line, plus a shortcut a - d through x"""
+        with patch.object(ComputerArchitecture, 'setup'):
+            self.world = ComputerArchitecture()
+        for key in ['a', 'b', 'c', 'd', 'x']:
+            self.world.rooms[key] = Component(key.upper(), "", True, key)
+            self.world.rooms[key].visited = True
+        rooms = self.world.rooms
+        for first, second, there, back in [('a', 'b', 'e', 'w'), ('b', 'c', 'e', 'w'), ('c', 'd', 'e', 'w'),
+                                           ('a', 'x', 'n', 's'), ('x', 'd', 'e', 'n')]:
+            rooms[first].connect_to(rooms[second], there)
+            rooms[second].connect_to(rooms[first], back)
+        self.router = Router(self.world)
+
+    def test_shortest_route(self):
+        """Test the shortest route is found"""
+        self.assertEqual(self.router.route('a', 'd'), [('n', 'x'), ('e', 'd')])
+        self.assertEqual(self.router.route('d', 'a'), [('n', 'x'), ('s', 'a')])
+        self.assertEqual(self.router.route('b', 'b'), [])
+
+    def test_unvisited_components_are_avoided(self):
+        """Test routes only pass through visited components"""
+        self.world.rooms['x'].visited = False
+        self.router.invalidate()
+        self.assertEqual([key for _, key in self.router.route('a', 'd')], ['b', 'c', 'd'])
+
+        # An unvisited starting point can still leave
+        self.assertEqual(self.router.route('x', 'a'), [('s', 'a')])
+
+    def test_no_route(self):
+        """Test unreachable destinations return None"""
+        self.world.rooms['b'].visited = False
+        self.world.rooms['x'].visited = False
+        self.router.invalidate()
+        self.assertIsNone(self.router.route('a', 'd'))
+
+    def test_tables_are_cached(self):
+        """Test next-hop tables are reused until invalidated"""
+        table = self.router.next_hops('d')
+        self.assertIs(self.router.next_hops('d'), table)
+        self.router.invalidate()
+        self.assertIsNot(self.router.next_hops('d'), table)
+
+    def test_key_of(self):
+        """Test the reverse component index"""
+        self.assertEqual(self.world.key_of(self.world.rooms['c']), 'c')
+        self.assertIsNone(self.world.key_of(Component("Stray")))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the world snapshot cache
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+from computerquest.config import CACHE_DIR_ENV
+from computerquest.models.component import Component
+from computerquest.world import snapshot
+from computerquest.world.architecture import ComputerArchitecture
+
+class TestSnapshot(unittest.TestCase):
+    """Test cases for the snapshot cache"""
+
+    def setUp(self):
+        """Set up a private cache directory and a fake source file"""
+        self.cache = tempfile.mkdtemp()
+        self.env = patch.dict(os.environ, {CACHE_DIR_ENV: self.cache})
+        self.env.start()
+        self.source = os.path.join(self.cache, "world.py")
+        with open(self.source, 'w') as f:
+            f.write("ROOMS = 1\n")
+
+    def tearDown(self):
+        """Remove the cache directory"""
+        self.env.stop()
+        shutil.rmtree(self.cache)
+
+    def test_round_trip(self):
+        """Test a saved snapshot loads back"""
+        self.assertTrue(snapshot.save_snapshot("test", [self.source], {"rooms": [1, 2]}))
+        self.assertEqual(snapshot.load_snapshot("test", [self.source]), {"rooms": [1, 2]})
+
+    def test_missing(self):
+        """Test a missing snapshot loads as None"""
+        self.assertIsNone(snapshot.load_snapshot("absent", [self.source]))
+
+    def test_stale_source(self):
+        """Test a changed source file invalidates the snapshot"""
+        snapshot.save_snapshot("test", [self.source], "old")
+        with open(self.source, 'w') as f:
+            f.write("ROOMS = 22\n")
+        self.assertIsNone(snapshot.load_snapshot("test", [self.source]))
+
+    def test_touched_source(self):
+        """Test a touched but unchanged source keeps the snapshot"""
+        snapshot.save_snapshot("test", [self.source], "kept")
+        info = os.stat(self.source)
+        os.utime(self.source, ns=(info.st_atime_ns, info.st_mtime_ns + 10**9))
+        self.assertEqual(snapshot.load_snapshot("test", [self.source]), "kept")
+
+        # The new signature is stored, so the next load does not hash again
+        with patch.object(snapshot, 'content_hash') as content_hash:
+            self.assertEqual(snapshot.load_snapshot("test", [self.source]), "kept")
+            content_hash.assert_not_called()
+
+    def test_eviction(self):
+        """Test stale files go first, then the least recently used over the size limit"""
+        now = time.time()
+        ages = {"old": 40 * 86400, "used": 3000, "recent": 2000, "newest": 1000}
+        for name, age in ages.items():
+            path = os.path.join(self.cache, f"{name}.snapshot")
+            with open(path, 'wb') as f:
+                f.write(b"x" * 100)
+            os.utime(path, (now - age, now - age))
+        os.utime(self.source, (now, now))
+
+        snapshot.evict_cache(keep=os.path.join(self.cache, "newest.snapshot"), max_bytes=250,
+                             max_age=30 * 86400)
+        self.assertEqual(sorted(os.listdir(self.cache)), ["newest.snapshot", "recent.snapshot", "world.py"])
+
+    def test_load_marks_used(self):
+        """Test loading a snapshot protects it from eviction as recently used"""
+        snapshot.save_snapshot("test", [self.source], "kept")
+        path = snapshot.snapshot_path("test")
+        os.utime(path, (0, 0))
+        snapshot.load_snapshot("test", [self.source])
+        self.assertGreater(os.stat(path).st_mtime, 0)
+
+    def test_corrupt(self):
+        """Test a corrupt snapshot loads as None"""
+        with open(snapshot.snapshot_path("test"), 'wb') as f:
+            f.write(snapshot.MAGIC + b"garbage")
+        self.assertIsNone(snapshot.load_snapshot("test", [self.source]))
+
+    def test_slotted_nodes(self):
+        """Test nodes with __slots__ round-trip without object.__getstate__ (Python < 3.11)"""
+        rooms = {key: Component(key.title(), f"The {key}.", True, key.upper()) for key in ("hall", "attic")}
+        rooms["hall"].connect_to(rooms["attic"], 'u')
+        rooms["attic"].connect_to(rooms["hall"], 'd')
+        rooms["attic"].set_specs(1, ["binary"], 5, 6, 7)
+
+        state, slots = snapshot._node_state(rooms["attic"])
+        self.assertIsNone(state)
+        self.assertEqual(slots["name"], "Attic")
+
+        self.assertTrue(snapshot.save_snapshot("nodes", [self.source], rooms, nodes=rooms))
+        loaded = snapshot.load_snapshot("nodes", [self.source])
+        self.assertIs(loaded["hall"].doors['u'], loaded["attic"])
+        self.assertEqual(loaded["attic"].performance["reliability"], 7)
+
+    def test_architecture_cache(self):
+        """Test a cached world matches a freshly built one"""
+        ComputerArchitecture(use_cache=True).setup()
+
+        with patch.object(ComputerArchitecture, 'make_components') as make:
+            cached = ComputerArchitecture(use_cache=True)
+            cached.setup()
+            make.assert_not_called()
+
+        built = ComputerArchitecture()
+        built.setup()
+        self.assertEqual(sorted(cached.rooms), sorted(built.rooms))
+        self.assertIs(cached.player.location, cached.rooms["cpu_package"])
+        self.assertEqual(cached.rooms["core1"].doors.keys(), built.rooms["core1"].doors.keys())
+
+if __name__ == '__main__':
+    unittest.main()
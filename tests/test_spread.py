@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the virus spread simulation
+"""
+
+import unittest
+from unittest.mock import patch
+from computerquest.mechanics import spread as spread_module
+from computerquest.mechanics.spread import SpreadModel, transmission
+from computerquest.models.component import Component, link
+from computerquest.world.architecture import ComputerArchitecture
+
+class TestSpreadModel(unittest.TestCase):
+    """Test cases for the SpreadModel class"""
+
+    def setUp(self):
+        """Build a line a - b - c - d with a virus in a"""
+        with patch.object(ComputerArchitecture, 'setup'):
+            self.world = ComputerArchitecture()
+        for key in ['a', 'b', 'c', 'd']:
+            self.world.rooms[key] = Component(key.upper(), key.upper() + " room.", True, key)
+        rooms = self.world.rooms
+        for first, second in [('a', 'b'), ('b', 'c'), ('c', 'd')]:
+            link(rooms[first], rooms[second], 'e', 'w')
+        rooms['a'].add_items({"boot_sector_virus": "A virus."})
+        self.model = SpreadModel(self.world, base_rate=0.2, recovery=0.0, threshold=0.5)
+
+    def test_transmission(self):
+        """Test secure, reliable components are harder to infect"""
+        room = self.world.rooms['b']
+        self.assertAlmostEqual(transmission(room, 0.2), 0.2)
+        room.set_specs(security=3, reliability=10)
+        self.assertAlmostEqual(transmission(room, 0.2), 0.2 * 0.25 * 0.5)
+
+    def test_spread(self):
+        """Test infection moves outwards from the virus"""
+        self.model.step()
+        self.assertEqual(self.model.level('a'), 1.0)
+        self.assertAlmostEqual(self.model.level('b'), 0.2)
+        self.assertEqual(self.model.level('c'), 0.0)
+
+        self.model.step(20)
+        levels = [self.model.level(key) for key in 'abcd']
+        self.assertEqual(levels, sorted(levels, reverse=True))
+        self.assertGreater(levels[3], 0.0)
+
+    def test_forecast(self):
+        """Test forecasts run ahead without changing the model"""
+        ahead = self.model.forecast(500)
+        self.assertEqual(self.model.turns, 0)
+        self.assertEqual(self.model.level('d'), 0.0)
+        self.assertGreater(ahead['d'], 0.9)
+
+    def test_apply_and_quarantine(self):
+        """Test infection shows as errors that clear once the virus is gone"""
+        model = SpreadModel(self.world, base_rate=0.2, recovery=0.5, threshold=0.1)
+        model.step(10)
+        model.apply()
+        self.assertIn("Virus activity", self.world.rooms['b'].desc)
+        self.assertIsNone(self.world.rooms['d'].error_state)
+
+        self.world.rooms['a'].remove_item("boot_sector_virus")
+        model.reseed()
+        model.step(20)
+        model.apply()
+        self.assertIsNone(self.world.rooms['b'].error_state)
+
+    @unittest.skipIf(spread_module.np is None, "needs NumPy (pip install computerquest[fast])")
+    def test_numpy_matches_python(self):
+        """Test the SciPy matrix and NumPy bincount steps agree with the pure-Python loop"""
+        self.world.rooms['c'].set_specs(security=2, reliability=6)
+        with patch.object(spread_module, 'np', None):
+            expected = SpreadModel(self.world, base_rate=0.2, recovery=0.1).forecast(30)
+        with patch.object(spread_module, 'sparse', None):
+            bincount = SpreadModel(self.world, base_rate=0.2, recovery=0.1).forecast(30)
+        matrix = SpreadModel(self.world, base_rate=0.2, recovery=0.1).forecast(30)
+        for key, level in expected.items():
+            self.assertAlmostEqual(bincount[key], level)
+            self.assertAlmostEqual(matrix[key], level)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Startup budget tests
+
+Uses python -X importtime in a fresh interpreter to make sure heavy
+modules stay deferred and importing the game stays within budget.
+"""
+
+import unittest
+from benchmarks.bench_startup import DEFERRED_MODULES, measure_imports
+from computerquest.config import STARTUP_IMPORT_BUDGET_MS
+
+class TestStartup(unittest.TestCase):
+    """Test cases for cold-start cost"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Import the game once in a fresh interpreter"""
+        cls.timings = measure_imports('computerquest.game')
+
+    def test_deferred_modules_not_imported(self):
+        """Test heavy modules are loaded on first use only"""
+        for module in DEFERRED_MODULES + ['readline']:
+            self.assertNotIn(module, self.timings)
+
+    def test_import_budget(self):
+        """Test importing the game stays within the startup budget"""
+        self.assertLessEqual(self.timings['computerquest.game'] / 1000, STARTUP_IMPORT_BUDGET_MS)
+
+    def test_lazy_attributes(self):
+        """Test lazily imported classes are still reachable from computerquest.game"""
+        import computerquest.game as game_module
+        from computerquest.mechanics.minigames.cpu_pipeline import CPUPipelineMinigame
+        from computerquest.utils.visualizer import ComponentVisualizer
+
+        self.assertIs(game_module.CPUPipelineMinigame, CPUPipelineMinigame)
+        self.assertIs(game_module.ComponentVisualizer, ComponentVisualizer)
+        with self.assertRaises(AttributeError):
+            game_module.NoSuchThing
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the memory-mapped text store
+"""
+
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+from computerquest.config import CACHE_DIR_ENV
+from computerquest.models.component import Component
+from computerquest.world.textstore import TextStore, text_store_for, write_text_store
+
+TEXTS = ["The CPU package.", "", "Caché línea — ünïcode", "x" * 5000]
+
+class TestTextStore(unittest.TestCase):
+    """Test cases for the TextStore class"""
+
+    def setUp(self):
+        """Use a private cache directory"""
+        self.cache = tempfile.mkdtemp()
+        self.env = patch.dict(os.environ, {CACHE_DIR_ENV: self.cache})
+        self.env.start()
+        self.path = os.path.join(self.cache, "test.store")
+        write_text_store(self.path, TEXTS)
+
+    def tearDown(self):
+        """Remove the cache directory"""
+        self.env.stop()
+        shutil.rmtree(self.cache)
+
+    def test_round_trip(self):
+        """Test every text reads back unchanged"""
+        store = TextStore(self.path)
+        self.assertEqual(len(store), len(TEXTS))
+        self.assertEqual([store.get(i) for i in range(len(TEXTS))], TEXTS)
+        with self.assertRaises(IndexError):
+            store.get(len(TEXTS))
+        store.close()
+
+    def test_lru(self):
+        """Test only the most recently used texts stay decoded"""
+        store = TextStore(self.path, cache_size=2)
+        for i in (0, 1, 0, 2):
+            store.get(i)
+        self.assertEqual(list(store._cache), [0, 2])
+        store.clear_cache()
+        self.assertEqual(list(store._cache), [])
+        self.assertEqual(store.get(1), TEXTS[1])
+        store.close()
+
+    def test_pickle(self):
+        """Test a pickled store maps its file again"""
+        store = pickle.loads(pickle.dumps(TextStore(self.path)))
+        self.assertEqual(store.get(2), TEXTS[2])
+
+    def test_not_a_store(self):
+        """Test other files are rejected"""
+        with open(self.path, 'wb') as f:
+            f.write(b"not a text store")
+        with self.assertRaises(ValueError):
+            TextStore(self.path)
+
+    def test_shared_by_content(self):
+        """Test identical texts share one store file"""
+        first = text_store_for(TEXTS)
+        second = text_store_for(list(TEXTS))
+        self.assertEqual(first.path, second.path)
+        self.assertNotEqual(text_store_for(TEXTS[:2]).path, first.path)
+
+    def test_component(self):
+        """Test components read descriptions from a store, with overlays kept apart"""
+        store = text_store_for(TEXTS)
+        comp = Component("CPU", "", True, "CPU0")
+        comp.use_text_store(store, 0)
+        self.assertEqual(comp.desc1, "The CPU package.")
+        self.assertEqual(comp.desc, "The CPU package.")
+
+        comp.error("Overheating")
+        self.assertEqual(comp.desc, "ERROR: Overheating\n\nThe CPU package.")
+        self.assertEqual(comp.desc1, "The CPU package.")
+        comp.repair()
+        self.assertEqual(comp.desc, "The CPU package.")
+
+    def test_large_world(self):
+        """Test large worlds keep their descriptions in a store"""
+        from computerquest.world.generator import GeneratedArchitecture
+
+        with patch('computerquest.world.architecture.TEXT_STORE_MIN_COMPONENTS', 10):
+            world = GeneratedArchitecture()
+            world.setup()
+        bios = world.rooms['bios']
+        self.assertIsNotNone(bios.text_store)
+        self.assertIn("firmware", bios.desc)
+
+if __name__ == "__main__":
+    unittest.main()
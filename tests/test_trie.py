@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the command name trie
+"""
+
+import unittest
+from computerquest.utils.trie import CommandTrie, EXACT, TYPO, PREFIX, AMBIGUOUS, UNKNOWN
+
+class TestCommandTrie(unittest.TestCase):
+    """Test cases for the CommandTrie class"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.trie = CommandTrie(
+            ['look', 'load', 'location', 'north', 'n', 'quarantine'],
+            {'lok': 'look', 'nort': 'north'}
+        )
+
+    def test_exact(self):
+        """Test exact names and single-letter aliases"""
+        self.assertEqual(self.trie.resolve('look'), ('look', EXACT, ()))
+        self.assertEqual(self.trie.resolve('n'), ('n', EXACT, ()))
+
+    def test_typo(self):
+        """Test known typos resolve to their correction"""
+        self.assertEqual(self.trie.resolve('lok'), ('look', TYPO, ()))
+        self.assertEqual(self.trie.resolve('nort'), ('north', TYPO, ()))
+
+    def test_prefix(self):
+        """Test unique prefixes resolve to the full name"""
+        self.assertEqual(self.trie.resolve('quar'), ('quarantine', PREFIX, ()))
+        self.assertEqual(self.trie.resolve('loc'), ('location', PREFIX, ()))
+
+    def test_ambiguous(self):
+        """Test ambiguous prefixes report their candidates"""
+        resolution = self.trie.resolve('lo')
+        self.assertEqual(resolution.name, 'lo')
+        self.assertEqual(resolution.kind, AMBIGUOUS)
+        self.assertEqual(resolution.candidates, ('load', 'location', 'look'))
+
+    def test_unknown(self):
+        """Test unknown words and short prefixes are returned unchanged"""
+        self.assertEqual(self.trie.resolve('xyz'), ('xyz', UNKNOWN, ()))
+        self.assertEqual(self.trie.resolve('q'), ('q', UNKNOWN, ()))
+        # Typos are not counted as names for prefix matching
+        self.assertEqual(self.trie.resolve('no').kind, PREFIX)
+
+if __name__ == '__main__':
+    unittest.main()